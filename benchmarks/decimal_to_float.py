@@ -0,0 +1,89 @@
+"""
+Benchmark of the Decimal to float conversion of incoming items.
+
+Compares the former recursive object_with_decimal_to_float (copied below) with
+the iterative type dispatching one on query pages of about 1 MB.
+Run from the repository root: `PYTHONPATH=. python benchmarks/decimal_to_float.py`
+"""
+
+from copy import deepcopy
+from decimal import Decimal
+from timeit import repeat
+
+from dynamo_db_resource._number_types_in_objects import object_with_decimal_to_float
+
+NUMBER = 5
+
+
+def _former_object_with_decimal_to_float(data):
+    def to_basic(vi):
+        if isinstance(vi, Decimal):
+            if vi % 1 == 0:
+                return int(vi)
+            return float(vi)
+        return vi
+
+    if isinstance(data, (list, tuple)):
+        data = [_former_object_with_decimal_to_float(i) for i in data]
+    elif isinstance(data, float):
+        return to_basic(data)
+    elif isinstance(data, dict):
+        for k, v in data.items():
+            if isinstance(v, dict):
+                _former_object_with_decimal_to_float(v)
+            elif isinstance(v, (list, tuple)):
+                data[k] = [
+                    _former_object_with_decimal_to_float(x)
+                    if isinstance(x, dict)
+                    else to_basic(x)
+                    for x in v
+                ]
+            else:
+                data[k] = to_basic(v)
+    return data
+
+
+payloads = {
+    "time-series page (10k items)": [
+        {
+            "sensor": "sensor_1",
+            "timestamp": Decimal(1600000000 + i * 60),
+            "value": Decimal(str(round(i * 0.37, 2))),
+            "quality": {"flag": "ok", "confidence": Decimal("0.95")},
+        }
+        for i in range(10000)
+    ],
+    "numeric column (50k values)": {
+        "sensor": "sensor_1",
+        "values": [Decimal(str(round(i * 0.11, 2))) for i in range(50000)],
+    },
+    "integer column (50k values)": {
+        "sensor": "sensor_1",
+        "counts": [Decimal(i) for i in range(50000)],
+    },
+    "strings only (10k items)": [
+        {"id": f"record_{i}", "name": f"name_{i}", "tags": ["a", "b"]}
+        for i in range(10000)
+    ],
+}
+
+
+def _per_call_milliseconds(function, payload) -> float:
+    # the conversion works in place, hence every call gets a fresh copy
+    copies = [deepcopy(payload) for _ in range(NUMBER * 5)]
+    copies.reverse()
+    return min(repeat(lambda: function(copies.pop()), number=NUMBER, repeat=5)) / (
+        NUMBER / 1e3
+    )
+
+
+def main():
+    print(f"{'payload':<32}{'recursive':>13}{'iterative':>13}")
+    for name, payload in payloads.items():
+        before = _per_call_milliseconds(_former_object_with_decimal_to_float, payload)
+        after = _per_call_milliseconds(object_with_decimal_to_float, payload)
+        print(f"{name:<32}{before:>10.2f} ms{after:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
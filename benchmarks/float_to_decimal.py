@@ -0,0 +1,60 @@
+"""
+Benchmark of the float to Decimal conversion of outgoing items.
+
+Compares the former deepcopy followed by the in-place
+object_with_float_to_decimal with the single pass
+copy_object_with_float_to_decimal on large nested items.
+Run from the repository root: `PYTHONPATH=. python benchmarks/float_to_decimal.py`
+"""
+
+from copy import deepcopy
+from timeit import repeat
+
+from dynamo_db_resource._number_types_in_objects import (
+    object_with_float_to_decimal,
+    copy_object_with_float_to_decimal,
+)
+
+NUMBER = 20
+
+
+def _nested_item(width: int, depth: int, leaf) -> dict:
+    if depth == 0:
+        return {f"attribute_{i}": leaf(i) for i in range(width)}
+    return {
+        f"level_{depth}_{i}": _nested_item(width, depth - 1, leaf)
+        for i in range(width)
+    }
+
+
+payloads = {
+    "strings only (1k leaves)": _nested_item(10, 2, lambda i: f"value_{i}"),
+    "mixed (1k leaves)": _nested_item(
+        10, 2, lambda i: i * 0.5 if i % 3 == 0 else f"value_{i}"
+    ),
+    "floats only (10k leaves)": _nested_item(10, 3, lambda i: i * 0.25),
+    "list of 1k records": {
+        "records": [
+            {"id": f"record_{i}", "value": i * 0.1, "tags": ["a", "b"]}
+            for i in range(1000)
+        ]
+    },
+}
+
+
+def _per_call_milliseconds(statement) -> float:
+    return min(repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e3
+
+
+def main():
+    print(f"{'payload':<28}{'deepcopy + convert':>20}{'copy on write':>16}")
+    for name, item in payloads.items():
+        before = _per_call_milliseconds(
+            lambda: object_with_float_to_decimal(deepcopy(item))
+        )
+        after = _per_call_milliseconds(lambda: copy_object_with_float_to_decimal(item))
+        print(f"{name:<28}{before:>17.2f} ms{after:>13.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Startup benchmark of dynamo_db_resource.
+
+Reports the `python -X importtime` numbers of the package modules in a fresh
+interpreter and the time the first data-plane call spends creating the boto3
+resource, which no longer happens at import.
+Run from the repository root: `PYTHONPATH=. python benchmarks/import_time.py`
+"""
+
+from subprocess import run
+import sys
+
+STATEMENTS = {
+    "import dynamo_db_resource": "import dynamo_db_resource",
+    "infrastructure export only": "from dynamo_db_resource.table_existence "
+    "import convert_schema_to_infrastructure_code",
+}
+
+FIRST_USE = """
+from time import perf_counter
+import dynamo_db_resource.dynamo_db_table as t
+start = perf_counter()
+t._default_resource()
+print(perf_counter() - start)
+"""
+
+
+def _import_times(statement: str) -> dict:
+    completed = run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = dict()
+    for line in completed.stderr.splitlines():
+        try:
+            self_time, cumulative_time, module = line.split(":", 1)[1].split("|")
+            times[module.strip()] = (int(self_time), int(cumulative_time))
+        except ValueError:
+            continue
+    return times
+
+
+def main():
+    for name, statement in STATEMENTS.items():
+        print(name)
+        for module, (self_time, cumulative_time) in _import_times(statement).items():
+            if module.startswith("dynamo_db_resource"):
+                print(
+                    f"  {module:<44}self {self_time / 1e3:>7.1f} ms"
+                    f"   cumulative {cumulative_time / 1e3:>7.1f} ms"
+                )
+
+    first_use = run(
+        [sys.executable, "-c", FIRST_USE], capture_output=True, text=True, check=True
+    )
+    print(f"resource creation on first use: {float(first_use.stdout) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of Table._validate_input.
+
+Compares the former dispatch, which looked up the calling function via
+inspect.stack() on every call, with the explicit validation modes.
+Run from the repository root: `PYTHONPATH=. python benchmarks/validate_input.py`
+"""
+
+from inspect import stack
+from os import environ as os_environ
+from pathlib import Path
+from timeit import repeat
+import json
+
+_test_data = Path(Path(__file__).parent.parent, "tests/test_data")
+
+os_environ.setdefault("AWS_REGION", "eu-central-1")
+os_environ["DYNAMO_DB_RESOURCE_SCHEMA_ORIGIN"] = "file"
+os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"] = f"{_test_data}/tables/"
+
+from dynamo_db_resource import Table  # noqa: E402
+from dynamo_db_resource.dynamo_db_table import _ValidationModes  # noqa: E402
+
+with open(Path(_test_data, "items/test_item.json")) as f:
+    test_item = json.load(f)
+test_update = {"some_nested_dict": {"KEY1": {"subKEY2": 3.5}}}
+
+NUMBER = 2000
+
+
+def _per_call_microseconds(statement) -> float:
+    return min(repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def _stack_dispatch():
+    return stack()[1].function
+
+
+def put(table):
+    _stack_dispatch()
+    table._validate_input(test_item, _ValidationModes.FULL_ITEM)
+
+
+def update_attribute(table):
+    _stack_dispatch()
+    table._validate_input(test_update, _ValidationModes.SUB_PART)
+
+
+def main():
+    table = Table("TableForTests")
+
+    results = {
+        "put (inspect.stack)": lambda: put(table),
+        "put (explicit mode)": lambda: table._validate_input(
+            test_item, _ValidationModes.FULL_ITEM
+        ),
+        "update (inspect.stack)": lambda: update_attribute(table),
+        "update (explicit mode)": lambda: table._validate_input(
+            test_update, _ValidationModes.SUB_PART
+        ),
+    }
+
+    for name, statement in results.items():
+        print(f"{name:<26}{_per_call_microseconds(statement):>10.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Benchmark of the CPU overhead Table adds on top of boto3 per call.
+
+Every operation runs once through Table and once as the equivalent call of a
+plain boto3 Table resource. Both share one client whose requests never leave
+the process: a before-send handler answers them with canned responses, so the
+difference of both is the cost of schema validation, expression building and
+the conversions of Table. Peak allocations per call are traced separately.
+
+Run from the repository root: `PYTHONPATH=. python benchmarks/wrapper_overhead.py`
+Track releases by storing results with `--json results.json` and comparing a
+later run with `--compare results.json`.
+"""
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from decimal import Decimal
+from pathlib import Path
+from platform import python_version
+from timeit import repeat
+import json
+import tracemalloc
+
+import boto3
+import botocore
+from botocore.awsrequest import AWSResponse
+
+import dynamo_db_resource
+from dynamo_db_resource import Table
+from dynamo_db_resource._wire_format import _serialize_values
+
+TABLE_NAME = "TableForTests"
+SCHEMA_DIRECTORY = Path(Path(__file__).parent.parent, "tests/test_data/tables")
+PRIMARY = {"primary_partition_key": "some_identification_string"}
+
+with open(Path(SCHEMA_DIRECTORY.parent, "items/test_item.json")) as f:
+    ITEM = json.load(f)
+ITEM["some_string_set"] = {"a", "b"}
+
+
+class _RawResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+class StubbedResponses:
+    """
+    answer the requests of a client with a canned response per operation
+    """
+
+    def __init__(self, page_size: int):
+        item = _serialize_values(ITEM)
+        items = [
+            dict(item, primary_partition_key={"S": f"item_{i}"})
+            for i in range(page_size)
+        ]
+        self.responses = {
+            operation: json.dumps(response).encode()
+            for operation, response in {
+                "GetItem": {"Item": item},
+                "PutItem": {},
+                "UpdateItem": {},
+                "Query": {
+                    "Items": items,
+                    "Count": len(items),
+                    "ScannedCount": len(items),
+                },
+                "BatchGetItem": {
+                    "Responses": {TABLE_NAME: items},
+                    "UnprocessedKeys": {},
+                },
+            }.items()
+        }
+
+    def __call__(self, request, **kwargs):
+        operation = request.headers["X-Amz-Target"].decode().rsplit(".", 1)[-1]
+        return AWSResponse(
+            request.url,
+            200,
+            {"Content-Type": "application/x-amz-json-1.0"},
+            _RawResponse(self.responses[operation]),
+        )
+
+
+def _names(*names) -> dict:
+    return {f"#{chr(65 + i)}": name for i, name in enumerate(names)}
+
+
+def operations(t: Table, raw, page_size: int) -> dict:
+    """
+    the calls of Table and their equivalents with the boto3 Table resource
+    """
+    decimal_item = json.loads(json.dumps(ITEM, default=list), parse_float=Decimal)
+    decimal_item["some_string_set"] = {"a", "b"}
+    keys = [{"primary_partition_key": f"item_{i}"} for i in range(page_size)]
+
+    def raw_update(expression, names, values, condition):
+        return lambda: raw.update_item(
+            Key=PRIMARY,
+            UpdateExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ConditionExpression=condition,
+        )
+
+    return {
+        "get": (
+            lambda: t.get(**PRIMARY),
+            lambda: raw.get_item(Key=PRIMARY)["Item"],
+        ),
+        "put": (
+            lambda: t.put(deepcopy(ITEM), overwrite=True),
+            lambda: raw.put_item(Item=decimal_item),
+        ),
+        "add_new_attribute": (
+            lambda: t.add_new_attribute({"some_float": 1.5}, **PRIMARY),
+            raw_update(
+                "SET #A = :a",
+                _names("some_float", "primary_partition_key"),
+                {":a": Decimal("1.5")},
+                "attribute_not_exists(#A) and attribute_exists(#B)",
+            ),
+        ),
+        "update_attribute": (
+            lambda: t.update_attribute(
+                {"some_nested_dict": {"KEY1": {"subKEY2": 1.5}}}, **PRIMARY
+            ),
+            raw_update(
+                "SET #A.#B.#C = :a",
+                _names("some_nested_dict", "KEY1", "subKEY2", "primary_partition_key"),
+                {":a": Decimal("1.5")},
+                "attribute_exists(#A.#B.#C) and attribute_exists(#D)",
+            ),
+        ),
+        "update_append_list": (
+            lambda: t.update_append_list({"some_array": ["appended"]}, **PRIMARY),
+            raw_update(
+                "SET #A = list_append(#A, :a)",
+                _names("some_array", "primary_partition_key"),
+                {":a": ["appended"]},
+                "attribute_exists(#A) and attribute_exists(#B)",
+            ),
+        ),
+        "update_add_set": (
+            lambda: t.update_add_set({"some_string_set": {"c"}}, **PRIMARY),
+            raw_update(
+                "ADD #A :a",
+                _names("some_string_set", "primary_partition_key"),
+                {":a": {"c"}},
+                "attribute_exists(#A) and attribute_exists(#B)",
+            ),
+        ),
+        "update_number_drift": (
+            lambda: t.update_number_drift({"some_int": 1}, **PRIMARY),
+            raw_update(
+                "SET #A = #A + :a",
+                _names("some_int", "primary_partition_key"),
+                {":a": 1},
+                "attribute_exists(#A) and attribute_exists(#B)",
+            ),
+        ),
+        "query": (
+            lambda: t.query(**PRIMARY),
+            lambda: raw.query(
+                KeyConditionExpression="#A = :a",
+                ExpressionAttributeNames=_names("primary_partition_key"),
+                ExpressionAttributeValues={":a": PRIMARY["primary_partition_key"]},
+            ),
+        ),
+        "batch_get": (
+            lambda: t.batch_get(keys),
+            lambda: raw.meta.client.batch_get_item(
+                RequestItems={TABLE_NAME: {"Keys": keys}}
+            ),
+        ),
+    }
+
+
+def _operations_per_second(functions: tuple, number: int, repetitions: int):
+    # alternating the timings evens out drifts of the machine between them
+    best = [float("inf")] * len(functions)
+    for _ in range(repetitions):
+        for position, function in enumerate(functions):
+            best[position] = min(
+                best[position], *repeat(function, number=number, repeat=1)
+            )
+    return [number / seconds for seconds in best]
+
+
+def _peak_kibibytes(function, calls: int = 20) -> float:
+    peaks = list()
+    for _ in range(calls):
+        tracemalloc.start()
+        function()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024
+
+
+def run(names: list = None, number: int = 200, repetitions: int = 7, page_size=100):
+    t = Table(
+        TABLE_NAME,
+        special_resource_config={
+            "region_name": "us-east-1",
+            "aws_access_key_id": "benchmark",
+            "aws_secret_access_key": "benchmark",
+        },
+        config={"origin": "file", "directory": f"{SCHEMA_DIRECTORY}/"},
+    )
+    t._resource.meta.client.meta.events.register_first(
+        "before-send.dynamodb", StubbedResponses(page_size)
+    )
+    raw = t._resource.Table(TABLE_NAME)
+
+    results = dict()
+    for name, (wrapper, boto) in operations(t, raw, page_size).items():
+        if names and name not in names:
+            continue
+        wrapper_ops, boto_ops = _operations_per_second(
+            (wrapper, boto), number, repetitions
+        )
+        results[name] = {
+            "table_ops_per_second": wrapper_ops,
+            "boto3_ops_per_second": boto_ops,
+            "overhead_microseconds": (1 / wrapper_ops - 1 / boto_ops) * 1e6,
+            "table_peak_kib": _peak_kibibytes(wrapper),
+            "boto3_peak_kib": _peak_kibibytes(boto),
+        }
+    return {
+        "versions": {
+            "dynamo_db_resource": dynamo_db_resource.__version__,
+            "boto3": boto3.__version__,
+            "botocore": botocore.__version__,
+            "python": python_version(),
+        },
+        "page_size": page_size,
+        "results": results,
+    }
+
+
+def report(benchmark: dict, previous: dict = None):
+    print(
+        f"{'operation':<22}{'Table op/s':>12}{'boto3 op/s':>12}{'overhead':>13}"
+        f"{'Table peak':>13}{'boto3 peak':>13}"
+        + (f"{'vs previous':>13}" if previous else "")
+    )
+    for name, result in benchmark["results"].items():
+        line = (
+            f"{name:<22}{result['table_ops_per_second']:>12.0f}"
+            f"{result['boto3_ops_per_second']:>12.0f}"
+            f"{result['overhead_microseconds']:>10.0f} us"
+            f"{result['table_peak_kib']:>9.1f} KiB{result['boto3_peak_kib']:>9.1f} KiB"
+        )
+        if previous and name in previous["results"]:
+            before = previous["results"][name]["table_ops_per_second"]
+            line += f"{(result['table_ops_per_second'] / before - 1) * 100:>+12.1f}%"
+        print(line)
+
+
+def main():
+    parser = ArgumentParser(description="overhead of Table compared to boto3")
+    parser.add_argument("operations", nargs="*", help="default: all operations")
+    parser.add_argument("--number", type=int, default=200, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=7, help="timings per call")
+    parser.add_argument("--page_size", type=int, default=100, help="items per read")
+    parser.add_argument("--json", help="store the results in this file")
+    parser.add_argument("--compare", help="results of a previous run to compare to")
+    args = parser.parse_args()
+
+    benchmark = run(args.operations, args.number, args.repeat, args.page_size)
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print(
+        ", ".join(
+            f"{name} {version}" for name, version in benchmark["versions"].items()
+        )
+    )
+    report(benchmark, previous)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(benchmark, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
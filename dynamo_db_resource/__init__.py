@@ -1,4 +1,8 @@
 __version__ = "0.7.1"
 
 from .dynamo_db_table import Table, UpdateReturns
+from .item_cache import ItemCache
+from .interceptors import Interceptor
 from .resource import database_resource
+from .transaction import Transaction
+from .async_dynamo_db_table import AsyncTable
@@ -47,6 +47,39 @@ def create_infrastructure_for_schema_in_directory(directory, tables=None):
     return data
 
 
+def export_tables_for_schema_in_directory(
+    directory, output, tables=None, export_format="ndjson", total_segments=4
+):
+    from .dynamo_db_table import Table
+
+    schemas = [i for i in Path(directory).iterdir() if i.suffix == ".json"]
+
+    exported_items = dict()
+    for schema_file in schemas:
+        schema_file = Path(schema_file)
+        if tables and not any(f"{i}.json" == schema_file.name for i in tables):
+            continue
+        table = Table(
+            schema_file.stem,
+            config={"origin": "file", "directory": f"{Path(directory)}/"},
+        )
+        exported_items[schema_file.stem] = table.export(
+            output, export_format=export_format, total_segments=total_segments
+        )
+    return exported_items
+
+
+def import_table_for_schema_in_directory(
+    directory, table_name, path, processes=None, rejects_path=None
+):
+    from .dynamo_db_table import Table
+
+    table = Table(
+        table_name, config={"origin": "file", "directory": f"{Path(directory)}/"}
+    )
+    return table.bulk_import(path, processes=processes, rejects_path=rejects_path)
+
+
 if __name__ == "__main__":
     from os import environ as os_environ
     from argparse import ArgumentParser
@@ -55,7 +88,7 @@ if __name__ == "__main__":
     __parser.add_argument(
         "command",
         help="what shall be done",
-        choices=["create_table", "export_infrastructure"],
+        choices=["create_table", "export_infrastructure", "export", "import"],
     )
 
     __parser.add_argument(
@@ -102,6 +135,45 @@ if __name__ == "__main__":
         default="yml",
     )
 
+    __parser.add_argument(
+        "--output",
+        "-o",
+        help="directory of the exported table files",
+        default="./export",
+    )
+
+    __parser.add_argument(
+        "--export_format",
+        "-f",
+        help="file format of the exported table items",
+        choices=["ndjson", "csv", "parquet"],
+        default="ndjson",
+    )
+
+    __parser.add_argument(
+        "--segments",
+        help="number of segments scanned and written in parallel per table",
+        type=int,
+        default=4,
+    )
+
+    __parser.add_argument(
+        "--input",
+        "-i",
+        help="file or directory of the items to import into the (single) table",
+    )
+
+    __parser.add_argument(
+        "--processes",
+        help="number of processes converting the imported items",
+        type=int,
+    )
+
+    __parser.add_argument(
+        "--rejects",
+        help="file of the items rejected during the import",
+    )
+
     __vars = vars(__parser.parse_args())
     os_environ["ENV"] = __vars["environment"]
     if __vars["stage"]:
@@ -124,3 +196,36 @@ if __name__ == "__main__":
             from json import dumps
 
             print(dumps(infrastructure))
+    if __vars["command"] == "export":
+        if __vars["region"]:
+            os_environ["AWS_REGION"] = __vars["region"]
+        exported_items = export_tables_for_schema_in_directory(
+            __vars["directory"],
+            __vars["output"],
+            __vars["tables"],
+            __vars["export_format"],
+            __vars["segments"],
+        )
+        for table_name, number_of_items in exported_items.items():
+            print(f"exported {number_of_items} items of {table_name}")
+    if __vars["command"] == "import":
+        if __vars["region"]:
+            os_environ["AWS_REGION"] = __vars["region"]
+        if not __vars["tables"] or len(__vars["tables"]) != 1 or not __vars["input"]:
+            __parser.error("import requires --input and a single table in --tables")
+        statistics = import_table_for_schema_in_directory(
+            __vars["directory"],
+            __vars["tables"][0],
+            __vars["input"],
+            __vars["processes"],
+            __vars["rejects"],
+        )
+        print(
+            f"imported {statistics['items']} items into {__vars['tables'][0]} "
+            f"({statistics['items_per_second']:.0f} items/s)"
+        )
+        if statistics["rejected"]:
+            print(
+                f"rejected {statistics['rejected']} items, "
+                f"see {statistics['rejects_path']}"
+            )
@@ -0,0 +1,127 @@
+from concurrent.futures import Future
+from copy import deepcopy
+from threading import Event, Lock
+
+__all__ = ["SingleFlight", "MicroBatcher"]
+
+
+class _Call:
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    let concurrent calls for the same key share the execution of the first one
+    """
+
+    def __init__(self):
+        self.__calls = dict()
+        self.__lock = Lock()
+
+    def do(self, key, function):
+        """
+        execute function unless a call for key is already in flight, then await its result
+
+        Parameters
+        ----------
+        key
+            hashable identifying equal calls
+        function: callable
+            function without arguments returning the result
+
+        Returns
+        -------
+        the result of function, a copy of it for the calls that joined an in-flight one
+
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leading = call is None
+            if leading:
+                call = self.__calls[key] = _Call()
+
+        if not leading:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return deepcopy(call.result)
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+
+class MicroBatcher:
+    """
+    collect concurrent loads of distinct keys within a window and load them at once
+
+    The first caller of an empty batch waits for the window (or until max_batch_size
+    keys are collected) and loads the whole batch for all callers.
+
+    Parameters
+    ----------
+    load_batch: callable
+        called with a list of keys, returns a dict of key: result for the keys found
+    window: float
+        seconds to wait for further keys before loading a batch
+    max_batch_size: int
+        number of keys loading a batch without waiting for the window to pass
+
+    """
+
+    def __init__(self, load_batch, window: float, max_batch_size: int = 100):
+        self.load_batch = load_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self.__batch = dict()
+        self.__full = Event()
+        self.__lock = Lock()
+
+    def load(self, key):
+        """
+        load key within the next batch
+
+        Returns
+        -------
+        the result for key or None if load_batch did not return it
+
+        """
+        with self.__lock:
+            future = self.__batch.get(key)
+            dispatching = False
+            if future is None:
+                future = self.__batch[key] = Future()
+                dispatching = len(self.__batch) == 1
+            if len(self.__batch) >= self.max_batch_size:
+                self.__full.set()
+
+        if dispatching:
+            self.__full.wait(self.window)
+            with self.__lock:
+                batch = self.__batch
+                self.__batch = dict()
+                self.__full.clear()
+            self.__dispatch(batch)
+
+        return deepcopy(future.result())
+
+    def __dispatch(self, batch: dict):
+        try:
+            results = self.load_batch(list(batch))
+        except BaseException as e:
+            for future in batch.values():
+                future.set_exception(e)
+            raise
+        for key, future in batch.items():
+            future.set_result(results.get(key))
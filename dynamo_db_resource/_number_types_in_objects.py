@@ -1,12 +1,49 @@
 from decimal import Decimal
 
 
-__all__ = ["object_with_decimal_to_float", "object_with_float_to_decimal"]
+__all__ = [
+    "object_with_decimal_to_float",
+    "object_with_float_to_decimal",
+    "copy_object_with_float_to_decimal",
+]
+
+
+# integers of larger magnitude are not exactly representable as float
+_max_exact_float_integer = 2 ** 53
+
+
+def _decimal_to_number(value: (Decimal, str)):
+    # value is a Decimal or the text of a number as sent by DynamoDB
+    # parsing the text once is cheaper than Decimal arithmetic or float(Decimal)
+    text = str(value)
+    if "." not in text and "E" not in text and "e" not in text:
+        return int(text)
+    number = float(text)
+    if not number.is_integer():
+        return number
+    if -_max_exact_float_integer < number < _max_exact_float_integer:
+        return int(number)
+    value = Decimal(text)
+    integer = int(value)
+    return integer if integer == value else number
+
+
+def _number_set_to_number(value: set) -> set:
+    return {_decimal_to_number(i) if type(i) is Decimal else i for i in value}
+
+
+_leaf_converters = {
+    Decimal: _decimal_to_number,
+    set: _number_set_to_number,
+}
 
 
 def object_with_decimal_to_float(data):
     """
-    Convert all decimal values to type=float
+    Convert all decimal values to type=int if integral, else type=float
+
+    Walks the object iteratively converting dicts and lists in place, tuples are
+    replaced by lists. The leaves are converted by the converter of their type.
 
     Parameters
     ----------
@@ -17,31 +54,30 @@ def object_with_decimal_to_float(data):
     [dict, list]
 
     """
-
-    def to_basic(vi):
-        if isinstance(vi, Decimal):
-            if vi % 1 == 0:
-                return int(vi)
-            return float(vi)
-        return vi
-
-    if isinstance(data, (list, tuple)):
-        data = [object_with_decimal_to_float(i) for i in data]
-    elif isinstance(data, float):
-        return to_basic(data)
-    elif isinstance(data, dict):
-        for k, v in data.items():
-            if isinstance(v, dict):
-                object_with_decimal_to_float(v)
-            elif isinstance(v, (list, tuple)):
-                data[k] = [
-                    object_with_decimal_to_float(x)
-                    if isinstance(x, dict)
-                    else to_basic(x)
-                    for x in v
-                ]
+    data_type = type(data)
+    if data_type in _leaf_converters:
+        return _leaf_converters[data_type](data)
+    if data_type is tuple:
+        data = list(data)
+    elif data_type is not dict and data_type is not list:
+        return data
+
+    converter_of = _leaf_converters.get
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        entries = container.items() if type(container) is dict else enumerate(container)
+        for key, value in entries:
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                stack.append(value)
+            elif value_type is tuple:
+                container[key] = value = list(value)
+                stack.append(value)
             else:
-                data[k] = to_basic(v)
+                converter = converter_of(value_type)
+                if converter is not None:
+                    container[key] = converter(value)
     return data
 
 
@@ -82,3 +118,50 @@ def object_with_float_to_decimal(data):
             else:
                 data[k] = to_basic(v)
     return data
+
+
+def copy_object_with_float_to_decimal(data):
+    """
+    Convert all float values to type=Decimal without modifying data
+
+    Containers are only copied if a float was found within them, all other
+    parts of the returned object are shared with the given data.
+
+    Parameters
+    ----------
+    data : object
+
+    Returns
+    -------
+    object
+
+    """
+    if isinstance(data, float):
+        return Decimal(str(data))
+
+    if isinstance(data, dict):
+        converted = None
+        for k, v in data.items():
+            new_v = copy_object_with_float_to_decimal(v)
+            if new_v is not v:
+                if converted is None:
+                    converted = data.copy()
+                converted[k] = new_v
+        return data if converted is None else converted
+
+    if isinstance(data, (list, tuple)):
+        converted = None
+        for i, v in enumerate(data):
+            new_v = copy_object_with_float_to_decimal(v)
+            if new_v is not v:
+                if converted is None:
+                    converted = list(data)
+                converted[i] = new_v
+        if converted is None and isinstance(data, tuple):
+            converted = list(data)
+        return data if converted is None else converted
+
+    if isinstance(data, (set, frozenset)) and any(isinstance(i, float) for i in data):
+        return {Decimal(str(i)) if isinstance(i, float) else i for i in data}
+
+    return data
@@ -1,6 +1,10 @@
+from aws_schema import SchemaValidator
+from aws_schema.nested_dict_helper import find_path_values_in_dict
 from jsonschema.validators import Draft7Validator as BaseValidator, extend
 from jsonschema.exceptions import ValidationError
 from jsonschema._types import is_number
+from pathlib import Path
+from threading import Lock
 
 _json_schema_2_dynamo_db_type_switch = {
     "string": "S",
@@ -65,3 +69,104 @@ DynamoDBValidator = extend(
         }
     ),
 )
+
+
+# paths below patternProperties are unbounded, so only that many paths are remembered
+_max_cached_sub_schemas = 4096
+
+
+class CompiledSchemaValidator(SchemaValidator):
+    """
+    SchemaValidator remembering resolved sub schemas and their validators per path
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("custom_validator", DynamoDBValidator)
+        super().__init__(*args, **kwargs)
+        self.__base_validator = kwargs["custom_validator"]
+        self.__sub_schemas = dict()
+        self.__sub_schema_validators = dict()
+
+    def get_sub_schema(
+        self, path_to_sub_schema: list, current_sub_schema: dict = None, depth: int = 0
+    ) -> (dict, int):
+        if current_sub_schema is not None or depth:
+            return super().get_sub_schema(path_to_sub_schema, current_sub_schema, depth)
+
+        path = tuple(path_to_sub_schema)
+        if path in self.__sub_schemas:
+            return self.__sub_schemas[path]
+        sub_schema = super().get_sub_schema(path_to_sub_schema)
+        if len(self.__sub_schemas) < _max_cached_sub_schemas:
+            self.__sub_schemas[path] = sub_schema
+        return sub_schema
+
+    def _sub_schema_validator(self, path: tuple):
+        if path in self.__sub_schema_validators:
+            return self.__sub_schema_validators[path]
+        sub_schema, _ = self.get_sub_schema(list(path))
+        validator = self.__base_validator(sub_schema, resolver=self.validator.resolver)
+        if len(self.__sub_schema_validators) < _max_cached_sub_schemas:
+            self.__sub_schema_validators[path] = validator
+        return validator
+
+    def validate_sub_part(self, new_data):
+        paths_in_new_data, new_values = find_path_values_in_dict(new_data)
+
+        for path_to_new_attribute, new_value in zip(paths_in_new_data, new_values):
+            _, depth = self.get_sub_schema(path_to_new_attribute)
+            if depth != len(path_to_new_attribute):
+                new_value = new_data
+                for step in path_to_new_attribute[:depth]:
+                    new_value = new_value[step]
+            try:
+                self._sub_schema_validator(tuple(path_to_new_attribute)).validate(
+                    new_value
+                )
+            except ValidationError as VE:
+                for path in path_to_new_attribute[::-1]:
+                    VE.__dict__["path"].appendleft(path)
+                raise VE
+
+    def compile(self):
+        """
+        create the validator and resolve the sub schemas of all nested properties
+        """
+
+        def resolve_properties(sub_schema: dict, path: list):
+            for name, property_schema in sub_schema.get("properties", dict()).items():
+                self._sub_schema_validator(tuple(path + [name]))
+                resolve_properties(property_schema, path + [name])
+
+        resolve_properties(self.validator.schema, list())
+        return self
+
+
+_schema_validators = dict()
+_schema_validators_lock = Lock()
+
+
+def load_schema_validator(origin: str, location: str) -> CompiledSchemaValidator:
+    """
+    get the process wide validator for a schema, loading and compiling it on first use
+
+    Parameters
+    ----------
+    origin: str
+        origin of the schema as understood by aws_schema.SchemaValidator, e.g. file
+    location: str
+        path/url to the schema
+
+    Returns
+    -------
+    CompiledSchemaValidator
+
+    """
+    key = (origin, str(Path(location).absolute()) if origin == "file" else location)
+    if key not in _schema_validators:
+        with _schema_validators_lock:
+            if key not in _schema_validators:
+                _schema_validators[key] = CompiledSchemaValidator(
+                    **{origin: location}
+                ).compile()
+    return _schema_validators[key]
@@ -0,0 +1,90 @@
+from ._number_types_in_objects import (
+    _decimal_to_number,
+    copy_object_with_float_to_decimal,
+)
+from boto3.dynamodb.types import Binary, TypeSerializer
+
+__all__ = [
+    "serialize_request",
+    "deserialize_attribute_value",
+    "deserialize_item",
+    "deserialize_response",
+]
+
+_serializer = TypeSerializer()
+
+_serialized_request_keys = [
+    "Key",
+    "Item",
+    "ExpressionAttributeValues",
+    "ExclusiveStartKey",
+]
+
+
+def _serialize_values(values: dict) -> dict:
+    return {
+        key: _serializer.serialize(value)
+        for key, value in copy_object_with_float_to_decimal(values).items()
+    }
+
+
+def serialize_request(request: dict) -> dict:
+    """
+    serialize the python values of a resource-style request for the low-level client
+
+    Condition objects must already be built into expressions.
+    """
+    request = request.copy()
+    for key in _serialized_request_keys:
+        if key in request:
+            request[key] = _serialize_values(request[key])
+    return request
+
+
+def _deserialize_list(value: list) -> list:
+    return [deserialize_attribute_value(i) for i in value]
+
+
+_deserializers = {
+    "S": str,
+    "N": _decimal_to_number,
+    "BOOL": bool,
+    "NULL": lambda value: None,
+    "B": Binary,
+    "M": lambda value: deserialize_item(value),
+    "L": _deserialize_list,
+    "SS": set,
+    "NS": lambda value: set(map(_decimal_to_number, value)),
+    "BS": lambda value: set(map(Binary, value)),
+}
+
+
+def deserialize_attribute_value(attribute_value: dict):
+    """
+    deserialize an AttributeValue of the low-level client in one pass
+
+    Numbers become int if integral, else float, without a Decimal intermediate;
+    all other types equal the ones of the boto3 resource.
+    """
+    ((data_type, value),) = attribute_value.items()
+    if data_type == "S":
+        return value
+    if data_type == "N":
+        return _decimal_to_number(value)
+    return _deserializers[data_type](value)
+
+
+def deserialize_item(item: dict) -> dict:
+    return {key: deserialize_attribute_value(value) for key, value in item.items()}
+
+
+def deserialize_response(response: dict) -> dict:
+    """
+    deserialize the items and keys of a low-level client response in place
+    """
+    for key in ["Item", "Attributes", "LastEvaluatedKey"]:
+        if key in response:
+            response[key] = deserialize_item(response[key])
+    if "Items" in response:
+        response["Items"] = [deserialize_item(item) for item in response["Items"]]
+    return response
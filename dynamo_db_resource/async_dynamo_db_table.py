@@ -0,0 +1,830 @@
+from ._number_types_in_objects import object_with_decimal_to_float
+from ._wire_format import _serialize_values, serialize_request
+from .dynamo_db_table import (
+    Table,
+    UpdateReturns,
+    _ValidationModes,
+    _batch_get_limit,
+    _chunk,
+    _expand_condition_expression,
+    _max_batch_attempts,
+    _retry_delay,
+)
+from .exceptions import ConditionalCheckFailedException
+from asyncio import Lock, Semaphore, gather, sleep
+from contextlib import AsyncExitStack
+from os import environ as os_environ
+from boto3.dynamodb.conditions import ConditionBase
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+from typing import Awaitable, Iterable, List
+
+__all__ = [
+    "AsyncTable",
+    "AsyncDatabaseResourceController",
+    "gather_bounded",
+]
+
+_deserializer = TypeDeserializer()
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable],
+    max_concurrency: int = 10,
+    return_exceptions: bool = False,
+) -> list:
+    """
+    await all awaitables like asyncio.gather with at most max_concurrency running at once
+
+    Parameters
+    ----------
+    awaitables: Iterable[Awaitable]
+        coroutines or futures to await
+    max_concurrency: int
+        maximum number of awaitables in flight at the same time
+    return_exceptions: bool
+        return raised exceptions as results instead of propagating the first one
+
+    Returns
+    -------
+    list
+        the results in the order of the given awaitables
+
+    """
+    semaphore = Semaphore(max_concurrency)
+
+    async def bounded(awaitable):
+        async with semaphore:
+            return await awaitable
+
+    return await gather(
+        *[bounded(awaitable) for awaitable in awaitables],
+        return_exceptions=return_exceptions,
+    )
+
+
+def _default_client_config() -> dict:
+    return {
+        "region_name": os_environ["AWS_REGION"]
+        if "AWS_REGION" in os_environ
+        else "us-east-1"
+    }
+
+
+async def _create_client(resource_config: dict, exit_stack: AsyncExitStack):
+    from aiobotocore.session import get_session
+
+    client_config = (
+        dict(resource_config) if resource_config else _default_client_config()
+    )
+    if "config" in client_config:
+        from aiobotocore.config import AioConfig
+
+        client_config["config"] = AioConfig(
+            **client_config["config"]._user_provided_options
+        )
+    return await exit_stack.enter_async_context(
+        get_session().create_client("dynamodb", **client_config)
+    )
+
+
+async def _open_client(resource_config: dict) -> (AsyncExitStack, object):
+    exit_stack = AsyncExitStack()
+    return exit_stack, await _create_client(resource_config, exit_stack)
+
+
+def _deserialize_values(values: dict) -> dict:
+    return {key: _deserializer.deserialize(value) for key, value in values.items()}
+
+
+def _serialize_request(request: dict) -> dict:
+    return serialize_request(_expand_condition_expression(request))
+
+
+def _deserialize_response(response: dict) -> dict:
+    for key in ["Item", "Attributes", "LastEvaluatedKey"]:
+        if key in response:
+            response[key] = _deserialize_values(response[key])
+    if "Items" in response:
+        response["Items"] = [_deserialize_values(item) for item in response["Items"]]
+    return response
+
+
+class AsyncTable:
+    """
+    asyncio variant of Table performing its I/O with an aiobotocore DynamoDB client
+
+    Request building, schema validation and exception mapping are the ones of Table.
+    Either use it as `async with AsyncTable(...) as table:` or call
+    `await table.close()` once done, unless an already open client is given.
+    """
+
+    def __init__(
+        self,
+        table_name,
+        special_resource_config: dict = False,
+        config: dict = None,
+        client=None,
+    ):
+        self.__table = Table(
+            table_name, special_resource_config=special_resource_config, config=config
+        )
+        self.__resource_config = special_resource_config
+        self.__client = client
+        self.__exit_stack = None
+        self.__client_lock = None
+
+    @property
+    def name(self):
+        return self.__table.name
+
+    @property
+    def pk(self):
+        return self.__table.pk
+
+    @property
+    def schema(self):
+        return self.__table.schema
+
+    @property
+    def indexes(self) -> dict:
+        return self.__table.indexes
+
+    @property
+    def custom_exception(self):
+        return self.__table.custom_exception
+
+    async def _client(self):
+        if self.__client is None:
+            # created lazily, before Python 3.10 a Lock binds to the loop current
+            # at its creation
+            if self.__client_lock is None:
+                self.__client_lock = Lock()
+            async with self.__client_lock:
+                if self.__client is None:
+                    self.__exit_stack, self.__client = await _open_client(
+                        self.__resource_config
+                    )
+        return self.__client
+
+    async def close(self):
+        if self.__exit_stack is not None:
+            await self.__exit_stack.aclose()
+            self.__exit_stack = None
+            self.__client = None
+
+    async def __aenter__(self):
+        await self._client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _request(self, operation: str, **request) -> dict:
+        client = await self._client()
+        response = await getattr(client, operation)(
+            TableName=self.name, **_serialize_request(request)
+        )
+        return _deserialize_response(response)
+
+    async def describe(self):
+        client = await self._client()
+        return await client.describe_table(TableName=self.name)
+
+    async def get(self, attributes_to_get: list = None, **primary_dict):
+        """
+        get item specified with primary_dict
+
+        Parameters
+        ----------
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        primary_dict: str
+            primary keys for the item to retrieve
+
+        Returns
+        -------
+        dict
+
+        """
+        response = await self._request(
+            "get_item",
+            **self.__table._create_get_request(attributes_to_get, primary_dict),
+        )
+        return self.__table._handle_get_response(response, primary_dict)
+
+    async def get_many(
+        self,
+        primary_dicts: Iterable[dict],
+        attributes_to_get: list = None,
+        max_concurrency: int = 10,
+    ) -> list:
+        """
+        get the items of all primary_dicts with concurrent single get requests
+
+        Parameters
+        ----------
+        primary_dicts: Iterable[dict]
+            primary keys for the items to retrieve
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        max_concurrency: int
+            maximum number of requests in flight at the same time
+
+        Returns
+        -------
+        list
+            the items in the order of primary_dicts
+
+        """
+        return await gather_bounded(
+            [
+                self.get(
+                    attributes_to_get=list(attributes_to_get)
+                    if attributes_to_get
+                    else None,
+                    **primary_dict,
+                )
+                for primary_dict in primary_dicts
+            ],
+            max_concurrency,
+        )
+
+    async def put(self, item, overwrite=False):
+        put_data = self.__table._create_put_request(item, overwrite)
+
+        try:
+            await self._request("put_item", **put_data)
+
+        except ClientError as CE:
+            if CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                self.custom_exception.item_already_existing(item)
+            else:
+                raise CE
+
+    async def _create_item_instead(
+        self, create_item_if_non_existent: bool, new_data: dict, primary_dict: dict
+    ):
+        if not create_item_if_non_existent:
+            self.custom_exception.not_found_message(primary_dict)
+        item = primary_dict.copy()
+        item.update(new_data)
+        await self.put(item)
+
+    async def _general_update(
+        self,
+        *,
+        require_attributes_already_present=False,
+        require_attributes_to_be_missing=False,
+        create_item_if_non_existent,
+        list_operation=False,
+        set_operation=False,
+        value_operation=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        new_data=None,
+        remove_data=None,
+        remove_set_item=None,
+        remove_list_item=None,
+        direct_condition=None,
+        **primary_dict,
+    ):
+        update_dict = self.__table._create_update_request(
+            require_attributes_already_present=require_attributes_already_present,
+            require_attributes_to_be_missing=require_attributes_to_be_missing,
+            create_item_if_non_existent=create_item_if_non_existent,
+            list_operation=list_operation,
+            set_operation=set_operation,
+            value_operation=value_operation,
+            returns=returns,
+            new_data=new_data,
+            remove_data=remove_data,
+            remove_set_item=remove_set_item,
+            remove_list_item=remove_list_item,
+            direct_condition=direct_condition,
+            primary_dict=primary_dict,
+        )
+
+        try:
+            response = await self._request("update_item", **update_dict)
+            return self.__table._handle_update_response(
+                response, returns, remove_data, remove_list_item
+            )
+        except ClientError as CE:
+            if CE.response["Error"]["Code"] == "ValidationException":
+                if self.__table._is_invalid_document_path(
+                    CE, require_attributes_already_present
+                ):
+                    try:
+                        item = await self.get(**primary_dict)
+                    except FileNotFoundError:
+                        return await self._create_item_instead(
+                            create_item_if_non_existent, new_data, primary_dict
+                        )
+                    response = await self._request(
+                        "update_item",
+                        **self.__table._create_new_paths_update_request(
+                            item, new_data, returns, primary_dict
+                        ),
+                    )
+                    return self.__table._handle_update_response(response, returns)
+                raise CE
+
+            elif CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                if direct_condition:
+                    raise ConditionalCheckFailedException
+                try:
+                    await self.get(**primary_dict)
+                except FileNotFoundError:
+                    return await self._create_item_instead(
+                        create_item_if_non_existent, new_data, primary_dict
+                    )
+                self.__table._raise_failed_attribute_condition(
+                    require_attributes_already_present
+                )
+            else:
+                raise CE
+
+    async def add_new_attribute(
+        self,
+        new_data: dict,
+        update_if_existent=False,
+        create_item_if_non_existent=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        self.__table._validate_input(new_data, _ValidationModes.SUB_PART)
+        return await self._general_update(
+            **primary_dict,
+            new_data=new_data,
+            require_attributes_to_be_missing=True if not update_if_existent else False,
+            create_item_if_non_existent=create_item_if_non_existent,
+            direct_condition=condition,
+            returns=returns,
+        )
+
+    async def update_attribute(
+        self,
+        new_data,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        return await self._general_update(
+            **primary_dict,
+            new_data=new_data,
+            require_attributes_already_present=True
+            if not set_new_attribute_if_not_existent
+            else False,
+            create_item_if_non_existent=create_item_if_non_existent,
+            direct_condition=condition,
+            returns=returns,
+        )
+
+    async def update_append_list(
+        self,
+        new_data,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        return await self._general_update(
+            **primary_dict,
+            new_data=new_data,
+            require_attributes_already_present=False
+            if set_new_attribute_if_not_existent
+            else True,
+            create_item_if_non_existent=create_item_if_non_existent,
+            list_operation=True,
+            direct_condition=condition,
+            returns=returns,
+        )
+
+    async def update_add_set(
+        self,
+        new_data: dict,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        return await self._general_update(
+            **primary_dict,
+            new_data=new_data,
+            require_attributes_already_present=False
+            if set_new_attribute_if_not_existent
+            else True,
+            create_item_if_non_existent=create_item_if_non_existent,
+            set_operation=True,
+            direct_condition=condition,
+            returns=returns,
+        )
+
+    async def update_number_drift(
+        self,
+        drift_values_in_dict: dict,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        return await self._general_update(
+            **primary_dict,
+            new_data=drift_values_in_dict,
+            require_attributes_already_present=False
+            if set_new_attribute_if_not_existent
+            else True,
+            create_item_if_non_existent=create_item_if_non_existent,
+            value_operation=True,
+            direct_condition=condition,
+            returns=returns,
+        )
+
+    async def remove_attribute(
+        self,
+        path_of_attribute: list,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        if not isinstance(path_of_attribute[0], list):
+            path_of_attribute = [path_of_attribute]
+        self.__table._validate_input(path_of_attribute, _ValidationModes.REMOVAL)
+        return await self._general_update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_of_attribute.copy(),
+            returns=returns,
+            direct_condition=condition,
+            **primary_dict,
+        )
+
+    async def remove_entry_in_list(
+        self,
+        path_to_list: list,
+        position_to_delete: int,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        if not isinstance(path_to_list[0], list):
+            path_to_list = [path_to_list]
+        return await self._general_update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_to_list.copy(),
+            remove_list_item=position_to_delete,
+            returns=returns,
+            direct_condition=condition,
+            **primary_dict,
+        )
+
+    async def remove_from_set(
+        self,
+        path_to_set: list,
+        items_to_delete: (List[set], set),
+        returns: UpdateReturns = UpdateReturns.NONE,
+        condition=None,
+        **primary_dict,
+    ):
+        if not isinstance(path_to_set[0], list):
+            path_to_set = [path_to_set]
+        if not isinstance(items_to_delete, list):
+            items_to_delete = [items_to_delete]
+        for i, s in enumerate(items_to_delete):
+            if not isinstance(s, set):
+                items_to_delete[i] = set(s)
+        return await self._general_update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_to_set.copy(),
+            remove_set_item=items_to_delete,
+            returns=returns,
+            direct_condition=condition,
+            **primary_dict,
+        )
+
+    async def delete(self, condition=None, **primary_dict):
+        await self._request(
+            "delete_item",
+            **self.__table._create_delete_request(condition, primary_dict),
+        )
+
+    async def get_and_delete(self, condition=None, **primary_dict):
+        response = await self._request(
+            "delete_item",
+            **self.__table._create_delete_request(
+                condition, primary_dict, returns=UpdateReturns.ALL_OLD
+            ),
+        )
+        return self.__table._handle_get_and_delete_response(response, primary_dict)
+
+    async def scan(
+        self, get_only_primaries: bool = None, attributes_to_get: list = None
+    ):
+        response = await self._request(
+            "scan",
+            **self.__table._create_scan_data(get_only_primaries, attributes_to_get),
+        )
+        response["Items"] = [
+            object_with_decimal_to_float(item) for item in response["Items"]
+        ]
+        return response
+
+    async def scan_iter(
+        self,
+        get_only_primaries: bool = None,
+        attributes_to_get: list = None,
+        page_size: int = None,
+    ):
+        """
+        iterate over all items of the table, requesting the next page only once the previous one is consumed
+
+        Parameters
+        ----------
+        get_only_primaries: bool, optional
+            only return the primary keys of the items
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        page_size: int, optional
+            maximum number of items evaluated per scan request
+
+        Yields
+        -------
+        dict
+            one item after another
+
+        """
+        scan_data = self.__table._create_scan_data(
+            get_only_primaries, attributes_to_get
+        )
+        if page_size:
+            scan_data["Limit"] = page_size
+
+        while True:
+            response = await self._request("scan", **scan_data)
+            for item in response["Items"]:
+                yield object_with_decimal_to_float(item)
+            if "LastEvaluatedKey" not in response:
+                return
+            scan_data["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    async def query(
+        self,
+        attributes_to_get: list = None,
+        max_results: int = None,
+        offset_last_key: (str, int, float, dict) = None,
+        range_condition: ConditionBase = None,
+        index: str = None,
+        **query_keys,
+    ) -> dict:
+        """
+        query data based
+
+        Parameters
+        ----------
+        attributes_to_get: list
+            specify the attributes to return (for decreasing transferred data amount)
+        max_results: int, optional
+            limit the number of items to return
+        offset_last_key: str, int, float, dict, optional
+            for pagination: if many values provide the last key that shall not be included
+        range_condition: ConditionBase, optional
+            specify conditions for the range key to match
+        index: str, optional
+            if query should be executed on index
+        query_keys: str
+            primary or index keys
+
+        Returns
+        -------
+        dict
+            Count: int, ScannedCount: int, Items: list, (LastEvaluatedKey: (str, int, float))
+            items returned, number scanned for operation, actual items, last range key returned (for pagination)
+
+        """
+        query_data, range_key = self.__table._create_query_request(
+            attributes_to_get,
+            max_results,
+            offset_last_key,
+            range_condition,
+            index,
+            query_keys,
+        )
+        response = await self._request("query", **query_data)
+        return self.__table._handle_query_response(response, index, range_key)
+
+    async def query_iter(
+        self,
+        attributes_to_get: list = None,
+        max_results: int = None,
+        page_size: int = None,
+        range_condition: ConditionBase = None,
+        index: str = None,
+        **query_keys,
+    ):
+        """
+        iterate over all items matching the query, requesting the next page only once the previous one is consumed
+
+        Parameters
+        ----------
+        attributes_to_get: list
+            specify the attributes to return (for decreasing transferred data amount)
+        max_results: int, optional
+            limit the total number of items to yield
+        page_size: int, optional
+            maximum number of items evaluated per query request
+        range_condition: ConditionBase, optional
+            specify conditions for the range key to match
+        index: str, optional
+            if query should be executed on index
+        query_keys: str
+            primary or index keys
+
+        Yields
+        -------
+        dict
+            one item after another
+
+        """
+        query_data, _, _, _ = self.__table._create_query_data(
+            attributes_to_get, range_condition, index, query_keys
+        )
+
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            if page_size or remaining:
+                query_data["Limit"] = min(
+                    i for i in [page_size, remaining] if i is not None
+                )
+            response = await self._request("query", **query_data)
+            for item in response["Items"]:
+                yield object_with_decimal_to_float(item)
+            if remaining is not None:
+                remaining -= len(response["Items"])
+            if "LastEvaluatedKey" not in response:
+                return
+            query_data["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    async def index_get(
+        self,
+        index: str,
+        return_as_dict_of_primary_keys: bool = False,
+        attributes_to_get: list = None,
+        **index_keys: dict,
+    ):
+        """
+        get item from index name with index primary
+
+        Parameters
+        ----------
+        index: str
+            the name of the index
+        index_keys: dict
+            dictionary of the primary_keys
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        return_as_dict_of_primary_keys: bool
+            if the response shall be as an array (input=False) or as a dictionary of items
+             with primary_values as key (input=True)
+
+        Returns
+        -------
+        dict
+            dynamodb item
+
+        """
+        index_keys = self.__table._cast_index_keys(index, index_keys)
+        self.__table._index_key_checker(index, index_keys)
+        object_list = (
+            await self.query(
+                index=index, attributes_to_get=attributes_to_get, **index_keys
+            )
+        )["Items"]
+        if len(object_list) == 0:
+            raise FileNotFoundError
+        return self.__table._return_dict_of_pk_items_from_multiple_item_response(
+            object_list, return_as_dict_of_primary_keys
+        )
+
+    async def batch_get(
+        self,
+        primary_keys: Iterable,
+        return_as_dict_of_primary_keys: bool = False,
+        max_concurrency: int = 4,
+    ) -> dict:
+        """
+        get all items with given primary keys
+
+        Parameters
+        ----------
+        primary_keys : Iterable
+            primary keys to retrieve items for
+        return_as_dict_of_primary_keys: bool
+            if the response shall be as an array (input=False) or as a dictionary of items
+             with primary_values as key (input=True)
+        max_concurrency: int
+            number of chunks of 100 keys requested concurrently
+
+        Returns
+        -------
+        object with primary_key as key and item as value
+
+        """
+        primary_keys = self.__table._cast_primary_keys(primary_keys, batch=True)
+        chunk_responses = await gather_bounded(
+            [
+                self._batch_get_chunk(chunk)
+                for chunk in _chunk(primary_keys, _batch_get_limit)
+            ],
+            max_concurrency,
+        )
+
+        object_list = object_with_decimal_to_float(
+            [item for chunk_response in chunk_responses for item in chunk_response]
+        )
+        return self.__table._return_dict_of_pk_items_from_multiple_item_response(
+            object_list, return_as_dict_of_primary_keys
+        )
+
+    async def _batch_get_chunk(self, primary_keys: list) -> list:
+        client = await self._client()
+        items = list()
+        request_items = {
+            self.name: {"Keys": [_serialize_values(key) for key in primary_keys]}
+        }
+        for attempt in range(_max_batch_attempts):
+            if attempt:
+                await sleep(_retry_delay(attempt))
+            response = await client.batch_get_item(RequestItems=request_items)
+            items.extend(
+                _deserialize_values(item)
+                for item in response["Responses"].get(self.name, list())
+            )
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                return items
+        self.custom_exception.unprocessed_items(
+            [_deserialize_values(key) for key in request_items[self.name]["Keys"]]
+        )
+
+
+class AsyncDatabaseResourceController:
+    """
+    asyncio variant of DatabaseResourceController sharing one client among its tables
+
+    Use it as `async with AsyncDatabaseResourceController(...) as database_resource:`.
+    """
+
+    def __init__(self, config: dict = None, resource_config: dict = None, client=None):
+        self.__tables = dict()
+        self._config = config if config else {}
+        self._resource_config = resource_config if resource_config else False
+        self.__client = client
+        self.__exit_stack = None
+        self.__client_lock = None
+
+    async def __aenter__(self):
+        if self.__client is None:
+            # created lazily, before Python 3.10 a Lock binds to the loop current
+            # at its creation
+            if self.__client_lock is None:
+                self.__client_lock = Lock()
+            async with self.__client_lock:
+                if self.__client is None:
+                    self.__exit_stack, self.__client = await _open_client(
+                        self._resource_config
+                    )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self.__exit_stack is not None:
+            await self.__exit_stack.aclose()
+            self.__exit_stack = None
+            self.__client = None
+        self.__tables = dict()
+
+    def __getitem__(self, table_name: str) -> AsyncTable:
+        if self.__client is None:
+            raise RuntimeError(
+                "AsyncDatabaseResourceController must be entered with `async with` "
+                "before accessing tables"
+            )
+        if table_name not in self.__tables:
+            self.__tables[table_name] = AsyncTable(
+                table_name,
+                special_resource_config=self._resource_config,
+                config=self._config,
+                client=self.__client,
+            )
+
+        return self.__tables[table_name]
@@ -0,0 +1,212 @@
+from ._schema import load_schema_validator
+from ._wire_format import _serialize_values, deserialize_item
+from base64 import b64decode
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from gzip import open as gzip_open
+from itertools import islice
+from jsonschema.exceptions import ValidationError
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+import json
+
+__all__ = ["InputFormats", "import_table"]
+
+
+class InputFormats:
+    """
+    contains the line formats of Table.bulk_import
+    """
+
+    AUTO = "auto"
+    NDJSON = "ndjson"
+    DYNAMODB_JSON = "dynamodb_json"
+
+
+_input_formats = [InputFormats.AUTO, InputFormats.NDJSON, InputFormats.DYNAMODB_JSON]
+_input_suffixes = [".ndjson", ".jsonl", ".json"]
+
+
+def _input_files(path: Path) -> list:
+    if path.is_file():
+        return [path]
+    return sorted(
+        file
+        for file in path.iterdir()
+        if file.is_file()
+        and not file.name.endswith((".checkpoint.json", ".rejects.ndjson"))
+        and (
+            file.suffix in _input_suffixes
+            or (file.suffix == ".gz" and Path(file.stem).suffix in _input_suffixes)
+        )
+    )
+
+
+def _open_input_file(file: Path):
+    if file.suffix == ".gz":
+        return gzip_open(file, "rt", encoding="utf-8")
+    return open(file, encoding="utf-8")
+
+
+def _line_batches(files: list, lines_per_batch: int):
+    for file in files:
+        with _open_input_file(file) as f:
+            numbered_lines = enumerate(f, start=1)
+            while batch := list(islice(numbered_lines, lines_per_batch)):
+                yield str(file), batch
+
+
+class _LineConverter:
+    """
+    parse, validate and serialize the lines of an input file to PutRequests of the
+    low-level client
+    """
+
+    def __init__(self, schema_location: tuple, input_format: str):
+        self.validator = load_schema_validator(*schema_location)
+        self.input_format = input_format
+        self.property_types = {
+            name: property_schema.get("type")
+            for name, property_schema in self.validator.schema.get(
+                "properties", dict()
+            ).items()
+        }
+
+    def __call__(self, file: str, numbered_lines: list) -> (list, list):
+        write_requests, rejects = list(), list()
+        for line_number, line in numbered_lines:
+            if not line.strip():
+                continue
+            try:
+                write_requests.append({"PutRequest": {"Item": self.convert(line)}})
+            except (ValueError, TypeError, KeyError, ValidationError) as e:
+                rejects.append(
+                    {
+                        "file": file,
+                        "line": line_number,
+                        "error": getattr(e, "message", None) or repr(e),
+                        "data": line.rstrip("\n"),
+                    }
+                )
+        return write_requests, rejects
+
+    def convert(self, line: str) -> dict:
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise TypeError(f"expected an item object, got {type(data).__name__}")
+        if self.input_format == InputFormats.DYNAMODB_JSON or (
+            self.input_format == InputFormats.AUTO and list(data) == ["Item"]
+        ):
+            serialized = data["Item"]
+            self.validator.validate(deserialize_item(serialized))
+            return serialized
+
+        item = self.restore_exported_types(data)
+        self.validator.validate(item)
+        return _serialize_values(item)
+
+    def restore_exported_types(self, item: dict) -> dict:
+        # Table.export writes sets as lists and bytes as base64
+        for name, value in item.items():
+            property_type = self.property_types.get(name)
+            if property_type in ("stringSet", "numberSet") and isinstance(value, list):
+                item[name] = set(value)
+            elif property_type == "bytesSet" and isinstance(value, list):
+                item[name] = {b64decode(i) for i in value}
+            elif property_type == "bytes" and isinstance(value, str):
+                item[name] = b64decode(value)
+        return item
+
+
+_worker_converter = None
+
+
+def _initialize_worker(schema_location: tuple, input_format: str):
+    global _worker_converter
+    _worker_converter = _LineConverter(schema_location, input_format)
+
+
+def _convert_in_worker(file: str, numbered_lines: list) -> (list, list):
+    return _worker_converter(file, numbered_lines)
+
+
+def _converted_batches(batches, executor, converter, max_pending: int):
+    # keeps the order of the input and at most max_pending batches in flight
+    if executor is None:
+        for file, numbered_lines in batches:
+            yield converter(file, numbered_lines)
+        return
+
+    pending = deque()
+    for file, numbered_lines in batches:
+        pending.append(executor.submit(_convert_in_worker, file, numbered_lines))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def import_table(
+    table,
+    path,
+    input_format: str = InputFormats.AUTO,
+    processes: int = None,
+    max_workers: int = 4,
+    rejects_path=None,
+    lines_per_batch: int = 1000,
+) -> dict:
+    """
+    write the items of line-delimited files into the table (see Table.bulk_import)
+    """
+    if input_format not in _input_formats:
+        raise ValueError(
+            f"input_format must be one of {_input_formats}, got {input_format}"
+        )
+    path = Path(path)
+    files = _input_files(path)
+    if rejects_path is None:
+        rejects_path = path.with_name(f"{path.name}.rejects.ndjson")
+    if processes is None:
+        processes = cpu_count() or 1
+
+    statistics = {"items": 0, "rejected": 0, "rejects_path": None}
+    batches = _line_batches(files, lines_per_batch)
+    converter = _LineConverter(table._schema_location, input_format)
+    rejects_file = None
+    started = perf_counter()
+
+    def write_requests(executor):
+        nonlocal rejects_file
+        for requests, rejects in _converted_batches(
+            batches, executor, converter, processes * 2
+        ):
+            if rejects:
+                if rejects_file is None:
+                    rejects_file = open(rejects_path, "w", encoding="utf-8")
+                    statistics["rejects_path"] = str(rejects_path)
+                for reject in rejects:
+                    rejects_file.write(json.dumps(reject) + "\n")
+                statistics["rejected"] += len(rejects)
+            statistics["items"] += len(requests)
+            yield from requests
+
+    try:
+        if processes > 1:
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_initialize_worker,
+                initargs=(table._schema_location, input_format),
+            ) as executor:
+                table._batch_write(write_requests(executor), max_workers, True)
+        else:
+            table._batch_write(write_requests(None), max_workers, True)
+    finally:
+        if rejects_file is not None:
+            rejects_file.close()
+
+    statistics["seconds"] = perf_counter() - started
+    statistics["items_per_second"] = statistics["items"] / max(
+        statistics["seconds"], 1e-9
+    )
+    return statistics
@@ -1,10 +1,18 @@
-from aws_schema import SchemaValidator
 from aws_schema.nested_dict_helper import find_path_values_in_dict
 from ._number_types_in_objects import (
-    object_with_float_to_decimal,
+    copy_object_with_float_to_decimal,
     object_with_decimal_to_float,
 )
-from ._schema import DynamoDBValidator
+from ._coalescing import SingleFlight, MicroBatcher
+from ._wire_format import (
+    _serialize_values,
+    deserialize_item,
+    deserialize_response,
+    serialize_request,
+)
+from ._schema import load_schema_validator
+from .item_cache import ItemCache
+from .interceptors import Interceptor, InterceptorChain
 from .exceptions import (
     ConditionalCheckFailedException,
     AttributeExistsException,
@@ -12,10 +20,11 @@ from .exceptions import (
     ValidationError,
     CustomExceptionRaiser,
 )
-from inspect import stack
 from os import environ as os_environ
+from random import uniform
+from time import sleep
 from string import ascii_lowercase
-from boto3 import resource
+from boto3 import client, resource
 from boto3.dynamodb.conditions import (
     Key,
     And,
@@ -23,19 +32,20 @@ from boto3.dynamodb.conditions import (
     ConditionBase,
 )
 from botocore.exceptions import ClientError
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+from itertools import islice
+from queue import Queue, Full
+from threading import Event, Lock
 from typing import Iterable, List
 
-_ddb_resource = resource(
-    "dynamodb",
-    **{
-        "region_name": os_environ["AWS_REGION"]
-        if "AWS_REGION" in os_environ
-        else "us-east-1"
-    },
-)
+_ddb_resource = None
+_ddb_resource_lock = Lock()
+_shared_resources = dict()
+_ddb_client = None
+_shared_clients = dict()
 
-__all__ = ["Table", "UpdateReturns", "SelectReturns"]
+__all__ = ["Table", "UpdateReturns", "SelectReturns", "expression_cache_info"]
 
 
 class UpdateReturns:
@@ -62,6 +72,22 @@ class SelectReturns:
     COUNT = "COUNT"
 
 
+class _ValidationModes:
+    """
+    contains the kinds of input Table._validate_input checks
+    """
+
+    FULL_ITEM = "FULL_ITEM"
+    SUB_PART = "SUB_PART"
+    REMOVAL = "REMOVAL"
+    KEY = "KEY"
+
+
+_batch_get_limit = 100
+_batch_write_limit = 25
+_max_batch_attempts = 8
+_expression_cache_size = 1024
+
 _value_update_chars = list()
 for c1 in ascii_lowercase:
     for c2 in ascii_lowercase:
@@ -82,6 +108,262 @@ def _cast_table_name(table_name: str, config: dict = None) -> str:
     return "-".join(name_components)
 
 
+def _uses_memory_backend(resource_config: dict) -> bool:
+    return resource_config.get("region_name") == "memory"
+
+
+def _create_resource(resource_config: dict):
+    ddb = resource("dynamodb", **resource_config)
+    if _uses_memory_backend(resource_config):
+        from .memory_backend import attach_memory_backend
+
+        attach_memory_backend(ddb.meta.client)
+    return ddb
+
+
+def _create_client(resource_config: dict):
+    ddb_client = client("dynamodb", **resource_config)
+    if _uses_memory_backend(resource_config):
+        from .memory_backend import attach_memory_backend
+
+        attach_memory_backend(ddb_client)
+    return ddb_client
+
+
+def _default_resource():
+    global _ddb_resource
+    if _ddb_resource is None:
+        with _ddb_resource_lock:
+            if _ddb_resource is None:
+                _ddb_resource = _create_resource(
+                    {
+                        "region_name": os_environ["AWS_REGION"]
+                        if "AWS_REGION" in os_environ
+                        else "us-east-1"
+                    }
+                )
+    return _ddb_resource
+
+
+def _default_client():
+    global _ddb_client
+    if _ddb_client is None:
+        with _ddb_resource_lock:
+            if _ddb_client is None:
+                _ddb_client = _create_client(
+                    {
+                        "region_name": os_environ["AWS_REGION"]
+                        if "AWS_REGION" in os_environ
+                        else "us-east-1"
+                    }
+                )
+    return _ddb_client
+
+
+def _resource_key(resource_config: dict) -> str:
+    return repr(
+        sorted(
+            (
+                key,
+                sorted(getattr(value, "_user_provided_options", dict()).items())
+                if key == "config"
+                else value,
+            )
+            for key, value in resource_config.items()
+        )
+    )
+
+
+def _shared_resource(resource_config: dict):
+    key = _resource_key(resource_config)
+    if key not in _shared_resources:
+        with _ddb_resource_lock:
+            if key not in _shared_resources:
+                _shared_resources[key] = _create_resource(resource_config)
+    return _shared_resources[key]
+
+
+def _shared_client(resource_config: dict):
+    key = _resource_key(resource_config)
+    if key not in _shared_clients:
+        with _ddb_resource_lock:
+            if key not in _shared_clients:
+                _shared_clients[key] = _create_client(resource_config)
+    return _shared_clients[key]
+
+
+def _schema_location(table_name: str, config: dict = None) -> (str, str):
+    if config is None:
+        config = dict()
+    origin = (
+        config["origin"].lower()
+        if "origin" in config
+        else os_environ["DYNAMO_DB_RESOURCE_SCHEMA_ORIGIN"].lower()
+    )
+    directory = (
+        config["directory"]
+        if "directory" in config
+        else os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"]
+    )
+    return origin, directory + table_name
+
+
+def _chunk(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _unique_key_chunks(write_requests: Iterable, size: int, key) -> Iterable[list]:
+    """
+    chunk write requests by size, keeping only the last request of a key per chunk
+
+    A BatchWriteItem request must not contain a primary key twice.
+    """
+    chunk = dict()
+    for write_request in write_requests:
+        request_key = key(write_request)
+        chunk.pop(request_key, None)
+        chunk[request_key] = write_request
+        if len(chunk) == size:
+            yield list(chunk.values())
+            chunk = dict()
+    if chunk:
+        yield list(chunk.values())
+
+
+def _retry_delay(attempt: int, base: float = 0.05, cap: float = 5.0) -> float:
+    return uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _sleep_before_retry(attempt: int, base: float = 0.05, cap: float = 5.0):
+    sleep(_retry_delay(attempt, base, cap))
+
+
+def _batch_get_with_retries(batch_get_item, request_items: dict) -> (dict, dict):
+    """
+    request the items of one BatchGetItem request, retrying its unprocessed keys
+
+    Parameters
+    ----------
+    batch_get_item: callable
+        batch_get_item of a boto3 resource or client, possibly intercepted
+    request_items: dict
+        RequestItems of the request
+
+    Returns
+    -------
+    dict, dict
+        the loaded items per table name and the keys still unprocessed per table name
+
+    """
+    responses = dict()
+    for attempt in range(_max_batch_attempts):
+        if attempt:
+            _sleep_before_retry(attempt)
+        response = batch_get_item(RequestItems=request_items)
+        for table_name, items in response["Responses"].items():
+            responses.setdefault(table_name, list()).extend(items)
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return responses, dict()
+    return responses, request_items
+
+
+@lru_cache(maxsize=_expression_cache_size)
+def _compile_remove_expression(
+    paths_to_attributes: tuple,
+    list_position_if_list: (int, None),
+    bind_set_items: bool,
+    delete_set_items: bool,
+) -> (str, tuple):
+    expression = "remove " if not delete_set_items else "delete "
+    attribute_key_mapping = dict()
+
+    for path_no, path in enumerate(paths_to_attributes):
+        for attribute in path:
+            if attribute not in attribute_key_mapping:
+                attribute_key_mapping[
+                    attribute
+                ] = f"#{_value_update_chars[len(attribute_key_mapping)].upper()}"
+            expression += f"{attribute_key_mapping[attribute]}."
+        expression = expression[:-1]
+        if bind_set_items:
+            expression += f" :{_value_update_chars[path_no]}"
+        expression += ", "
+
+    expression = expression[:-2]
+
+    if list_position_if_list is not None:
+        expression += f"[{list_position_if_list}]"
+
+    return expression, tuple((v, k) for k, v in attribute_key_mapping.items())
+
+
+@lru_cache(maxsize=_expression_cache_size)
+def _compile_update_expression(
+    expression_type: str,
+    paths_to_new_data: tuple,
+    list_operation: tuple,
+    set_operation: tuple,
+    value_operation: tuple,
+) -> (str, tuple):
+    expression = expression_type
+    attribute_key_mapping = dict()
+
+    for path_no, path in enumerate(paths_to_new_data):
+        for attribute in path:
+            if attribute not in attribute_key_mapping:
+                attribute_key_mapping[
+                    attribute
+                ] = f"#{_value_update_chars[len(attribute_key_mapping)].upper()}"
+        string_path_to_attribute = ".".join(
+            [attribute_key_mapping[attribute] for attribute in path]
+        )
+        value_key = f":{_value_update_chars[path_no]}"
+
+        if list_operation[path_no]:
+            operation = f"= list_append({string_path_to_attribute}, {value_key})"
+        elif set_operation[path_no]:
+            operation = value_key
+        elif value_operation[path_no]:
+            operation = f"= {string_path_to_attribute} + {value_key}"
+        else:
+            operation = f"= {value_key}"
+
+        expression += f"{string_path_to_attribute} {operation}, "
+
+    return expression[:-2], tuple((v, k) for k, v in attribute_key_mapping.items())
+
+
+def expression_cache_info() -> dict:
+    """
+    hits and misses of the compiled update and remove expressions
+
+    The caches are shared by all Tables of the process, so are their counters.
+
+    Returns
+    -------
+    dict
+        the functools cache info of the "update" and "remove" expressions
+
+    """
+    return {
+        "update": _compile_update_expression.cache_info(),
+        "remove": _compile_remove_expression.cache_info(),
+    }
+
+
+def _misses_parent_attribute(item: dict, paths: list) -> bool:
+    for path in paths:
+        sub_item = item
+        for key in path[:-1]:
+            if not isinstance(sub_item, dict) or key not in sub_item:
+                return True
+            sub_item = sub_item[key]
+    return False
+
+
 def _combine_and_conditions(conditions: list):
     if len(conditions) == 1:
         con = conditions[0]
@@ -91,37 +373,63 @@ def _combine_and_conditions(conditions: list):
     return ConditionExpressionBuilder().build_expression(con)
 
 
+def _expand_condition_expression(request: dict) -> dict:
+    if not isinstance(request.get("ConditionExpression"), ConditionBase):
+        return request
+    request = request.copy()
+    (
+        request["ConditionExpression"],
+        names,
+        values,
+    ) = ConditionExpressionBuilder().build_expression(request["ConditionExpression"])
+    if names:
+        request["ExpressionAttributeNames"] = {
+            **request.get("ExpressionAttributeNames", dict()),
+            **names,
+        }
+    if values:
+        request["ExpressionAttributeValues"] = {
+            **request.get("ExpressionAttributeValues", dict()),
+            **values,
+        }
+    return request
+
+
 class Table:
     def __init__(
-        self, table_name, special_resource_config: dict = False, config: dict = None
+        self,
+        table_name,
+        special_resource_config: dict = False,
+        config: dict = None,
+        item_cache: ItemCache = None,
+        coalesce_gets: bool = False,
+        get_batch_window: float = None,
+        upsert_mode: bool = False,
+        fast_deserialization: bool = False,
+        interceptors: Iterable[Interceptor] = None,
     ):
         self.__table_name = table_name
         self._config = config if config else {}
         self.__custom_exception_raiser = CustomExceptionRaiser(self)
 
-        origin = (
-            self._config["origin"].lower()
-            if "origin" in self._config
-            else os_environ["DYNAMO_DB_RESOURCE_SCHEMA_ORIGIN"].lower()
-        )
-        directory = (
-            self._config["directory"]
-            if "directory" in self._config
-            else os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"]
+        self._schema_location = _schema_location(table_name, self._config)
+        self.__schema_validator = load_schema_validator(*self._schema_location)
+
+        self.__special_resource_config = special_resource_config
+        self.__resource = None
+        self.__client = None
+        self.__table = None
+        self.__item_cache = item_cache
+        self.__upsert_mode = upsert_mode
+        self.__fast_deserialization = fast_deserialization
+        self.__interceptors = InterceptorChain(interceptors) if interceptors else None
+        self.__single_flight = SingleFlight() if coalesce_gets else None
+        self.__get_batcher = (
+            MicroBatcher(self.__load_batch_of_items, get_batch_window)
+            if get_batch_window is not None
+            else None
         )
-        directory += self.__table_name
-        self.__schema_validator = SchemaValidator(
-            **{origin: directory}, custom_validator=DynamoDBValidator
-        )
-
-        if special_resource_config:
-            self.__resource = resource("dynamodb", **special_resource_config)
-            self.__resource_config = special_resource_config
-        else:
-            self.__resource = _ddb_resource
-            self.__resource_config = {"region_name": os_environ["AWS_REGION"]}
         self.__table_name = _cast_table_name(table_name, self._config)
-        self.__table = self.__resource.Table(self.__table_name)
         self._cast_indexes()
 
     @property
@@ -141,8 +449,28 @@ class Table:
     def schema(self):
         return self.__schema_validator.schema
 
+    @property
+    def _resource(self):
+        if self.__resource is None:
+            if self.__special_resource_config:
+                self.__resource = _shared_resource(self.__special_resource_config)
+            else:
+                self.__resource = _default_resource()
+        return self.__resource
+
+    @property
+    def _client(self):
+        if self.__client is None:
+            if self.__special_resource_config:
+                self.__client = _shared_client(self.__special_resource_config)
+            else:
+                self.__client = _default_client()
+        return self.__client
+
     @property
     def table(self):
+        if self.__table is None:
+            self.__table = self._resource.Table(self.__table_name)
         return self.__table
 
     @property
@@ -153,6 +481,17 @@ class Table:
     def custom_exception(self):
         return self.__custom_exception_raiser
 
+    @property
+    def item_cache(self) -> ItemCache:
+        return self.__item_cache
+
+    @property
+    def expression_cache_info(self) -> dict:
+        """
+        the counters of the process-wide expression caches, see expression_cache_info
+        """
+        return expression_cache_info()
+
     def _cast_indexes(self):
         self.__indexes = dict()
         for k in ["LocalSecondaryIndexes", "GlobalSecondaryIndexes"]:
@@ -204,21 +543,17 @@ class Table:
                     casted_keys.append(dict(zip(self.pk, i)))
         return casted_keys
 
-    def _validate_input(self, given_input):
-        function_name = stack()[1].function
-        if any([i in function_name for i in ["update", "add"]]):
+    def _validate_input(self, given_input, mode: str = _ValidationModes.KEY):
+        if mode == _ValidationModes.SUB_PART:
             try:
                 self.__schema_validator.validate_sub_part(given_input)
             except ValidationError as e:
                 self.custom_exception.wrong_data_type(e)
 
-        elif "put" == function_name:
-            try:
-                self.__schema_validator.validate(given_input)
-            except ValidationError as e:
-                self.custom_exception.wrong_data_type(e)
+        elif mode == _ValidationModes.FULL_ITEM:
+            self._validate_item(given_input)
 
-        elif "remove_attribute" == function_name:
+        elif mode == _ValidationModes.REMOVAL:
             for path in given_input:
                 path_to_attribute = path[:-1]
                 attribute = path[-1]
@@ -232,6 +567,12 @@ class Table:
         else:
             self._primary_key_checker(given_input)
 
+    def _validate_item(self, item):
+        try:
+            self.__schema_validator.validate(item)
+        except ValidationError as e:
+            self.custom_exception.wrong_data_type(e)
+
     def _primary_key_checker(self, given_primaries):
         if not all(pk in given_primaries for pk in self.pk):
             self.custom_exception.missing_primary_key(
@@ -303,12 +644,44 @@ class Table:
         return ",".join(attribute_expressions), attribute_expression_map
 
     def describe(self):
-        from boto3 import client
-
-        dynamo_db_client = client("dynamodb", **self.__resource_config)
-        response = dynamo_db_client.describe_table(TableName=self.__table_name)
+        response = self._resource.meta.client.describe_table(
+            TableName=self.__table_name
+        )
         return response
 
+    def _intercepted(self, operation: str, function, table_name: str = None):
+        """
+        the boto3 function sending the operation, wrapped by the interceptors if any
+        """
+        if self.__interceptors is None:
+            return function
+        return self.__interceptors.wrap(
+            operation, table_name or self.__table_name, function, self.pk
+        )
+
+    def _read(self, operation: str, request: dict) -> dict:
+        """
+        send a read request of the Table resource or, if fast_deserialization, of the
+        low-level client deserializing the wire format directly into native values
+        """
+        if not self.__fast_deserialization:
+            return self._intercepted(operation, getattr(self.table, operation))(
+                **request
+            )
+
+        def read(**request):
+            response = getattr(self._client, operation)(
+                TableName=self.__table_name, **serialize_request(request)
+            )
+            return deserialize_response(response)
+
+        return self._intercepted(operation, read)(**request)
+
+    def _to_native(self, data):
+        if self.__fast_deserialization:
+            return data
+        return object_with_decimal_to_float(data)
+
     def get(self, attributes_to_get: list = None, **primary_dict):
         """
         get item specified with primary_dict
@@ -325,6 +698,65 @@ class Table:
         dict
 
         """
+        if self.__item_cache is None:
+            return self.__load_item(attributes_to_get, primary_dict)
+
+        self._primary_key_checker(primary_dict)
+        cache_key = self.__item_cache.key(
+            self._primary_values(primary_dict), attributes_to_get or None
+        )
+        if (item := self.__item_cache.get(cache_key)) is not None:
+            return item
+
+        generation = self.__item_cache.generation
+        item = self.__load_item(attributes_to_get, primary_dict)
+        self.__item_cache.set(cache_key, item, generation)
+        return item
+
+    def __load_item(self, attributes_to_get: list, primary_dict: dict):
+        def get_item():
+            response = self._read(
+                "get_item", self._create_get_request(attributes_to_get, primary_dict)
+            )
+            return self._handle_get_response(response, primary_dict)
+
+        if self.__get_batcher is None and self.__single_flight is None:
+            return get_item()
+
+        self._primary_key_checker(primary_dict)
+        primary_values = self._primary_values(primary_dict)
+        if self.__get_batcher is not None and not attributes_to_get:
+            item = self.__get_batcher.load(primary_values)
+            if item is None:
+                self.custom_exception.not_found_message(primary_dict)
+            return item
+        if self.__single_flight is not None:
+            return self.__single_flight.do(
+                ItemCache.key(primary_values, attributes_to_get or None), get_item
+            )
+        return get_item()
+
+    def __load_batch_of_items(self, primary_values: list) -> dict:
+        items = list()
+        for chunk in _chunk(primary_values, _batch_get_limit):
+            items.extend(
+                self._batch_get_chunk(
+                    [dict(zip(self.pk, values)) for values in chunk]
+                )
+            )
+        return {
+            self._primary_values(item): item
+            for item in self._to_native(items)
+        }
+
+    def _primary_values(self, primary_dict: dict) -> tuple:
+        return tuple(primary_dict[key] for key in self.pk)
+
+    def _invalidate_cached_item(self, primary_dict: dict):
+        if self.__item_cache is not None:
+            self.__item_cache.invalidate(self._primary_values(primary_dict))
+
+    def _create_get_request(self, attributes_to_get: list, primary_dict: dict) -> dict:
         self._primary_key_checker(primary_dict)
 
         get_data = {"Key": primary_dict}
@@ -336,18 +768,16 @@ class Table:
                     "ExpressionAttributeNames": name_map,
                 }
             )
+        return get_data
 
-        response = self.__table.get_item(**get_data)
-
+    def _handle_get_response(self, response: dict, primary_dict: dict):
         if "Item" not in response:
             self.custom_exception.not_found_message(primary_dict)
         else:
             try:
-                return object_with_decimal_to_float(response["Item"])
+                return self._to_native(response["Item"])
             except KeyError:
-                return [
-                    object_with_decimal_to_float(item) for item in response["Items"]
-                ]
+                return [self._to_native(item) for item in response["Items"]]
 
     @staticmethod
     def _create_remove_expression(
@@ -355,44 +785,23 @@ class Table:
         list_position_if_list: int = None,
         set_items_if_set: list = None,
     ):
+        expression, attribute_name_map = _compile_remove_expression(
+            tuple(tuple(path) for path in path_to_attribute),
+            list_position_if_list,
+            set_items_if_set is not None,
+            bool(set_items_if_set),
+        )
 
-        expression = "remove " if not set_items_if_set else "delete "
-        attribute_key_mapping = dict()
         expression_values = dict()
-        letter_count = 0
-
-        def assign_key_to_attribute_path_step(attribute_name, letter_count):
-            if attribute_name not in attribute_key_mapping:
-                attribute_key_mapping[
-                    attribute_name
-                ] = f"#{_value_update_chars[letter_count].upper()}"
-                letter_count += 1
-            return letter_count
-
-        for path_no, path in enumerate(path_to_attribute):
-            for attribute in path:
-                letter_count = assign_key_to_attribute_path_step(
-                    attribute, letter_count
+        if set_items_if_set is not None:
+            expression_values = {
+                f":{_value_update_chars[path_no]}": copy_object_with_float_to_decimal(
+                    set_items_if_set[path_no]
                 )
-                expression += f"{attribute_key_mapping[attribute]}."
-            expression = expression[:-1]
-            if set_items_if_set is not None:
-                expression += f" :{_value_update_chars[path_no]}"
-                expression_values[
-                    f":{_value_update_chars[path_no]}"
-                ] = object_with_float_to_decimal(set_items_if_set[path_no])
-            expression += ", "
+                for path_no in range(len(path_to_attribute))
+            }
 
-        expression = expression[:-2]
-
-        if list_position_if_list is not None:
-            expression += f"[{list_position_if_list}]"
-
-        return (
-            expression,
-            expression_values,
-            {v: k for k, v in attribute_key_mapping.items()},
-        )
+        return expression, expression_values, dict(attribute_name_map)
 
     @staticmethod
     def _create_update_expression(
@@ -404,13 +813,10 @@ class Table:
         set_operation: (bool, set) = False,
         value_operation: bool = False,
     ):
-        expression = "set " if (value_operation or not set_operation) else "add "
-        expression_values = dict()
+        expression_type = "set " if (value_operation or not set_operation) else "add "
 
         if not paths_to_new_data or not values_per_path:
-            paths_to_new_data, values_per_path = find_path_values_in_dict(
-                deepcopy(new_data)
-            )
+            paths_to_new_data, values_per_path = find_path_values_in_dict(new_data)
 
         if isinstance(list_operation, bool):
             list_operation = [list_operation for i in paths_to_new_data]
@@ -419,65 +825,25 @@ class Table:
         if isinstance(value_operation, bool):
             value_operation = [value_operation for i in paths_to_new_data]
 
-        attribute_key_mapping = dict()
-        letters_used = 0
-
-        def update_expression_attribute():
-            if list_operation[path_no]:
-                return f"= list_append({string_path_to_attribute}, :{_value_update_chars[path_no]})"
-            if set_operation[path_no]:
-                return f":{_value_update_chars[path_no]}"
-            if value_operation[path_no]:
-                return f"= {string_path_to_attribute} + :{_value_update_chars[path_no]}"
-            return f"= :{_value_update_chars[path_no]}"
-
-        def update_expression_value():
-            expression_values[
-                f":{_value_update_chars[path_no]}"
-            ] = object_with_float_to_decimal(values_per_path[path_no])
-
-        def assign_key_to_attribute_path_step(attribute_name, letter_count):
-            if attribute_name not in attribute_key_mapping:
-                attribute_key_mapping[
-                    attribute_name
-                ] = f"#{_value_update_chars[letter_count].upper()}"
-                letter_count += 1
-            return letter_count
-
-        def create_path_to_attribute_with_mapped_keys(
-            left_path_to_process, path_with_keys, letter_count
-        ):
-            for step in left_path_to_process:
-                letter_count = assign_key_to_attribute_path_step(step, letter_count)
-
-                path_with_keys.append(attribute_key_mapping[step])
-
-            return path_with_keys, letter_count
-
-        for path_no in range(len(paths_to_new_data)):
-            path = paths_to_new_data[path_no]
-
-            path_with_letter_keys = list()
-
-            (
-                path_with_letter_keys,
-                letters_used,
-            ) = create_path_to_attribute_with_mapped_keys(
-                path, path_with_letter_keys, letters_used
-            )
-
-            string_path_to_attribute = ".".join(path_with_letter_keys)
+        expression, attribute_name_map = _compile_update_expression(
+            expression_type,
+            tuple(tuple(path) for path in paths_to_new_data),
+            tuple(bool(i) for i in list_operation[: len(paths_to_new_data)]),
+            tuple(bool(i) for i in set_operation[: len(paths_to_new_data)]),
+            tuple(bool(i) for i in value_operation[: len(paths_to_new_data)]),
+        )
 
-            expression += (
-                f"{string_path_to_attribute} {update_expression_attribute()}, "
+        expression_values = {
+            f":{_value_update_chars[path_no]}": copy_object_with_float_to_decimal(
+                values_per_path[path_no]
             )
-
-            update_expression_value()
+            for path_no in range(len(paths_to_new_data))
+        }
 
         return (
-            expression[:-2],
+            expression,
             expression_values,
-            {v: k for k, v in attribute_key_mapping.items()},
+            dict(attribute_name_map),
             paths_to_new_data,
         )
 
@@ -531,7 +897,7 @@ class Table:
 
         return " and ".join(conditions), att_map, val_map
 
-    def __general_update(
+    def _create_update_request(
         self,
         *,
         require_attributes_already_present=False,
@@ -546,12 +912,13 @@ class Table:
         remove_set_item=None,
         remove_list_item=None,
         direct_condition=None,
-        **primary_dict,
-    ):
+        require_parents_present=False,
+        primary_dict: dict,
+    ) -> dict:
         self._primary_key_checker(primary_dict)
 
         if new_data:
-            self._validate_input(new_data)
+            self._validate_input(new_data, _ValidationModes.SUB_PART)
             # ToDo create condition for attribute still required length if schema contains maxItems/maxProperties
             (
                 update_expression,
@@ -579,6 +946,13 @@ class Table:
         necessary_attribute_paths = list()
         if require_attributes_already_present:
             necessary_attribute_paths = paths_to_data
+        elif require_parents_present:
+            necessary_attribute_paths = [
+                list(parent)
+                for parent in dict.fromkeys(
+                    tuple(path[:-1]) for path in paths_to_data if len(path) > 1
+                )
+            ]
         if not create_item_if_non_existent:
             for k in self.pk:
                 _expression_name_key = _value_update_chars[len(expression_name_map)]
@@ -610,7 +984,15 @@ class Table:
         for key, value in update_dict.copy().items():
             if not value:
                 update_dict.pop(key)
+        return update_dict
 
+    @staticmethod
+    def _handle_update_response(
+        response: dict,
+        returns: UpdateReturns,
+        remove_data: list = None,
+        remove_list_item: int = None,
+    ):
         def return_only_deleted(resp):
             return_data = [resp for _ in remove_data]
             for index, rd in enumerate(return_data):
@@ -627,49 +1009,161 @@ class Table:
                 [resp] = resp
             return resp
 
-        def handle_response(resp):
-            if "Attributes" in resp:
-                resp = object_with_decimal_to_float(resp["Attributes"])
-                if returns == UpdateReturns.DELETED and remove_data:
-                    resp = return_only_deleted(resp)
-                return resp
+        if "Attributes" in response:
+            response = object_with_decimal_to_float(response["Attributes"])
+            if returns == UpdateReturns.DELETED and remove_data:
+                response = return_only_deleted(response)
+            return response
+
+    @staticmethod
+    def _is_invalid_document_path(
+        client_error: ClientError, require_attributes_already_present: bool
+    ) -> bool:
+        message = client_error.response["Error"]["Message"]
+        return (
+            "document path provided in the update expression is invalid for update"
+            in message
+            or (
+                "provided expression refers to an attribute that does not exist in the item"
+                in message
+                and not require_attributes_already_present
+            )
+        )
+
+    def _create_new_paths_update_request(
+        self,
+        item: dict,
+        new_data: dict,
+        returns: UpdateReturns,
+        primary_dict: dict,
+        direct_condition=None,
+    ) -> dict:
+        from aws_schema.nested_dict_helper import find_new_paths_in_dict
+
+        path_dict, new_sub_dict = find_new_paths_in_dict(item, new_data)
+        (
+            expression,
+            values,
+            expression_name_map,
+            _,
+        ) = self._create_update_expression(
+            paths_to_new_data=path_dict, values_per_path=new_sub_dict
+        )
+        update_dict = {
+            "Key": primary_dict,
+            "UpdateExpression": expression,
+            "ExpressionAttributeValues": values,
+            "ExpressionAttributeNames": expression_name_map,
+            "ReturnValues": returns,
+        }
+        if direct_condition:
+            condition, names, condition_values = self._build_conditions(
+                None, None, expression_name_map, direct_condition
+            )
+            update_dict["ConditionExpression"] = condition
+            update_dict["ExpressionAttributeNames"].update(names)
+            update_dict["ExpressionAttributeValues"].update(condition_values)
+        return update_dict
+
+    @staticmethod
+    def _raise_failed_attribute_condition(require_attributes_already_present: bool):
+        # ToDo check for min/max Items/Properties once condition based on schema implemented
+        if require_attributes_already_present:
+            raise AttributeNotExistsException
+        else:
+            raise AttributeExistsException
+
+    def __general_update(
+        self,
+        *,
+        require_attributes_already_present=False,
+        require_attributes_to_be_missing=False,
+        create_item_if_non_existent,
+        list_operation=False,
+        set_operation=False,
+        value_operation=False,
+        returns: UpdateReturns = UpdateReturns.NONE,
+        new_data=None,
+        remove_data=None,
+        remove_set_item=None,
+        remove_list_item=None,
+        direct_condition=None,
+        **primary_dict,
+    ):
+        upsert = self.__upsert_mode and bool(new_data)
+        update_dict = self._create_update_request(
+            require_attributes_already_present=require_attributes_already_present,
+            require_attributes_to_be_missing=require_attributes_to_be_missing,
+            create_item_if_non_existent=create_item_if_non_existent,
+            list_operation=list_operation,
+            set_operation=set_operation,
+            value_operation=value_operation,
+            returns=returns,
+            new_data=new_data,
+            remove_data=remove_data,
+            remove_set_item=remove_set_item,
+            remove_list_item=remove_list_item,
+            direct_condition=direct_condition,
+            require_parents_present=upsert,
+            primary_dict=primary_dict,
+        )
+        if upsert and "ConditionExpression" in update_dict:
+            update_dict["ReturnValuesOnConditionCheckFailure"] = UpdateReturns.ALL_OLD
+
+        # the fallbacks of __update_item must not read a cached item
+        self._invalidate_cached_item(primary_dict)
+        try:
+            return self.__update_item(
+                update_dict,
+                require_attributes_already_present=require_attributes_already_present,
+                create_item_if_non_existent=create_item_if_non_existent,
+                returns=returns,
+                new_data=new_data,
+                remove_data=remove_data,
+                remove_list_item=remove_list_item,
+                direct_condition=direct_condition,
+                upsert=upsert,
+                primary_dict=primary_dict,
+            )
+        finally:
+            self._invalidate_cached_item(primary_dict)
 
+    def __update_item(
+        self,
+        update_dict: dict,
+        *,
+        require_attributes_already_present,
+        create_item_if_non_existent,
+        returns,
+        new_data,
+        remove_data,
+        remove_list_item,
+        direct_condition,
+        upsert,
+        primary_dict: dict,
+    ):
         try:
-            response = self.__table.update_item(**update_dict)
-            return handle_response(response)
+            response = self._intercepted("update_item", self.table.update_item)(
+                **update_dict
+            )
+            return self._handle_update_response(
+                response, returns, remove_data, remove_list_item
+            )
         except ClientError as CE:
             if CE.response["Error"]["Code"] == "ValidationException":
-                if "document path provided in the update expression is invalid for update" in CE.response[
-                    "Error"
-                ][
-                    "Message"
-                ] or (
-                    "provided expression refers to an attribute that does not exist in the item"
-                    in CE.response["Error"]["Message"]
-                    and not require_attributes_already_present
+                if self._is_invalid_document_path(
+                    CE, require_attributes_already_present
                 ):
-                    from aws_schema.nested_dict_helper import find_new_paths_in_dict
-
                     try:
                         item = self.get(**primary_dict)
-                        path_dict, new_sub_dict = find_new_paths_in_dict(item, new_data)
-                        (
-                            expression,
-                            values,
-                            expression_name_map,
-                            _,
-                        ) = self._create_update_expression(
-                            paths_to_new_data=path_dict, values_per_path=new_sub_dict
+                        response = self._intercepted(
+                            "update_item", self.table.update_item
+                        )(
+                            **self._create_new_paths_update_request(
+                                item, new_data, returns, primary_dict
+                            )
                         )
-                        update_dict = {
-                            "Key": primary_dict,
-                            "UpdateExpression": expression,
-                            "ExpressionAttributeValues": values,
-                            "ExpressionAttributeNames": expression_name_map,
-                            "ReturnValues": returns,
-                        }
-                        response = self.__table.update_item(**update_dict)
-                        return handle_response(response)
+                        return self._handle_update_response(response, returns)
                     except FileNotFoundError as FNF:
                         if create_item_if_non_existent:
                             item = primary_dict.copy()
@@ -679,15 +1173,23 @@ class Table:
                             raise FNF
 
             elif CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                if upsert:
+                    return self.__handle_failed_upsert(
+                        CE,
+                        require_attributes_already_present=require_attributes_already_present,
+                        create_item_if_non_existent=create_item_if_non_existent,
+                        returns=returns,
+                        new_data=new_data,
+                        direct_condition=direct_condition,
+                        primary_dict=primary_dict,
+                    )
                 try:
-                    # ToDo check for min/max Items/Properties once condition based on schema implemented
                     if direct_condition:
                         raise ConditionalCheckFailedException
                     self.get(**primary_dict)
-                    if require_attributes_already_present:
-                        raise AttributeNotExistsException
-                    else:
-                        raise AttributeExistsException
+                    self._raise_failed_attribute_condition(
+                        require_attributes_already_present
+                    )
                 except FileNotFoundError as FNF:
                     if create_item_if_non_existent:
                         item = primary_dict.copy()
@@ -713,6 +1215,64 @@ class Table:
         #             raise FNF
         #     raise AE
 
+    def __handle_failed_upsert(
+        self,
+        client_error: ClientError,
+        *,
+        require_attributes_already_present,
+        create_item_if_non_existent,
+        returns,
+        new_data,
+        direct_condition,
+        primary_dict: dict,
+    ):
+        item = self.__item_of_failed_condition(client_error, primary_dict)
+        if item is None:
+            if direct_condition:
+                raise ConditionalCheckFailedException
+            if not create_item_if_non_existent:
+                self.custom_exception.not_found_message(primary_dict)
+            item = primary_dict.copy()
+            item.update(new_data)
+            return self.put(item)
+
+        if not require_attributes_already_present and _misses_parent_attribute(
+            item, find_path_values_in_dict(new_data)[0]
+        ):
+            try:
+                response = self._intercepted("update_item", self.table.update_item)(
+                    **self._create_new_paths_update_request(
+                        item, new_data, returns, primary_dict, direct_condition
+                    )
+                )
+            except ClientError as CE:
+                if CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    raise ConditionalCheckFailedException
+                raise CE
+            return self._handle_update_response(response, returns)
+
+        if direct_condition:
+            raise ConditionalCheckFailedException
+        self._raise_failed_attribute_condition(require_attributes_already_present)
+
+    def __item_of_failed_condition(self, client_error: ClientError, primary_dict):
+        if "Item" in client_error.response:
+            from boto3.dynamodb.types import TypeDeserializer
+
+            deserializer = TypeDeserializer()
+            return object_with_decimal_to_float(
+                {
+                    key: deserializer.deserialize(value)
+                    for key, value in client_error.response["Item"].items()
+                }
+            )
+        # the failing request returns no item if it did not exist or if the
+        # implementation ignores ReturnValuesOnConditionCheckFailure
+        try:
+            return self.get(**primary_dict)
+        except FileNotFoundError:
+            return None
+
     # https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/Expressions.UpdateExpressions.html
     def add_new_attribute(
         self,
@@ -723,7 +1283,7 @@ class Table:
         condition=None,
         **primary_dict,
     ):
-        self._validate_input(new_data)
+        self._validate_input(new_data, _ValidationModes.SUB_PART)
         return self.__general_update(
             **primary_dict,
             new_data=new_data,
@@ -819,23 +1379,219 @@ class Table:
             returns=returns,
         )
 
+    def transaction(self, allow_chunking: bool = False):
+        """
+        collect writes on this table for committing them in one TransactWriteItems call
+
+        Parameters
+        ----------
+        allow_chunking: bool
+            split more than 100 actions into several transactions
+
+        Returns
+        -------
+        TransactionTable
+            the write methods of Table adding actions, committed with commit() or on
+            leaving the `with` block
+
+        """
+        from .transaction import Transaction
+
+        return Transaction(self._resource, allow_chunking)[self]
+
     def put(self, item, overwrite=False):
-        self._validate_input(item)
+        put_data = self._create_put_request(item, overwrite)
 
         try:
-            item_copy = deepcopy(item)
-            self.__table.put_item(
-                Item=object_with_float_to_decimal(item_copy),
-                ConditionExpression=self._item_not_exists_condition,
-            ) if not overwrite else self.__table.put_item(
-                Item=object_with_float_to_decimal(item_copy)
-            )
+            self._intercepted("put_item", self.table.put_item)(**put_data)
 
         except ClientError as CE:
             if CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
                 self.custom_exception.item_already_existing(item)
             else:
                 raise CE
+        finally:
+            self._invalidate_cached_item(item)
+
+    def _create_put_request(self, item: dict, overwrite: bool) -> dict:
+        self._validate_input(item, _ValidationModes.FULL_ITEM)
+
+        put_data = {"Item": copy_object_with_float_to_decimal(item)}
+        if not overwrite:
+            put_data["ConditionExpression"] = self._item_not_exists_condition
+        return put_data
+
+    def batch_put(self, items: Iterable, max_workers: int = 1):
+        """
+        put (and overwrite) all given items in requests of 25 items
+
+        Of several items with the same primary key within a request only the last one
+        is written.
+
+        Parameters
+        ----------
+        items: Iterable
+            items to write, each validated against the schema before being sent
+        max_workers: int
+            number of threads writing requests concurrently
+
+        """
+
+        def put_requests():
+            for item in items:
+                self._validate_item(item)
+                yield {
+                    "PutRequest": {"Item": copy_object_with_float_to_decimal(item)}
+                }
+
+        self._batch_write(put_requests(), max_workers)
+
+    def bulk_import(
+        self,
+        path,
+        input_format: str = "auto",
+        processes: int = None,
+        max_workers: int = 4,
+        rejects_path=None,
+    ) -> dict:
+        """
+        put (and overwrite) the items of line-delimited, optionally gzipped, files
+
+        The lines are streamed in batches to a process pool parsing, validating and
+        serializing them, while max_workers threads write requests of 25 items through
+        the low-level client retrying unprocessed items. Lines are either items as
+        written by Table.export or DynamoDB JSON (`{"Item": {"key": {"S": "value"}}}`
+        as in DynamoDB exports to S3). Lines not parsable or not matching the schema
+        are written with the reason to the rejects file instead. Of lines with the same
+        primary key within a request of 25 items only the last one is written.
+
+        Parameters
+        ----------
+        path: str, Path
+            file or directory of `.ndjson`, `.jsonl` or `.json` files, each optionally
+            with `.gz`
+        input_format: str
+            one of InputFormats: ndjson, dynamodb_json or auto detecting it per line
+        processes: int, optional
+            number of processes converting lines, defaults to the number of CPUs,
+            1 converts within this process
+        max_workers: int
+            number of threads writing requests concurrently
+        rejects_path: str, Path, optional
+            file of the rejected lines, defaults to `<path>.rejects.ndjson`
+
+        Returns
+        -------
+        dict
+            items: number of written items, rejected: number of rejected lines,
+            rejects_path: the rejects file if any line was rejected, seconds: duration,
+            items_per_second: written items per second
+
+        """
+        from .bulk_import import import_table
+
+        return import_table(
+            self,
+            path,
+            input_format=input_format,
+            processes=processes,
+            max_workers=max_workers,
+            rejects_path=rejects_path,
+        )
+
+    def batch_delete(self, primary_keys: Iterable, max_workers: int = 1):
+        """
+        delete all items with given primary keys in requests of 25 items
+
+        Primary keys repeated within a request are deleted once.
+
+        Parameters
+        ----------
+        primary_keys : Iterable
+            primary keys of the items to delete
+        max_workers: int
+            number of threads writing requests concurrently
+
+        """
+
+        def delete_requests():
+            for key in self._cast_primary_keys(primary_keys, batch=True):
+                self._primary_key_checker(key)
+                yield {
+                    "DeleteRequest": {"Key": copy_object_with_float_to_decimal(key)}
+                }
+
+        self._batch_write(delete_requests(), max_workers)
+
+    def _batch_write(
+        self, write_requests: Iterable, max_workers: int = 1, wire_format=False
+    ):
+        chunks = _unique_key_chunks(
+            write_requests,
+            _batch_write_limit,
+            lambda write_request: self.__write_request_key(write_request, wire_format),
+        )
+        if max_workers <= 1:
+            for chunk in chunks:
+                self._batch_write_chunk(chunk, wire_format)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = set()
+            for chunk in chunks:
+                if len(in_flight) >= max_workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(
+                    executor.submit(self._batch_write_chunk, chunk, wire_format)
+                )
+            for future in in_flight:
+                future.result()
+
+    def __write_request_key(self, write_request: dict, wire_format=False) -> tuple:
+        attributes = (
+            write_request["PutRequest"]["Item"]
+            if "PutRequest" in write_request
+            else write_request["DeleteRequest"]["Key"]
+        )
+        if wire_format:
+            # attribute values like {"S": "value"}
+            return tuple(tuple(attributes[name].items()) for name in self.pk)
+        return tuple(attributes[name] for name in self.pk)
+
+    def _batch_write_chunk(self, write_requests: list, wire_format=False):
+        """
+        write up to 25 requests, with wire_format they are already serialized for the
+        low-level client
+        """
+        try:
+            self.__batch_write_chunk(write_requests, wire_format)
+        finally:
+            if self.__item_cache is not None:
+                for request in write_requests:
+                    key = (
+                        request["PutRequest"]["Item"]
+                        if "PutRequest" in request
+                        else request["DeleteRequest"]["Key"]
+                    )
+                    if wire_format:
+                        key = deserialize_item({name: key[name] for name in self.pk})
+                    self._invalidate_cached_item(key)
+
+    def __batch_write_chunk(self, write_requests: list, wire_format=False):
+        writer = self._client if wire_format else self._resource
+        request_items = {self.__table_name: write_requests}
+        for attempt in range(_max_batch_attempts):
+            if attempt:
+                _sleep_before_retry(attempt)
+            response = self._intercepted("batch_write_item", writer.batch_write_item)(
+                RequestItems=request_items
+            )
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return
+        self.custom_exception.unprocessed_items(request_items[self.__table_name])
 
     def remove_attribute(
         self,
@@ -846,7 +1602,7 @@ class Table:
     ):
         if not isinstance(path_of_attribute[0], list):
             path_of_attribute = [path_of_attribute]
-        self._validate_input(path_of_attribute)
+        self._validate_input(path_of_attribute, _ValidationModes.REMOVAL)
         return self.__general_update(
             require_attributes_already_present=True,
             create_item_if_non_existent=False,
@@ -902,77 +1658,289 @@ class Table:
         )
 
     def delete(self, condition=None, **primary_dict):
-        self._primary_key_checker(primary_dict.keys())
-        delete_data = {"Key": primary_dict}
-        if condition:
-            delete_data.update({"ConditionExpression": condition})
-        self.__table.delete_item(**delete_data)
+        delete_data = self._create_delete_request(condition, primary_dict)
+        try:
+            self._intercepted("delete_item", self.table.delete_item)(**delete_data)
+        finally:
+            self._invalidate_cached_item(primary_dict)
 
     def get_and_delete(self, condition=None, **primary_dict):
+        delete_data = self._create_delete_request(
+            condition, primary_dict, returns=UpdateReturns.ALL_OLD
+        )
+        try:
+            response = self._intercepted("delete_item", self.table.delete_item)(
+                **delete_data
+            )
+        finally:
+            self._invalidate_cached_item(primary_dict)
+        return self._handle_get_and_delete_response(response, primary_dict)
+
+    def _create_delete_request(
+        self, condition, primary_dict: dict, returns: UpdateReturns = None
+    ) -> dict:
         self._primary_key_checker(primary_dict.keys())
-        delete_data = {"Key": primary_dict, "ReturnValues": UpdateReturns.ALL_OLD}
+        delete_data = {"Key": primary_dict}
+        if returns:
+            delete_data["ReturnValues"] = returns
         if condition:
             delete_data.update({"ConditionExpression": condition})
-        response = self.__table.delete_item(**delete_data)
-        if not response["Attributes"]:
+        return delete_data
+
+    def _handle_get_and_delete_response(self, response: dict, primary_dict: dict):
+        if not response.get("Attributes"):
             self.custom_exception.not_found_message(primary_dict)
         return object_with_decimal_to_float(response["Attributes"])
 
-    def scan(self, get_only_primaries: bool = None, attributes_to_get: list = None):
+    def _create_scan_data(
+        self, get_only_primaries: bool = None, attributes_to_get: list = None
+    ) -> dict:
+        scan_data = dict()
         if attributes_to_get or get_only_primaries:
             if not isinstance(attributes_to_get, list):
                 attributes_to_get = []
             expression, name_map = self._create_projection_expression(attributes_to_get)
-            response = self.__table.scan(
-                ProjectionExpression=expression,
-                ExpressionAttributeNames=name_map
-            )
-        else:
-            response = self.__table.scan()
-        response["Items"] = [
-            object_with_decimal_to_float(item) for item in response["Items"]
-        ]
+            scan_data["ProjectionExpression"] = expression
+            scan_data["ExpressionAttributeNames"] = name_map
+        return scan_data
+
+    def scan(self, get_only_primaries: bool = None, attributes_to_get: list = None):
+        response = self._read(
+            "scan", self._create_scan_data(get_only_primaries, attributes_to_get)
+        )
+        response["Items"] = [self._to_native(item) for item in response["Items"]]
         return response
 
-    def truncate(self):
-        with self.__table.batch_writer() as batch:
-            for item in self.scan()["Items"]:
-                batch.delete_item(Key={key: item[key] for key in self.pk})
+    def scan_iter(
+        self,
+        get_only_primaries: bool = None,
+        attributes_to_get: list = None,
+        page_size: int = None,
+    ):
+        """
+        iterate over all items of the table, requesting the next page only once the previous one is consumed
+
+        Parameters
+        ----------
+        get_only_primaries: bool, optional
+            only return the primary keys of the items
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        page_size: int, optional
+            maximum number of items evaluated per scan request
 
-    def query(
+        Yields
+        -------
+        dict
+            one item after another
+
+        """
+        scan_data = self._create_scan_data(get_only_primaries, attributes_to_get)
+        if page_size:
+            scan_data["Limit"] = page_size
+
+        for page in self._scan_pages(scan_data):
+            for item in page:
+                yield self._to_native(item)
+
+    def _scan_pages(self, scan_data: dict):
+        for response in self._scan_responses(scan_data):
+            yield response["Items"]
+
+    def _scan_responses(self, scan_data: dict):
+        scan_data = scan_data.copy()
+        while True:
+            response = self._read("scan", scan_data)
+            yield response
+            if "LastEvaluatedKey" not in response:
+                return
+            scan_data["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def parallel_scan(
         self,
+        total_segments: int = 4,
+        max_workers: int = None,
+        get_only_primaries: bool = None,
         attributes_to_get: list = None,
-        max_results: int = None,
-        offset_last_key: (str, int, float, dict) = None,
-        range_condition: ConditionBase = None,
-        index: str = None,
-        **query_keys,
-    ) -> dict:
+        page_size: int = None,
+    ):
         """
-        query data based
+        scan the table in parallel segments, yielding the items as soon as any segment returns them
 
         Parameters
         ----------
-        attributes_to_get: list
-            specify the attributes to return (for decreasing transferred data amount)
-        max_results: int, optional
-            limit the number of items to return
-        offset_last_key: str, int, float, dict, optional
-            for pagination: if many values provide the last key that shall not be included
-        range_condition: ConditionBase, optional
-            specify conditions for the range key to match
-        index: str, optional
-            if query should be executed on index
-        query_keys: str
-            primary or index keys
+        total_segments: int
+            number of segments the table is split into
+        max_workers: int, optional
+            number of threads scanning segments concurrently, defaults to total_segments
+        get_only_primaries: bool, optional
+            only return the primary keys of the items
+        attributes_to_get: list, optional
+            specify certain attributes to get
+        page_size: int, optional
+            maximum number of items evaluated per scan request
 
-        Returns
+        Yields
         -------
         dict
-            Count: int, ScannedCount: int, Items: list, (LastEvaluatedKey: (str, int, float))
-            items returned, number scanned for operation, actual items, last range key returned (for pagination)
+            one item after another, in no particular order
 
         """
+        scan_data = self._create_scan_data(get_only_primaries, attributes_to_get)
+        scan_data["TotalSegments"] = total_segments
+        if page_size:
+            scan_data["Limit"] = page_size
+        if not max_workers:
+            max_workers = total_segments
+
+        pages = Queue(maxsize=max_workers * 2)
+        abandoned = Event()
+        segment_done = object()
+
+        def hand_over(entry):
+            while not abandoned.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def scan_segment(segment):
+            try:
+                for page in self._scan_pages(dict(scan_data, Segment=segment)):
+                    if not hand_over(page):
+                        return
+            except Exception as e:
+                hand_over(e)
+            hand_over(segment_done)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for segment in range(total_segments):
+                executor.submit(scan_segment, segment)
+
+            running_segments = total_segments
+            while running_segments:
+                page = pages.get()
+                if page is segment_done:
+                    running_segments -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    for item in page:
+                        yield self._to_native(item)
+        finally:
+            abandoned.set()
+            executor.shutdown(wait=False)
+
+    def export(
+        self,
+        path,
+        export_format: str = "ndjson",
+        total_segments: int = 4,
+        max_workers: int = None,
+        page_size: int = None,
+        attributes_to_get: list = None,
+        resume: bool = True,
+    ) -> int:
+        """
+        stream a segmented scan of the table into one file per segment in directory path
+
+        Each segment is written to `<table name>-segment-<segment>` with the suffix
+        `.ndjson.gz`, `.csv.gz` or `-part-<part>.parquet`, holding at most one page per
+        worker in memory. After each written page (each closed part for parquet) the
+        LastEvaluatedKey of the segment is stored in `.<format>.checkpoint.json`, so an
+        interrupted export continues from there when started again.
+        CSV and parquet columns are the top level properties of the table schema (or
+        attributes_to_get), maps, lists and sets within them are encoded as JSON.
+        Parquet requires pyarrow.
+
+        Parameters
+        ----------
+        path: str, Path
+            directory of the exported files, created if not existing
+        export_format: str
+            one of ExportFormats: ndjson, csv or parquet
+        total_segments: int
+            number of segments the table is split into, each one written to its own file
+        max_workers: int, optional
+            number of threads exporting segments concurrently, defaults to total_segments
+        page_size: int, optional
+            maximum number of items evaluated per scan request
+        attributes_to_get: list, optional
+            specify certain attributes to export
+        resume: bool
+            continue from existing checkpoints, else start over overwriting the files
+
+        Returns
+        -------
+        int
+            number of exported items
+
+        """
+        from .export import export_table
+
+        return export_table(
+            self,
+            path,
+            export_format=export_format,
+            total_segments=total_segments,
+            max_workers=max_workers,
+            page_size=page_size,
+            attributes_to_get=attributes_to_get,
+            resume=resume,
+        )
+
+    def truncate(self, total_segments: int = 4, max_workers: int = None) -> int:
+        """
+        delete all items of the table, scanning only their primary keys in parallel segments
+
+        Parameters
+        ----------
+        total_segments: int
+            number of segments the table is split into, each one deleted by its own batch writer
+        max_workers: int, optional
+            number of threads truncating segments concurrently, defaults to total_segments
+
+        Returns
+        -------
+        int
+            number of deleted items
+
+        """
+        scan_data = self._create_scan_data(get_only_primaries=True)
+        scan_data["TotalSegments"] = total_segments
+
+        def truncate_segment(segment):
+            deleted_items = 0
+
+            def delete_requests():
+                nonlocal deleted_items
+                for page in self._scan_pages(dict(scan_data, Segment=segment)):
+                    for item in page:
+                        yield {
+                            "DeleteRequest": {
+                                "Key": copy_object_with_float_to_decimal(
+                                    {key: item[key] for key in self.pk}
+                                )
+                            }
+                        }
+                    deleted_items += len(page)
+
+            self._batch_write(delete_requests())
+            return deleted_items
+
+        with ThreadPoolExecutor(max_workers=max_workers or total_segments) as executor:
+            return sum(executor.map(truncate_segment, range(total_segments)))
+
+    def _create_query_data(
+        self,
+        attributes_to_get: list,
+        range_condition: ConditionBase,
+        index: str,
+        query_keys: dict,
+    ):
         query_data = dict()
         range_key = None
 
@@ -982,14 +1950,6 @@ class Table:
             if len(self.pk) > 1:
                 range_key = self.pk[1]
         else:
-            if offset_last_key is not None and not isinstance(offset_last_key, dict):
-                raise TypeError(
-                    {
-                        "statusCode": 400,
-                        "body": "querying on index requires dictionary with last evaluated values",
-                        "headers": {"Content-Type": "text/plain"},
-                    }
-                )
             query_keys = self._cast_index_keys(index, query_keys)
             query_data["IndexName"] = index
             primary_key = self.indexes[index][0]
@@ -1017,6 +1977,79 @@ class Table:
         else:
             query_data["Select"] = SelectReturns.ALL_ATTRIBUTES
 
+        return query_data, primary_key, range_key, query_keys
+
+    def query(
+        self,
+        attributes_to_get: list = None,
+        max_results: int = None,
+        offset_last_key: (str, int, float, dict) = None,
+        range_condition: ConditionBase = None,
+        index: str = None,
+        **query_keys,
+    ) -> dict:
+        """
+        query data based
+
+        Parameters
+        ----------
+        attributes_to_get: list
+            specify the attributes to return (for decreasing transferred data amount)
+        max_results: int, optional
+            limit the number of items to return
+        offset_last_key: str, int, float, dict, optional
+            for pagination: if many values provide the last key that shall not be included
+        range_condition: ConditionBase, optional
+            specify conditions for the range key to match
+        index: str, optional
+            if query should be executed on index
+        query_keys: str
+            primary or index keys
+
+        Returns
+        -------
+        dict
+            Count: int, ScannedCount: int, Items: list, (LastEvaluatedKey: (str, int, float))
+            items returned, number scanned for operation, actual items, last range key returned (for pagination)
+
+        """
+        query_data, range_key = self._create_query_request(
+            attributes_to_get,
+            max_results,
+            offset_last_key,
+            range_condition,
+            index,
+            query_keys,
+        )
+        response = self._read("query", query_data)
+        return self._handle_query_response(response, index, range_key)
+
+    def _create_query_request(
+        self,
+        attributes_to_get: list,
+        max_results: int,
+        offset_last_key: (str, int, float, dict),
+        range_condition: ConditionBase,
+        index: str,
+        query_keys: dict,
+    ) -> (dict, str):
+        if (
+            index
+            and offset_last_key is not None
+            and not isinstance(offset_last_key, dict)
+        ):
+            raise TypeError(
+                {
+                    "statusCode": 400,
+                    "body": "querying on index requires dictionary with last evaluated values",
+                    "headers": {"Content-Type": "text/plain"},
+                }
+            )
+
+        query_data, primary_key, range_key, query_keys = self._create_query_data(
+            attributes_to_get, range_condition, index, query_keys
+        )
+
         if max_results:
             query_data["Limit"] = max_results
         if offset_last_key:
@@ -1026,23 +2059,77 @@ class Table:
                     range_key: offset_last_key,
                 }
             else:
-                start_key = object_with_float_to_decimal(offset_last_key)
+                start_key = copy_object_with_float_to_decimal(offset_last_key)
             query_data["ExclusiveStartKey"] = start_key
 
-        response = self.__table.query(**query_data)
+        return query_data, range_key
+
+    def _handle_query_response(
+        self, response: dict, index: str, range_key: str
+    ) -> dict:
         if items := response.get("Items", list()):
-            response["Items"] = object_with_decimal_to_float(items)
+            response["Items"] = self._to_native(items)
         if "LastEvaluatedKey" in response:
-            response["LastEvaluatedKey"] = object_with_decimal_to_float(
-                response["LastEvaluatedKey"]
-            )
+            response["LastEvaluatedKey"] = self._to_native(response["LastEvaluatedKey"])
             if not index:
                 response["LastEvaluatedKey"] = response["LastEvaluatedKey"][range_key]
             else:
                 response["LastEvaluatedKey"] = response["LastEvaluatedKey"]
         return response
 
-    def __return_dict_of_pk_items_from_multiple_item_response(
+    def query_iter(
+        self,
+        attributes_to_get: list = None,
+        max_results: int = None,
+        page_size: int = None,
+        range_condition: ConditionBase = None,
+        index: str = None,
+        **query_keys,
+    ):
+        """
+        iterate over all items matching the query, requesting the next page only once the previous one is consumed
+
+        Parameters
+        ----------
+        attributes_to_get: list
+            specify the attributes to return (for decreasing transferred data amount)
+        max_results: int, optional
+            limit the total number of items to yield
+        page_size: int, optional
+            maximum number of items evaluated per query request
+        range_condition: ConditionBase, optional
+            specify conditions for the range key to match
+        index: str, optional
+            if query should be executed on index
+        query_keys: str
+            primary or index keys
+
+        Yields
+        -------
+        dict
+            one item after another
+
+        """
+        query_data, _, _, _ = self._create_query_data(
+            attributes_to_get, range_condition, index, query_keys
+        )
+
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            if page_size or remaining:
+                query_data["Limit"] = min(
+                    i for i in [page_size, remaining] if i is not None
+                )
+            response = self._read("query", query_data)
+            for item in response["Items"]:
+                yield self._to_native(item)
+            if remaining is not None:
+                remaining -= len(response["Items"])
+            if "LastEvaluatedKey" not in response:
+                return
+            query_data["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _return_dict_of_pk_items_from_multiple_item_response(
         self, object_list: list, convert: bool
     ) -> (dict, list):
         if not convert:
@@ -1086,12 +2173,15 @@ class Table:
         )["Items"]
         if len(object_list) == 0:
             raise FileNotFoundError
-        return self.__return_dict_of_pk_items_from_multiple_item_response(
+        return self._return_dict_of_pk_items_from_multiple_item_response(
             object_list, return_as_dict_of_primary_keys
         )
 
     def batch_get(
-        self, primary_keys: Iterable, return_as_dict_of_primary_keys: bool = False
+        self,
+        primary_keys: Iterable,
+        return_as_dict_of_primary_keys: bool = False,
+        max_workers: int = 4,
     ) -> dict:
         """
         get all items with given primary keys
@@ -1103,6 +2193,8 @@ class Table:
         return_as_dict_of_primary_keys: bool
             if the response shall be as an array (input=False) or as a dictionary of items
              with primary_values as key (input=True)
+        max_workers: int
+            number of threads requesting chunks of 100 keys concurrently
 
         Returns
         -------
@@ -1110,13 +2202,48 @@ class Table:
 
         """
         primary_keys = self._cast_primary_keys(primary_keys, batch=True)
+        chunks = list(_chunk(primary_keys, _batch_get_limit))
 
-        response = _ddb_resource.batch_get_item(
-            RequestItems={self.__table_name: {"Keys": primary_keys}}
-        )
-        object_list = object_with_decimal_to_float(
-            response["Responses"][self.__table_name]
+        if len(chunks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as executor:
+                chunk_responses = list(executor.map(self._batch_get_chunk, chunks))
+        else:
+            chunk_responses = [self._batch_get_chunk(chunk) for chunk in chunks]
+
+        object_list = self._to_native(
+            [item for chunk_response in chunk_responses for item in chunk_response]
         )
-        return self.__return_dict_of_pk_items_from_multiple_item_response(
+        return self._return_dict_of_pk_items_from_multiple_item_response(
             object_list, return_as_dict_of_primary_keys
         )
+
+    def _batch_get_chunk(self, primary_keys: list) -> list:
+        if not self.__fast_deserialization:
+            responses, unprocessed = _batch_get_with_retries(
+                self._intercepted("batch_get_item", self._resource.batch_get_item),
+                {self.__table_name: {"Keys": primary_keys}},
+            )
+        else:
+            responses, unprocessed = _batch_get_with_retries(
+                self._intercepted("batch_get_item", self._client.batch_get_item),
+                {
+                    self.__table_name: {
+                        "Keys": [_serialize_values(key) for key in primary_keys]
+                    }
+                },
+            )
+            responses = {
+                table_name: [deserialize_item(item) for item in items]
+                for table_name, items in responses.items()
+            }
+            unprocessed = {
+                table_name: {"Keys": [deserialize_item(key) for key in keys["Keys"]]}
+                for table_name, keys in unprocessed.items()
+            }
+        if unprocessed:
+            self.custom_exception.unprocessed_items(
+                unprocessed[self.__table_name]["Keys"]
+            )
+        return responses.get(self.__table_name, list())
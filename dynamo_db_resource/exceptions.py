@@ -4,6 +4,7 @@ __all__ = [
     "ConditionalCheckFailedException",
     "AttributeExistsException",
     "AttributeNotExistsException",
+    "UnprocessedItemsException",
     "ValidationError",
 ]
 
@@ -20,6 +21,10 @@ class AttributeNotExistsException(AttributeError):
     pass
 
 
+class UnprocessedItemsException(Exception):
+    pass
+
+
 class CustomExceptionRaiser:
     def __init__(self, table):
         self.table = table
@@ -99,3 +104,13 @@ class CustomExceptionRaiser:
                 "headers": {"Content-Type": "text/plain"},
             }
         )
+
+    def unprocessed_items(self, unprocessed):
+        raise UnprocessedItemsException(
+            {
+                "statusCode": 503,
+                "body": f"{len(unprocessed)} requests for table {self.table.name} "
+                f"remained unprocessed after retrying: {unprocessed}",
+                "headers": {"Content-Type": "text/plain"},
+            }
+        )
@@ -0,0 +1,330 @@
+from base64 import b64decode, b64encode
+from boto3.dynamodb.types import Binary
+from concurrent.futures import ThreadPoolExecutor
+from csv import DictWriter
+from decimal import Decimal
+from gzip import GzipFile
+from io import TextIOWrapper
+from os import replace
+from pathlib import Path
+import json
+
+__all__ = ["ExportFormats", "export_table"]
+
+
+class ExportFormats:
+    """
+    contains the file formats of Table.export
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+_file_suffixes = {
+    ExportFormats.NDJSON: ".ndjson.gz",
+    ExportFormats.CSV: ".csv.gz",
+    ExportFormats.PARQUET: ".parquet",
+}
+
+_parquet_types = {
+    "string": "string",
+    "integer": "int64",
+    "number": "float64",
+    "boolean": "bool_",
+    "bytes": "binary",
+}
+
+
+def _json_default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Binary):
+        return b64encode(obj.value).decode()
+    if isinstance(obj, bytes):
+        return b64encode(obj).decode()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def _encode_key(key: dict) -> dict:
+    # key attributes are of type S, N or B
+    encoded = dict()
+    for name, value in key.items():
+        if isinstance(value, str):
+            encoded[name] = {"S": value}
+        elif isinstance(value, (bytes, Binary)):
+            encoded[name] = {"B": _json_default(value)}
+        else:
+            encoded[name] = {"N": str(value)}
+    return encoded
+
+
+def _decode_key(encoded: dict) -> dict:
+    key = dict()
+    for name, value in encoded.items():
+        ((data_type, data),) = value.items()
+        if data_type == "S":
+            key[name] = data
+        elif data_type == "B":
+            key[name] = Binary(b64decode(data))
+        else:
+            key[name] = Decimal(data)
+    return key
+
+
+def _load_checkpoint(checkpoint_path: Path):
+    if not checkpoint_path.exists():
+        return None
+    with open(checkpoint_path) as f:
+        return json.load(f)
+
+
+def _save_checkpoint(checkpoint_path: Path, checkpoint: dict):
+    # replacing the file keeps the previous checkpoint if interrupted while writing
+    temporary_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    with open(temporary_path, "w") as f:
+        json.dump(checkpoint, f)
+    replace(temporary_path, checkpoint_path)
+
+
+def _columns(table, attributes_to_get: list = None) -> dict:
+    properties = table.schema.get("properties", dict())
+    names = attributes_to_get if attributes_to_get else list(properties)
+    return {name: properties.get(name, dict()).get("type") for name in names}
+
+
+def _flat_value(value, column_type: str, binary_as_text: bool):
+    if value is None:
+        return None
+    if isinstance(value, (Binary, bytes)):
+        return _json_default(value) if binary_as_text else bytes(value)
+    if column_type not in _parquet_types or isinstance(value, (dict, list, set)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+class _CompressedTextSegmentWriter:
+    """
+    write each page as a gzip member of its own, so the file can be cut back to the
+    offset of the last checkpoint when resuming
+    """
+
+    def __init__(self, file_path: Path, columns: dict, state: dict = None):
+        self.columns = columns
+        if state:
+            self._file = open(file_path, "r+b")
+            self._file.truncate(state["offset"])
+            self._file.seek(state["offset"])
+        else:
+            self._file = open(file_path, "wb")
+
+    def write_page(self, items: list) -> dict:
+        with TextIOWrapper(
+            GzipFile(fileobj=self._file, mode="wb"), encoding="utf-8", newline=""
+        ) as text:
+            self._write_items(text, items)
+        self._file.flush()
+        return {"offset": self._file.tell()}
+
+    def _write_items(self, text, items: list):
+        raise NotImplementedError
+
+    def close(self) -> dict:
+        if self._file.closed:
+            return None
+        state = {"offset": self._file.tell()}
+        self._file.close()
+        return state
+
+
+class _NDJSONSegmentWriter(_CompressedTextSegmentWriter):
+    def _write_items(self, text, items: list):
+        for item in items:
+            text.write(json.dumps(item, default=_json_default))
+            text.write("\n")
+
+
+class _CSVSegmentWriter(_CompressedTextSegmentWriter):
+    def __init__(self, file_path: Path, columns: dict, state: dict = None):
+        super().__init__(file_path, columns, state)
+        self.__header_written = bool(state and state["offset"])
+
+    def _write_items(self, text, items: list):
+        writer = DictWriter(text, fieldnames=list(self.columns), extrasaction="ignore")
+        if not self.__header_written:
+            writer.writeheader()
+            self.__header_written = True
+        for item in items:
+            writer.writerow(
+                {
+                    name: _flat_value(item.get(name), column_type, True)
+                    for name, column_type in self.columns.items()
+                }
+            )
+
+
+class _ParquetSegmentWriter:
+    """
+    write pages as row groups of part files, a part is complete once closed
+    """
+
+    def __init__(
+        self, file_path: Path, columns: dict, state: dict = None, pages_per_part=16
+    ):
+        import pyarrow
+
+        self._file_path = file_path
+        self.columns = columns
+        self.pages_per_part = pages_per_part
+        self._schema = pyarrow.schema(
+            [
+                (
+                    name,
+                    getattr(pyarrow, _parquet_types.get(column_type, "string"))(),
+                )
+                for name, column_type in columns.items()
+            ]
+        )
+        self._parts = state["parts"] if state else 0
+        self._writer = None
+        self._pages_in_part = 0
+
+    def write_page(self, items: list):
+        import pyarrow
+        from pyarrow.parquet import ParquetWriter
+
+        if self._writer is None:
+            part_name = f"{self._file_path.stem}-part-{self._parts:05}.parquet"
+            self._writer = ParquetWriter(
+                str(self._file_path.with_name(part_name)), self._schema
+            )
+        self._writer.write_table(
+            pyarrow.Table.from_pylist(
+                [
+                    {
+                        name: _flat_value(item.get(name), column_type, False)
+                        for name, column_type in self.columns.items()
+                    }
+                    for item in items
+                ],
+                schema=self._schema,
+            )
+        )
+        self._pages_in_part += 1
+        if self._pages_in_part >= self.pages_per_part:
+            return self.close()
+        return None
+
+    def close(self):
+        if self._writer is None:
+            return {"parts": self._parts}
+        self._writer.close()
+        self._writer = None
+        self._pages_in_part = 0
+        self._parts += 1
+        return {"parts": self._parts}
+
+
+_segment_writers = {
+    ExportFormats.NDJSON: _NDJSONSegmentWriter,
+    ExportFormats.CSV: _CSVSegmentWriter,
+    ExportFormats.PARQUET: _ParquetSegmentWriter,
+}
+
+
+def export_table(
+    table,
+    path,
+    export_format: str = ExportFormats.NDJSON,
+    total_segments: int = 4,
+    max_workers: int = None,
+    page_size: int = None,
+    attributes_to_get: list = None,
+    resume: bool = True,
+) -> int:
+    """
+    stream a segmented scan of the table into one file per segment (see Table.export)
+    """
+    if export_format not in _segment_writers:
+        raise ValueError(
+            f"export_format must be one of {list(_segment_writers)}, "
+            f"got {export_format}"
+        )
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    columns = _columns(table, attributes_to_get)
+    scan_data = table._create_scan_data(attributes_to_get=attributes_to_get)
+    scan_data["TotalSegments"] = total_segments
+    if page_size:
+        scan_data["Limit"] = page_size
+
+    def export_segment(segment: int) -> int:
+        prefix = f"{table.name}-segment-{segment:04}"
+        checkpoint_path = Path(directory, f"{prefix}.{export_format}.checkpoint.json")
+        if resume:
+            checkpoint = _load_checkpoint(checkpoint_path)
+        else:
+            # an interrupted fresh export must not resume from an earlier export
+            checkpoint_path.unlink(missing_ok=True)
+            checkpoint = None
+        if checkpoint is None:
+            checkpoint = {
+                "format": export_format,
+                "total_segments": total_segments,
+                "items": 0,
+                "last_evaluated_key": None,
+                "state": None,
+                "done": False,
+            }
+        elif (checkpoint["format"], checkpoint["total_segments"]) != (
+            export_format,
+            total_segments,
+        ):
+            raise ValueError(
+                f"checkpoint {checkpoint_path} belongs to an export as "
+                f"{checkpoint['format']} with {checkpoint['total_segments']} segments"
+            )
+        if checkpoint["done"]:
+            return checkpoint["items"]
+
+        segment_scan = dict(scan_data, Segment=segment)
+        if checkpoint["last_evaluated_key"]:
+            segment_scan["ExclusiveStartKey"] = _decode_key(
+                checkpoint["last_evaluated_key"]
+            )
+
+        writer = _segment_writers[export_format](
+            Path(directory, prefix + _file_suffixes[export_format]),
+            columns,
+            checkpoint["state"],
+        )
+        items = checkpoint["items"]
+        try:
+            for response in table._scan_responses(segment_scan):
+                state = writer.write_page(
+                    [table._to_native(item) for item in response["Items"]]
+                )
+                items += len(response["Items"])
+                if "LastEvaluatedKey" not in response:
+                    break
+                if state is not None:
+                    checkpoint.update(
+                        items=items,
+                        last_evaluated_key=_encode_key(response["LastEvaluatedKey"]),
+                        state=state,
+                    )
+                    _save_checkpoint(checkpoint_path, checkpoint)
+            checkpoint.update(
+                items=items, last_evaluated_key=None, state=writer.close(), done=True
+            )
+            _save_checkpoint(checkpoint_path, checkpoint)
+        finally:
+            writer.close()
+        return items
+
+    with ThreadPoolExecutor(max_workers=max_workers or total_segments) as executor:
+        return sum(executor.map(export_segment, range(total_segments)))
@@ -0,0 +1,328 @@
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from botocore.exceptions import ClientError
+from threading import Lock
+from time import perf_counter
+from typing import Iterable
+import json
+
+__all__ = [
+    "Interceptor",
+    "OperationContext",
+    "OpenTelemetryInterceptor",
+    "PrometheusInterceptor",
+]
+
+
+class OperationContext:
+    """
+    one data-plane operation of a Table as handed to its interceptors
+
+    Attributes
+    ----------
+    operation: str
+        name of the boto3 method, e.g. "get_item" or "transact_write_items"
+    table_name: str
+        name of the table, several names are joined with "," for multi-table requests
+    request: dict
+        parameters of the request
+    response: dict
+        the response, None before the operation or if it failed
+    exception: Exception
+        the exception raised by the operation or by the before of an interceptor
+    duration: float
+        seconds the request took including the retries of botocore, 0 if not sent
+    retry_count: int
+        retries of botocore as reported in the ResponseMetadata
+    consumed_capacity: dict or list
+        ConsumedCapacity of the response, a list for multi-table requests
+    state: dict
+        storage for interceptors carrying data from before to after
+
+    """
+
+    __slots__ = (
+        "operation",
+        "table_name",
+        "request",
+        "response",
+        "exception",
+        "duration",
+        "retry_count",
+        "consumed_capacity",
+        "state",
+        "_key_names",
+    )
+
+    def __init__(
+        self, operation: str, table_name: str, request: dict, key_names: tuple = ()
+    ):
+        self.operation = operation
+        self.table_name = table_name
+        self.request = request
+        self.response = None
+        self.exception = None
+        self.duration = None
+        self.retry_count = 0
+        self.consumed_capacity = None
+        self.state = dict()
+        self._key_names = key_names
+
+    @property
+    def key(self) -> dict:
+        """
+        the primary key of single-item operations, else None
+        """
+        if "Key" in self.request:
+            return self.request["Key"]
+        if "Item" in self.request:
+            return {
+                name: self.request["Item"][name]
+                for name in self._key_names
+                if name in self.request["Item"]
+            }
+        return None
+
+    @property
+    def expression_sizes(self) -> dict:
+        """
+        characters of each expression of the request, condition objects built first
+        """
+        sizes = dict()
+        for name, expression in self.request.items():
+            if not name.endswith("Expression"):
+                continue
+            if isinstance(expression, ConditionBase):
+                expression = (
+                    ConditionExpressionBuilder()
+                    .build_expression(
+                        expression, is_key_condition=name == "KeyConditionExpression"
+                    )
+                    .condition_expression
+                )
+            sizes[name] = len(expression)
+        return sizes
+
+
+class Interceptor:
+    """
+    base of the interceptors invoked around every data-plane operation of a Table
+
+    Interceptors are called with `before` in the order given to Table and with
+    `after` in reverse order, also if the operation or the `before` of a later
+    interceptor failed. Exceptions of an interceptor propagate to the caller of the
+    Table method.
+    """
+
+    def before(self, context: OperationContext):
+        pass
+
+    def after(self, context: OperationContext):
+        pass
+
+
+class InterceptorChain:
+    """
+    the interceptors of a Table, wrapping the calls to boto3
+    """
+
+    def __init__(self, interceptors: Iterable[Interceptor]):
+        self.interceptors = tuple(interceptors)
+
+    def wrap(self, operation: str, table_name: str, function, key_names: tuple = ()):
+        def intercepted(**request):
+            return self.call(operation, table_name, function, request, key_names)
+
+        return intercepted
+
+    def call(
+        self,
+        operation: str,
+        table_name: str,
+        function,
+        request: dict,
+        key_names: tuple = (),
+    ):
+        # consumed capacity is only returned if requested, the caller does not see it
+        capacity_requested = "ReturnConsumedCapacity" not in request
+        if capacity_requested:
+            request = dict(request, ReturnConsumedCapacity="TOTAL")
+        context = OperationContext(operation, table_name, request, key_names)
+        # after is only called for interceptors whose before completed
+        entered = 0
+        started = None
+        try:
+            for interceptor in self.interceptors:
+                interceptor.before(context)
+                entered += 1
+            started = perf_counter()
+            context.response = function(**request)
+        except Exception as e:
+            context.exception = e
+            raise
+        finally:
+            context.duration = perf_counter() - started if started is not None else 0.0
+            response = (
+                context.exception.response
+                if isinstance(context.exception, ClientError)
+                else context.response or dict()
+            )
+            context.retry_count = response.get("ResponseMetadata", dict()).get(
+                "RetryAttempts", 0
+            )
+            context.consumed_capacity = (
+                response.pop("ConsumedCapacity", None)
+                if capacity_requested and context.response is not None
+                else response.get("ConsumedCapacity")
+            )
+            for interceptor in reversed(self.interceptors[:entered]):
+                interceptor.after(context)
+        return context.response
+
+
+def _api_name(operation: str) -> str:
+    return "".join(part.title() for part in operation.split("_"))
+
+
+def _consumed_capacity_list(context: OperationContext) -> list:
+    if context.consumed_capacity is None:
+        return list()
+    if isinstance(context.consumed_capacity, dict):
+        return [context.consumed_capacity]
+    return context.consumed_capacity
+
+
+def _outcome(context: OperationContext) -> str:
+    if context.exception is None:
+        return "success"
+    if isinstance(context.exception, ClientError):
+        return context.exception.response["Error"]["Code"]
+    return type(context.exception).__name__
+
+
+class OpenTelemetryInterceptor(Interceptor):
+    """
+    trace every operation as a client span following the semantic conventions of
+    OpenTelemetry for DynamoDB, requires the package opentelemetry-api
+
+    Parameters
+    ----------
+    tracer_provider: optional
+        TracerProvider creating the tracer, default: the global one
+
+    """
+
+    def __init__(self, tracer_provider=None):
+        from opentelemetry import trace
+
+        from . import __version__
+
+        self._tracer = trace.get_tracer(
+            "dynamo_db_resource", __version__, tracer_provider
+        )
+
+    def before(self, context: OperationContext):
+        from opentelemetry import context as context_api, trace
+
+        span = self._tracer.start_span(
+            f"DynamoDB.{_api_name(context.operation)}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": "dynamodb",
+                "db.operation": _api_name(context.operation),
+                "rpc.system": "aws-api",
+                "rpc.service": "DynamoDB",
+                "rpc.method": _api_name(context.operation),
+                "aws.dynamodb.table_names": context.table_name.split(","),
+            },
+        )
+        token = context_api.attach(trace.set_span_in_context(span))
+        context.state[self] = span, token
+
+    def after(self, context: OperationContext):
+        from opentelemetry import context as context_api
+        from opentelemetry.trace import Status, StatusCode
+
+        span, token = context.state.pop(self)
+        context_api.detach(token)
+        span.set_attribute("aws.dynamodb.retry_count", context.retry_count)
+        capacities = _consumed_capacity_list(context)
+        if capacities:
+            span.set_attribute(
+                "aws.dynamodb.consumed_capacity",
+                [json.dumps(capacity) for capacity in capacities],
+            )
+        for name, size in context.expression_sizes.items():
+            span.set_attribute(f"dynamo_db_resource.expression_size.{name}", size)
+        if context.exception is not None:
+            span.record_exception(context.exception)
+            span.set_status(Status(StatusCode.ERROR, _outcome(context)))
+        span.end()
+
+
+_default_histograms = dict()
+_default_histograms_lock = Lock()
+
+
+def _default_histogram(registry, buckets: tuple):
+    """
+    the histogram of PrometheusInterceptor shared by all instances using registry
+    """
+    from prometheus_client import Histogram, REGISTRY
+
+    if registry is None:
+        registry = REGISTRY
+    with _default_histograms_lock:
+        if registry not in _default_histograms:
+            histogram_buckets = (
+                buckets if buckets is not None else tuple(Histogram.DEFAULT_BUCKETS)
+            )
+            _default_histograms[registry] = (
+                Histogram(
+                    "dynamo_db_resource_operation_duration_seconds",
+                    "duration of the DynamoDB operations of dynamo_db_resource",
+                    ["operation", "table", "outcome"],
+                    registry=registry,
+                    buckets=histogram_buckets,
+                ),
+                histogram_buckets,
+            )
+        histogram, histogram_buckets = _default_histograms[registry]
+    if buckets is not None and buckets != histogram_buckets:
+        raise ValueError(
+            "the histogram of the registry already exists with buckets "
+            f"{histogram_buckets}, got {buckets}"
+        )
+    return histogram
+
+
+class PrometheusInterceptor(Interceptor):
+    """
+    observe the duration of every operation in a histogram labelled with operation,
+    table and outcome (success or the error code), requires the package
+    prometheus_client
+
+    Parameters
+    ----------
+    histogram: optional
+        prometheus_client Histogram with the labels operation, table and outcome
+        to observe, default: the histogram dynamo_db_resource_operation_duration_seconds
+        of registry, created once and shared by all PrometheusInterceptors using it
+    registry: optional
+        CollectorRegistry of the default histogram, default: the global one
+    buckets: Iterable[float], optional
+        upper bounds of the buckets of the default histogram, only applied by the
+        interceptor creating it; other buckets for an existing one raise a ValueError
+
+    """
+
+    def __init__(self, histogram=None, registry=None, buckets: Iterable = None):
+        if histogram is None:
+            histogram = _default_histogram(
+                registry, tuple(buckets) if buckets is not None else None
+            )
+        self.histogram = histogram
+
+    def after(self, context: OperationContext):
+        self.histogram.labels(
+            context.operation, context.table_name, _outcome(context)
+        ).observe(context.duration)
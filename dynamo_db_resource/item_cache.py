@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from copy import deepcopy
+from sys import getsizeof
+from threading import Lock
+from time import monotonic
+
+__all__ = ["ItemCache"]
+
+
+def _approximate_size(obj) -> int:
+    size = getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _approximate_size(key) + _approximate_size(value)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_approximate_size(i) for i in obj)
+    return size
+
+
+def _hashable(obj):
+    if isinstance(obj, (list, tuple)):
+        return tuple(_hashable(i) for i in obj)
+    return obj
+
+
+class ItemCache:
+    """
+    thread-safe LRU cache of items for the read-through cache of a Table
+
+    Parameters
+    ----------
+    max_entries: int
+        maximum number of cached (primary key, projection) entries
+    ttl: float, optional
+        seconds an entry stays valid after being loaded
+    max_bytes: int, optional
+        maximum approximate memory of all cached items
+    clock: callable
+        returns the current time in seconds
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = None,
+        max_bytes: int = None,
+        clock=monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self.__entries = OrderedDict()
+        self.__projections_of_primary = dict()
+        self.__bytes = 0
+        self.__generation = 0
+        self.__lock = Lock()
+        self.__stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    @staticmethod
+    def key(primary_values: tuple, attributes_to_get=None) -> tuple:
+        return tuple(primary_values), _hashable(attributes_to_get)
+
+    @property
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                **self.__stats,
+                "entries": len(self.__entries),
+                "bytes": self.__bytes,
+            }
+
+    @property
+    def generation(self) -> int:
+        """
+        number of invalidations, read before loading an item passed to set afterwards
+        """
+        return self.__generation
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key: tuple):
+        """
+        get a copy of the cached item or None if not cached or expired
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__stats["misses"] += 1
+                return None
+            item, size, expires = entry
+            if expires is not None and expires <= self._clock():
+                self.__remove(key)
+                self.__stats["expirations"] += 1
+                self.__stats["misses"] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__stats["hits"] += 1
+        return deepcopy(item)
+
+    def set(self, key: tuple, item: dict, generation: int = None):
+        """
+        cache a copy of the item unless an invalidation happened since generation
+        """
+        item = deepcopy(item)
+        size = _approximate_size(item)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = self._clock() + self.ttl if self.ttl is not None else None
+
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (item, size, expires)
+            self.__projections_of_primary.setdefault(key[0], set()).add(key[1])
+            self.__bytes += size
+
+            while len(self.__entries) > self.max_entries or (
+                self.max_bytes is not None and self.__bytes > self.max_bytes
+            ):
+                self.__remove(next(iter(self.__entries)))
+                self.__stats["evictions"] += 1
+
+    def invalidate(self, primary_values: tuple):
+        """
+        remove all cached projections of the item with the given primary key values
+        """
+        primary_values = tuple(primary_values)
+        with self.__lock:
+            self.__generation += 1
+            projections = self.__projections_of_primary.get(primary_values, set())
+            for projection in projections.copy():
+                self.__remove((primary_values, projection))
+
+    def clear(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            self.__projections_of_primary.clear()
+            self.__bytes = 0
+
+    def __remove(self, key: tuple):
+        _, size, _ = self.__entries.pop(key)
+        self.__bytes -= size
+        projections = self.__projections_of_primary[key[0]]
+        projections.discard(key[1])
+        if not projections:
+            del self.__projections_of_primary[key[0]]
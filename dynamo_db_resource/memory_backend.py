@@ -0,0 +1,1737 @@
+from base64 import b64decode
+from bisect import bisect_left, bisect_right, insort
+from botocore.awsrequest import AWSResponse
+from botocore.handlers import disable_signing
+from collections import namedtuple
+from decimal import Context, Decimal, InvalidOperation
+from functools import lru_cache
+from math import ceil
+from threading import RLock
+from time import time
+from zlib import crc32
+import json
+import re
+
+__all__ = ["attach_memory_backend", "reset_memory_backend", "region_name"]
+
+region_name = "memory"
+
+_error_type_prefix = "com.amazonaws.dynamodb.v20120810#"
+_maximum_item_size = 400 * 1024
+_maximum_page_size = 1024 * 1024
+_batch_get_limit = 100
+_batch_write_limit = 25
+_transact_limit = 100
+_number_context = Context(prec=38)
+_key_types = ("S", "N", "B")
+_set_types = ("SS", "NS", "BS")
+
+
+class _MemoryBackendError(Exception):
+    def __init__(self, code: str, message: str, **details):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.details = details
+
+
+def _validation_error(message: str) -> _MemoryBackendError:
+    return _MemoryBackendError("ValidationException", message)
+
+
+def _condition_failed(item: (dict, None), request: dict) -> _MemoryBackendError:
+    details = dict()
+    if item and request.get("ReturnValuesOnConditionCheckFailure") == "ALL_OLD":
+        details["Item"] = item
+    return _MemoryBackendError(
+        "ConditionalCheckFailedException", "The conditional request failed", **details
+    )
+
+
+# attribute values stay in the wire format: {"S": "text"}, {"N": "1.5"}, ...
+
+
+def _canonical_number(text: str) -> str:
+    try:
+        number = Decimal(text)
+    except (InvalidOperation, TypeError):
+        raise _validation_error("A value provided cannot be converted into a number")
+    if not number.is_finite():
+        raise _validation_error("A value provided cannot be converted into a number")
+    if number == 0:
+        return "0"
+    return format(number.normalize(_number_context), "f")
+
+
+def _canonical_value(value: dict) -> dict:
+    ((data_type, data),) = value.items()
+    if data_type in ("S", "B", "BOOL", "NULL"):
+        return value
+    if data_type == "N":
+        return {"N": _canonical_number(data)}
+    if data_type == "M":
+        return {"M": {name: _canonical_value(v) for name, v in data.items()}}
+    if data_type == "L":
+        return {"L": [_canonical_value(v) for v in data]}
+    if data_type in _set_types:
+        if not data:
+            raise _validation_error(
+                "One or more parameter values were invalid: An empty set is not allowed"
+            )
+        if data_type == "NS":
+            data = [_canonical_number(number) for number in data]
+        if len(set(data)) != len(data):
+            raise _validation_error("Input collection contains duplicates")
+        return {data_type: data}
+    raise _validation_error(f"Supplied AttributeValue has an unknown type {data_type}")
+
+
+def _canonical_item(item: dict) -> dict:
+    return {name: _canonical_value(value) for name, value in item.items()}
+
+
+def _copy(data):
+    if isinstance(data, dict):
+        return {key: _copy(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy(value) for value in data]
+    return data
+
+
+def _value_size(value: dict) -> int:
+    ((data_type, data),) = value.items()
+    if data_type == "S":
+        return len(data.encode())
+    if data_type == "N":
+        return len(data) // 2 + 2
+    if data_type == "B":
+        return len(data) * 3 // 4
+    if data_type == "M":
+        return 3 + sum(
+            len(name.encode()) + _value_size(v) + 1 for name, v in data.items()
+        )
+    if data_type == "L":
+        return 3 + sum(_value_size(v) + 1 for v in data)
+    if data_type == "SS":
+        return sum(len(i.encode()) for i in data)
+    if data_type == "NS":
+        return sum(len(i) // 2 + 2 for i in data)
+    if data_type == "BS":
+        return sum(len(i) * 3 // 4 for i in data)
+    return 1
+
+
+def _item_size(item: dict) -> int:
+    return sum(len(name.encode()) + _value_size(value) for name, value in item.items())
+
+
+def _key_value(value: dict):
+    # comparable python value of an S, N or B attribute
+    ((data_type, data),) = value.items()
+    if data_type == "N":
+        return Decimal(data)
+    if data_type == "B":
+        return b64decode(data)
+    return data
+
+
+def _ordered_pair(a: dict, b: dict):
+    if a is None or b is None:
+        return None
+    ((type_a, _),) = a.items()
+    ((type_b, _),) = b.items()
+    if type_a != type_b or type_a not in _key_types:
+        return None
+    return _key_value(a), _key_value(b)
+
+
+def _equal(a: dict, b: dict) -> bool:
+    ((type_a, data_a),) = a.items()
+    ((type_b, data_b),) = b.items()
+    if type_a != type_b:
+        return False
+    if type_a == "N":
+        return Decimal(data_a) == Decimal(data_b)
+    if type_a == "NS":
+        return set(map(Decimal, data_a)) == set(map(Decimal, data_b))
+    if type_a in ("SS", "BS"):
+        return set(data_a) == set(data_b)
+    if type_a == "M":
+        return data_a.keys() == data_b.keys() and all(
+            _equal(value, data_b[name]) for name, value in data_a.items()
+        )
+    if type_a == "L":
+        return len(data_a) == len(data_b) and all(map(_equal, data_a, data_b))
+    return data_a == data_b
+
+
+def _size(value: dict) -> int:
+    ((data_type, data),) = value.items()
+    if data_type == "S":
+        return len(data)
+    if data_type == "B":
+        return len(b64decode(data))
+    if data_type in ("M", "L") or data_type in _set_types:
+        return len(data)
+    raise _validation_error(
+        "Invalid ConditionExpression: Incorrect operand type for operator or function; "
+        f"operator or function: size, operand type: {data_type}"
+    )
+
+
+# expressions
+
+
+class _ExpressionSyntaxError(Exception):
+    pass
+
+
+_token_pattern = re.compile(
+    r"\s*(?:(?P<index>\d+)"
+    r"|(?P<name>#[A-Za-z0-9_]+|[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<value>:[A-Za-z0-9_]+)"
+    r"|(?P<operator><>|<=|>=|[=<>(),.\[\]+-]))"
+)
+_keywords = {"AND", "OR", "NOT", "BETWEEN", "IN", "SET", "REMOVE", "ADD", "DELETE"}
+_comparators = ("=", "<>", "<", "<=", ">", ">=")
+_condition_functions = {
+    "attribute_exists": 1,
+    "attribute_not_exists": 1,
+    "attribute_type": 2,
+    "begins_with": 2,
+    "contains": 2,
+}
+
+_ParsedExpression = namedtuple("_ParsedExpression", ["tree", "names", "values"])
+
+
+def _tokenize(expression: str) -> list:
+    tokens = list()
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _token_pattern.match(expression, position)
+        if match is None:
+            raise _ExpressionSyntaxError(expression[position:].split()[0])
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    tokens.append(("end", "<EOF>"))
+    return tokens
+
+
+class _ExpressionParser:
+    """
+    recursive descent parser of condition, update and projection expressions
+
+    The trees keep the #name and :value placeholders, hence are cached per
+    expression string and resolved on evaluation.
+    """
+
+    def __init__(self, expression: str):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.names = set()
+        self.values = set()
+
+    def peek(self, ahead: int = 0) -> tuple:
+        return self.tokens[min(self.position + ahead, len(self.tokens) - 1)]
+
+    def next(self) -> tuple:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def expect(self, text: str):
+        if self.next()[1] != text:
+            raise _ExpressionSyntaxError(self.tokens[self.position - 1][1])
+
+    def keyword(self, *keywords):
+        kind, text = self.peek()
+        if kind == "name" and text.upper() in keywords:
+            self.position += 1
+            return text.upper()
+        return None
+
+    def is_function(self, *functions) -> bool:
+        kind, text = self.peek()
+        return kind == "name" and text.lower() in functions and self.peek(1)[1] == "("
+
+    def end(self):
+        if self.peek()[0] != "end":
+            raise _ExpressionSyntaxError(self.peek()[1])
+
+    def name(self, text: str) -> str:
+        if text[0] == "#":
+            self.names.add(text)
+        elif text.upper() in _keywords:
+            raise _ExpressionSyntaxError(text)
+        return text
+
+    def path(self) -> tuple:
+        kind, text = self.next()
+        if kind != "name":
+            raise _ExpressionSyntaxError(text)
+        elements = [self.name(text)]
+        while True:
+            text = self.peek()[1]
+            if text == ".":
+                self.position += 1
+                kind, text = self.next()
+                if kind != "name":
+                    raise _ExpressionSyntaxError(text)
+                elements.append(self.name(text))
+            elif text == "[":
+                self.position += 1
+                kind, text = self.next()
+                if kind != "index":
+                    raise _ExpressionSyntaxError(text)
+                self.expect("]")
+                elements.append(int(text))
+            else:
+                return tuple(elements)
+
+    def value(self) -> tuple:
+        kind, text = self.next()
+        if kind != "value":
+            raise _ExpressionSyntaxError(text)
+        self.values.add(text)
+        return "value", text
+
+    def operand(self) -> tuple:
+        if self.peek()[0] == "value":
+            return self.value()
+        if self.is_function("size"):
+            self.position += 2
+            path = self.path()
+            self.expect(")")
+            return "size", path
+        return "path", self.path()
+
+    def condition(self) -> tuple:
+        node = self.conjunction()
+        while self.keyword("OR"):
+            node = ("or", node, self.conjunction())
+        return node
+
+    def conjunction(self) -> tuple:
+        node = self.negation()
+        while self.keyword("AND"):
+            node = ("and", node, self.negation())
+        return node
+
+    def negation(self) -> tuple:
+        if self.keyword("NOT"):
+            return "not", self.negation()
+        return self.primary()
+
+    def primary(self) -> tuple:
+        if self.peek()[1] == "(":
+            self.position += 1
+            node = self.condition()
+            self.expect(")")
+            return node
+        if self.is_function(*_condition_functions):
+            function = self.next()[1].lower()
+            self.position += 1
+            arguments = [self.operand()]
+            while self.peek()[1] == ",":
+                self.position += 1
+                arguments.append(self.operand())
+            self.expect(")")
+            if len(arguments) != _condition_functions[function]:
+                raise _ExpressionSyntaxError(function)
+            if function in ("attribute_exists", "attribute_not_exists"):
+                if arguments[0][0] != "path":
+                    raise _ExpressionSyntaxError(function)
+                return function, arguments[0][1]
+            return (function, *arguments)
+
+        operand = self.operand()
+        comparator = self.peek()[1]
+        if comparator in _comparators:
+            self.position += 1
+            return "compare", comparator, operand, self.operand()
+        if self.keyword("BETWEEN"):
+            low = self.operand()
+            if not self.keyword("AND"):
+                raise _ExpressionSyntaxError(self.peek()[1])
+            return "between", operand, low, self.operand()
+        if self.keyword("IN"):
+            self.expect("(")
+            operands = [self.operand()]
+            while self.peek()[1] == ",":
+                self.position += 1
+                operands.append(self.operand())
+            self.expect(")")
+            return "in", operand, tuple(operands)
+        raise _ExpressionSyntaxError(comparator)
+
+    def update(self) -> dict:
+        clauses = dict()
+        while self.peek()[0] != "end":
+            clause = self.keyword("SET", "REMOVE", "ADD", "DELETE")
+            if clause is None or clause in clauses:
+                raise _ExpressionSyntaxError(self.peek()[1])
+            actions = [self.update_action(clause)]
+            while self.peek()[1] == ",":
+                self.position += 1
+                actions.append(self.update_action(clause))
+            clauses[clause] = tuple(actions)
+        if not clauses:
+            raise _ExpressionSyntaxError("<EOF>")
+        return clauses
+
+    def update_action(self, clause: str):
+        path = self.path()
+        if clause == "REMOVE":
+            return path
+        if clause == "SET":
+            self.expect("=")
+            return path, self.set_value()
+        return path, self.value()
+
+    def set_value(self) -> tuple:
+        node = self.set_operand()
+        operator = self.peek()[1]
+        if operator in ("+", "-"):
+            self.position += 1
+            return operator, node, self.set_operand()
+        return node
+
+    def set_operand(self) -> tuple:
+        if self.is_function("if_not_exists"):
+            self.position += 2
+            path = self.path()
+            self.expect(",")
+            node = ("if_not_exists", path, self.set_operand())
+            self.expect(")")
+            return node
+        if self.is_function("list_append"):
+            self.position += 2
+            first = self.set_operand()
+            self.expect(",")
+            node = ("list_append", first, self.set_operand())
+            self.expect(")")
+            return node
+        if self.peek()[0] == "value":
+            return self.value()
+        return "path", self.path()
+
+    def projection(self) -> tuple:
+        paths = [self.path()]
+        while self.peek()[1] == ",":
+            self.position += 1
+            paths.append(self.path())
+        return tuple(paths)
+
+
+@lru_cache(maxsize=1024)
+def _parse(expression: str, rule: str) -> _ParsedExpression:
+    parser = _ExpressionParser(expression)
+    tree = getattr(parser, rule)()
+    parser.end()
+    return _ParsedExpression(tree, frozenset(parser.names), frozenset(parser.values))
+
+
+_expression_rules = {
+    "KeyConditionExpression": "condition",
+    "ConditionExpression": "condition",
+    "FilterExpression": "condition",
+    "UpdateExpression": "update",
+    "ProjectionExpression": "projection",
+}
+
+
+def _parse_expressions(request: dict, *keys) -> (dict, dict, dict):
+    """
+    parse the expressions of a request and check their placeholders
+
+    Returns the trees per expression key, the attribute names and the canonical
+    attribute values.
+    """
+    names = request.get("ExpressionAttributeNames", dict())
+    values = _canonical_item(request.get("ExpressionAttributeValues", dict()))
+    trees, used_names, used_values = dict(), set(), set()
+    for key in keys:
+        if key not in request:
+            continue
+        if not request[key].strip():
+            raise _validation_error(f"Invalid {key}: The expression can not be empty;")
+        try:
+            parsed = _parse(request[key], _expression_rules[key])
+        except _ExpressionSyntaxError as e:
+            raise _validation_error(
+                f'Invalid {key}: Syntax error; token: "{e}", near: "{request[key]}"'
+            )
+        for name in parsed.names:
+            if name not in names:
+                raise _validation_error(
+                    f"Invalid {key}: An expression attribute name used in the "
+                    f"document path is not defined; attribute name: {name}"
+                )
+        for value in parsed.values:
+            if value not in values:
+                raise _validation_error(
+                    f"Invalid {key}: An expression attribute value used in "
+                    f"expression is not defined; attribute value: {value}"
+                )
+        trees[key] = parsed.tree
+        used_names |= parsed.names
+        used_values |= parsed.values
+    if unused := set(names) - used_names:
+        raise _validation_error(
+            "Value provided in ExpressionAttributeNames unused in expressions: "
+            f"keys: {{{', '.join(sorted(unused))}}}"
+        )
+    if unused := set(values) - used_values:
+        raise _validation_error(
+            "Value provided in ExpressionAttributeValues unused in expressions: "
+            f"keys: {{{', '.join(sorted(unused))}}}"
+        )
+    return trees, names, values
+
+
+def _resolve_path(path: tuple, names: dict) -> tuple:
+    return tuple(
+        names[element] if isinstance(element, str) and element[0] == "#" else element
+        for element in path
+    )
+
+
+def _get_path(item: dict, path: tuple):
+    value = item.get(path[0])
+    for element in path[1:]:
+        if value is None:
+            return None
+        if isinstance(element, int):
+            if "L" not in value or element >= len(value["L"]):
+                return None
+            value = value["L"][element]
+        else:
+            if "M" not in value:
+                return None
+            value = value["M"].get(element)
+    return value
+
+
+def _check_overlapping_paths(paths: list, key: str):
+    for position, path in enumerate(paths):
+        for other in paths[position + 1 :]:
+            shorter = min(len(path), len(other))
+            if path[:shorter] == other[:shorter]:
+                raise _validation_error(
+                    f"Invalid {key}: Two document paths overlap with each other; "
+                    "must remove or rewrite one of these paths; "
+                    f"path one: {list(path)}, path two: {list(other)}"
+                )
+
+
+def _project(item: dict, paths: list) -> dict:
+    projected = dict()
+    list_containers = list()
+    for path in paths:
+        value = _get_path(item, path)
+        if value is None:
+            continue
+        container = projected
+        for element, following in zip(path, path[1:]):
+            data_type = "L" if isinstance(following, int) else "M"
+            if element not in container:
+                container[element] = {data_type: dict()}
+                if data_type == "L":
+                    list_containers.append(container[element])
+            container = container[element][data_type]
+        container[path[-1]] = value
+    # projected list elements keep their order without gaps
+    for container in list_containers:
+        container["L"] = [container["L"][i] for i in sorted(container["L"])]
+    return projected
+
+
+def _operand(node: tuple, item: dict, names: dict, values: dict):
+    kind = node[0]
+    if kind == "value":
+        return values[node[1]]
+    if kind == "path":
+        return _get_path(item, _resolve_path(node[1], names))
+    if kind == "size":
+        value = _get_path(item, _resolve_path(node[1], names))
+        return None if value is None else {"N": str(_size(value))}
+    if kind == "if_not_exists":
+        value = _get_path(item, _resolve_path(node[1], names))
+        return value if value is not None else _operand(node[2], item, names, values)
+
+    first = _operand(node[1], item, names, values)
+    second = _operand(node[2], item, names, values)
+    if first is None or second is None:
+        raise _validation_error(
+            "The provided expression refers to an attribute that does not exist in the "
+            "item"
+        )
+    if kind == "list_append":
+        if "L" not in first or "L" not in second:
+            raise _validation_error(
+                "An operand in the update expression has an incorrect data type"
+            )
+        return {"L": first["L"] + second["L"]}
+    if "N" not in first or "N" not in second:
+        raise _validation_error(
+            "An operand in the update expression has an incorrect data type"
+        )
+    if kind == "+":
+        number = _number_context.add(Decimal(first["N"]), Decimal(second["N"]))
+    else:
+        number = _number_context.subtract(Decimal(first["N"]), Decimal(second["N"]))
+    return {"N": _canonical_number(number)}
+
+
+def _evaluate(node: tuple, item: dict, names: dict, values: dict) -> bool:
+    kind = node[0]
+    if kind == "and":
+        return _evaluate(node[1], item, names, values) and _evaluate(
+            node[2], item, names, values
+        )
+    if kind == "or":
+        return _evaluate(node[1], item, names, values) or _evaluate(
+            node[2], item, names, values
+        )
+    if kind == "not":
+        return not _evaluate(node[1], item, names, values)
+    if kind == "attribute_exists":
+        return _get_path(item, _resolve_path(node[1], names)) is not None
+    if kind == "attribute_not_exists":
+        return _get_path(item, _resolve_path(node[1], names)) is None
+
+    first = _operand(node[2] if kind == "compare" else node[1], item, names, values)
+    if kind == "compare":
+        second = _operand(node[3], item, names, values)
+        comparator = node[1]
+        if comparator in ("=", "<>"):
+            equal = first is not None and second is not None and _equal(first, second)
+            return equal if comparator == "=" else not equal
+        pair = _ordered_pair(first, second)
+        if pair is None:
+            return False
+        if comparator == "<":
+            return pair[0] < pair[1]
+        if comparator == "<=":
+            return pair[0] <= pair[1]
+        if comparator == ">":
+            return pair[0] > pair[1]
+        return pair[0] >= pair[1]
+    if first is None:
+        return False
+    if kind == "between":
+        low = _ordered_pair(first, _operand(node[2], item, names, values))
+        high = _ordered_pair(first, _operand(node[3], item, names, values))
+        return low is not None and high is not None and low[1] <= low[0] <= high[1]
+    if kind == "in":
+        return any(
+            _equal(first, _operand(option, item, names, values)) for option in node[2]
+        )
+
+    second = _operand(node[2], item, names, values)
+    if kind == "attribute_type":
+        return second is not None and second.get("S") in first
+    if second is None:
+        return False
+    if kind == "begins_with":
+        pair = _ordered_pair(first, second)
+        return pair is not None and "N" not in first and pair[0].startswith(pair[1])
+    # contains
+    ((data_type, data),) = first.items()
+    if data_type == "S":
+        return "S" in second and second["S"] in data
+    if data_type in _set_types:
+        ((element_type, element),) = second.items()
+        if data_type != element_type + "S":
+            return False
+        if data_type == "NS":
+            return Decimal(element) in set(map(Decimal, data))
+        return element in data
+    if data_type == "L":
+        return any(_equal(value, second) for value in data)
+    return False
+
+
+def _document_path_error() -> _MemoryBackendError:
+    return _validation_error(
+        "The document path provided in the update expression is invalid for update"
+    )
+
+
+def _incorrect_operand_error() -> _MemoryBackendError:
+    return _validation_error(
+        "An operand in the update expression has an incorrect data type"
+    )
+
+
+def _parent_container(item: dict, path: tuple):
+    # the dict or list holding the last element of path, raises if not existing
+    if len(path) == 1:
+        return item
+    parent = _get_path(item, path[:-1])
+    data_type = "L" if isinstance(path[-1], int) else "M"
+    if parent is None or data_type not in parent:
+        raise _document_path_error()
+    return parent[data_type]
+
+
+def _set_in_container(container, element, value: dict):
+    if isinstance(element, int) and element >= len(container):
+        container.append(value)
+    else:
+        container[element] = value
+
+
+def _apply_update(
+    clauses: dict, item: dict, names: dict, values: dict, key_names: tuple
+) -> (dict, list):
+    """
+    apply the clauses of an update expression to a copy of item
+
+    Returns the updated item and the paths it updated.
+    """
+    resolved = {
+        clause: [
+            _resolve_path(action if clause == "REMOVE" else action[0], names)
+            for action in actions
+        ]
+        for clause, actions in clauses.items()
+    }
+    paths = [path for clause_paths in resolved.values() for path in clause_paths]
+    _check_overlapping_paths(paths, "UpdateExpression")
+    for path in paths:
+        if path[0] in key_names:
+            raise _validation_error(
+                "One or more parameter values were invalid: Cannot update attribute "
+                f"{path[0]}. This attribute is part of the key"
+            )
+
+    # all operands refer to the item before the update
+    new_values = [
+        _operand(value, item, names, values) for _, value in clauses.get("SET", ())
+    ]
+    updated = _copy(item)
+
+    for path, value in zip(resolved.get("SET", ()), new_values):
+        _set_in_container(_parent_container(updated, path), path[-1], value)
+
+    list_removals = dict()
+    for path in resolved.get("REMOVE", ()):
+        container = _parent_container(updated, path)
+        if isinstance(path[-1], int):
+            list_removals.setdefault(id(container), (container, list()))[1].append(
+                path[-1]
+            )
+        else:
+            container.pop(path[-1], None)
+    for container, positions in list_removals.values():
+        for position in sorted(positions, reverse=True):
+            if position < len(container):
+                del container[position]
+
+    for path, (_, (_, placeholder)) in zip(
+        resolved.get("ADD", ()), clauses.get("ADD", ())
+    ):
+        value = values[placeholder]
+        ((data_type, data),) = value.items()
+        if data_type != "N" and data_type not in _set_types:
+            raise _incorrect_operand_error()
+        container = _parent_container(updated, path)
+        existing = _get_path(updated, path)
+        if existing is None:
+            _set_in_container(container, path[-1], value)
+        elif data_type not in existing:
+            raise _incorrect_operand_error()
+        elif data_type == "N":
+            number = _number_context.add(Decimal(existing["N"]), Decimal(data))
+            container[path[-1]] = {"N": _canonical_number(number)}
+        else:
+            present = set(existing[data_type])
+            container[path[-1]] = {
+                data_type: existing[data_type] + [i for i in data if i not in present]
+            }
+
+    for path, (_, (_, placeholder)) in zip(
+        resolved.get("DELETE", ()), clauses.get("DELETE", ())
+    ):
+        ((data_type, data),) = values[placeholder].items()
+        if data_type not in _set_types:
+            raise _incorrect_operand_error()
+        container = _parent_container(updated, path)
+        existing = _get_path(updated, path)
+        if existing is None:
+            continue
+        if data_type not in existing:
+            raise _incorrect_operand_error()
+        removed = set(data)
+        remaining = [i for i in existing[data_type] if i not in removed]
+        if remaining:
+            container[path[-1]] = {data_type: remaining}
+        else:
+            del container[path[-1]]
+
+    return updated, paths
+
+
+# storage
+
+
+class _Top:
+    """
+    greater than any sort key element, for bisecting behind all keys with a prefix
+    """
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_top = _Top()
+
+
+def _partition_hash(hash_value) -> int:
+    if isinstance(hash_value, str):
+        return crc32(hash_value.encode())
+    if isinstance(hash_value, bytes):
+        return crc32(hash_value)
+    return crc32(str(hash_value).encode())
+
+
+class _Partition:
+    """
+    the entries of one partition key value, ordered by their sort key tuple
+    """
+
+    __slots__ = ("keys", "entries")
+
+    def __init__(self):
+        self.keys = list()
+        self.entries = dict()
+
+    def put(self, sort_key: tuple, entry: tuple):
+        if sort_key not in self.entries:
+            insort(self.keys, sort_key)
+        self.entries[sort_key] = entry
+
+    def remove(self, sort_key: tuple):
+        del self.entries[sort_key]
+        del self.keys[bisect_left(self.keys, sort_key)]
+
+
+class _SortedStore:
+    """
+    partitions of a table or index, scanned in the order of the hashed partition key
+    """
+
+    def __init__(self):
+        self.partitions = dict()
+        self.order = list()
+
+    def __len__(self):
+        return sum(len(partition.entries) for partition in self.partitions.values())
+
+    def get(self, hash_value, sort_key: tuple):
+        partition = self.partitions.get(hash_value)
+        if partition is None:
+            return None
+        return partition.entries.get(sort_key)
+
+    def put(self, hash_value, sort_key: tuple, entry: tuple):
+        partition = self.partitions.get(hash_value)
+        if partition is None:
+            partition = self.partitions[hash_value] = _Partition()
+            insort(self.order, (_partition_hash(hash_value), hash_value))
+        partition.put(sort_key, entry)
+
+    def remove(self, hash_value, sort_key: tuple):
+        partition = self.partitions[hash_value]
+        partition.remove(sort_key)
+        if not partition.entries:
+            del self.partitions[hash_value]
+            position = (_partition_hash(hash_value), hash_value)
+            del self.order[bisect_left(self.order, position)]
+
+    def scan(self, segment: int, total_segments: int, start: tuple = None):
+        # segments are contiguous ranges of the 32 bit partition hash
+        end = (segment + 1) * 2**32 // total_segments
+        if start is None:
+            position = bisect_left(self.order, (segment * 2**32 // total_segments,))
+        else:
+            position = bisect_left(self.order, (_partition_hash(start[0]), start[0]))
+        while position < len(self.order):
+            partition_hash, hash_value = self.order[position]
+            if partition_hash >= end:
+                return
+            partition = self.partitions[hash_value]
+            keys = partition.keys
+            index = 0
+            if start is not None and hash_value == start[0]:
+                index = bisect_right(keys, start[1])
+            start = None
+            while index < len(keys):
+                yield hash_value, keys[index], partition.entries[keys[index]]
+                index += 1
+            position += 1
+
+
+def _key_names(key_schema: list) -> tuple:
+    hash_key = [k["AttributeName"] for k in key_schema if k["KeyType"] == "HASH"]
+    range_key = [k["AttributeName"] for k in key_schema if k["KeyType"] == "RANGE"]
+    if len(hash_key) != 1 or len(range_key) > 1:
+        raise _validation_error("Invalid KeySchema: exactly one HASH key is required")
+    return hash_key[0], range_key[0] if range_key else None
+
+
+class _MemoryIndex:
+    def __init__(self, definition: dict, table: "_MemoryTable", is_local: bool):
+        self.name = definition["IndexName"]
+        self.hash_key, self.range_key = _key_names(definition["KeySchema"])
+        self.key_names = tuple(k for k in (self.hash_key, self.range_key) if k)
+        self.is_local = is_local
+        projection = definition.get("Projection", {"ProjectionType": "ALL"})
+        self.projects_all = projection["ProjectionType"] == "ALL"
+        self.attributes = set(table.key_names + self.key_names).union(
+            projection.get("NonKeyAttributes", list())
+        )
+        self.store = _SortedStore()
+
+    def entry_key(self, item: dict, base_key: tuple):
+        # items without the index keys are not part of the index
+        if self.hash_key not in item or (self.range_key and self.range_key not in item):
+            return None
+        sort_key = (_key_value(item[self.range_key]),) if self.range_key else ()
+        return _key_value(item[self.hash_key]), sort_key + (base_key[0],) + base_key[1]
+
+    def project(self, item: dict) -> dict:
+        if self.projects_all:
+            return item
+        return {name: value for name, value in item.items() if name in self.attributes}
+
+
+class _MemoryTable:
+    def __init__(self, definition: dict):
+        self.name = definition["TableName"]
+        self.attribute_types = {
+            d["AttributeName"]: d["AttributeType"]
+            for d in definition.get("AttributeDefinitions", list())
+        }
+        self.hash_key, self.range_key = _key_names(definition["KeySchema"])
+        self.key_names = tuple(k for k in (self.hash_key, self.range_key) if k)
+        self.store = _SortedStore()
+        self.indexes = dict()
+        for index_type, is_local in [
+            ("LocalSecondaryIndexes", True),
+            ("GlobalSecondaryIndexes", False),
+        ]:
+            for index_definition in definition.get(index_type, list()):
+                index = _MemoryIndex(index_definition, self, is_local)
+                self.indexes[index.name] = index
+        for index in [self, *self.indexes.values()]:
+            for name in index.key_names:
+                if name not in self.attribute_types:
+                    raise _validation_error(
+                        "One or more parameter values were invalid: Some index key "
+                        "attributes are not defined in AttributeDefinitions"
+                    )
+        self.description = self.__description(definition)
+
+    def __description(self, definition: dict) -> dict:
+        arn = f"arn:aws:dynamodb:{region_name}:000000000000:table/{self.name}"
+        billing_mode = definition.get("BillingMode", "PROVISIONED")
+        description = {
+            "AttributeDefinitions": definition.get("AttributeDefinitions", list()),
+            "TableName": self.name,
+            "KeySchema": definition["KeySchema"],
+            "TableStatus": "ACTIVE",
+            "CreationDateTime": time(),
+            "TableArn": arn,
+            "BillingModeSummary": {"BillingMode": billing_mode},
+        }
+        if "ProvisionedThroughput" in definition:
+            description["ProvisionedThroughput"] = dict(
+                definition["ProvisionedThroughput"], NumberOfDecreasesToday=0
+            )
+        for index_type in ["LocalSecondaryIndexes", "GlobalSecondaryIndexes"]:
+            if index_type in definition:
+                description[index_type] = [
+                    dict(
+                        index_definition,
+                        IndexArn=f"{arn}/index/{index_definition['IndexName']}",
+                        **(
+                            {"IndexStatus": "ACTIVE"}
+                            if index_type == "GlobalSecondaryIndexes"
+                            else dict()
+                        ),
+                    )
+                    for index_definition in definition[index_type]
+                ]
+        return description
+
+    def describe(self) -> dict:
+        item_count = len(self.store)
+        description = dict(self.description, ItemCount=item_count)
+        for index_type in ["LocalSecondaryIndexes", "GlobalSecondaryIndexes"]:
+            if index_type in description:
+                description[index_type] = [
+                    dict(
+                        index,
+                        ItemCount=len(self.indexes[index["IndexName"]].store),
+                    )
+                    for index in description[index_type]
+                ]
+        return description
+
+    def index(self, index_name: str) -> _MemoryIndex:
+        if index_name not in self.indexes:
+            raise _validation_error(
+                f"The table does not have the specified index: {index_name}"
+            )
+        return self.indexes[index_name]
+
+    def typed_key_value(self, value: dict, name: str, index_name: str = None):
+        ((data_type, data),) = value.items()
+        if data_type != self.attribute_types[name]:
+            raise _validation_error(
+                "One or more parameter values were invalid: Type mismatch for "
+                + (f"Index Key {name}" if index_name else f"key {name}")
+                + f" expected: {self.attribute_types[name]} actual: {data_type}"
+                + (f" IndexName: {index_name}" if index_name else "")
+            )
+        if data == "":
+            raise _validation_error(
+                "One or more parameter values are not valid. The AttributeValue for a "
+                f"key attribute cannot contain an empty string value. Key: {name}"
+            )
+        return _key_value(value)
+
+    def key(self, key: dict) -> tuple:
+        if len(key) != len(self.key_names) or any(
+            name not in key for name in self.key_names
+        ):
+            raise _validation_error(
+                "The provided key element does not match the schema"
+            )
+        return self.item_key(key)
+
+    def item_key(self, item: dict) -> tuple:
+        hash_value = self.typed_key_value(item[self.hash_key], self.hash_key)
+        if self.range_key is None:
+            return hash_value, ()
+        return hash_value, (self.typed_key_value(item[self.range_key], self.range_key),)
+
+    def check_item(self, item: dict) -> (tuple, int):
+        for name in self.key_names:
+            if name not in item:
+                raise _validation_error(
+                    "One or more parameter values were invalid: Missing the key "
+                    f"{name} in the item"
+                )
+        for index in self.indexes.values():
+            for name in index.key_names:
+                if name in item and name not in self.key_names:
+                    self.typed_key_value(item[name], name, index.name)
+        size = _item_size(item)
+        if size > _maximum_item_size:
+            raise _validation_error("Item size has exceeded the maximum allowed size")
+        return self.item_key(item), size
+
+    def get(self, key: tuple):
+        entry = self.store.get(*key)
+        return None if entry is None else entry[0]
+
+    def write(self, key: tuple, old_item: (dict, None), new_item: dict, size: int):
+        if old_item is not None:
+            for index in self.indexes.values():
+                if index_key := index.entry_key(old_item, key):
+                    index.store.remove(*index_key)
+        if new_item is None:
+            if old_item is not None:
+                self.store.remove(*key)
+            return
+        entry = (new_item, size)
+        self.store.put(*key, entry)
+        for index in self.indexes.values():
+            if index_key := index.entry_key(new_item, key):
+                index.store.put(*index_key, entry)
+
+    def last_evaluated_key(self, item: dict, index: _MemoryIndex = None) -> dict:
+        names = self.key_names + (index.key_names if index else ())
+        return {name: item[name] for name in names}
+
+    def start_key(self, start: dict, index: _MemoryIndex = None) -> tuple:
+        names = self.key_names + (index.key_names if index else ())
+        if any(name not in start for name in names) or len(start) != len(set(names)):
+            raise _validation_error(
+                "The provided starting key is invalid: The provided key element does "
+                "not match the schema"
+            )
+        start = _canonical_item(start)
+        key = self.item_key(start)
+        return index.entry_key(start, key) if index else key
+
+
+# planned writes are checked completely before any of them is applied
+
+_PlannedWrite = namedtuple(
+    "_PlannedWrite", ["table", "key", "old_item", "new_item", "size", "paths"]
+)
+
+
+def _read_units(size: int, consistent: bool) -> float:
+    return max(ceil(size / 4096), 1) * (1.0 if consistent else 0.5)
+
+
+def _write_units(size: int) -> float:
+    return float(max(ceil(size / 1024), 1))
+
+
+def _consumed_capacity(request: dict, table_name: str, units) -> (dict, None):
+    # units is only called if the capacity is requested
+    if request.get("ReturnConsumedCapacity", "NONE") == "NONE":
+        return None
+    return {"TableName": table_name, "CapacityUnits": units()}
+
+
+class _MemoryEngine:
+    """
+    process-wide in-memory implementation of the DynamoDB JSON protocol
+    """
+
+    def __init__(self):
+        self.tables = dict()
+        self.lock = RLock()
+        self.operations = {
+            "CreateTable": self.create_table,
+            "DeleteTable": self.delete_table,
+            "DescribeTable": self.describe_table,
+            "ListTables": self.list_tables,
+            "GetItem": self.get_item,
+            "PutItem": self.put_item,
+            "DeleteItem": self.delete_item,
+            "UpdateItem": self.update_item,
+            "Query": self.query,
+            "Scan": self.scan,
+            "BatchGetItem": self.batch_get_item,
+            "BatchWriteItem": self.batch_write_item,
+            "TransactGetItems": self.transact_get_items,
+            "TransactWriteItems": self.transact_write_items,
+        }
+
+    def handle(self, operation: str, request: dict) -> dict:
+        if operation not in self.operations:
+            raise _MemoryBackendError(
+                "UnknownOperationException",
+                f"{operation} is not supported by the in-memory backend",
+            )
+        with self.lock:
+            return self.operations[operation](request)
+
+    def table(self, table_name: str) -> _MemoryTable:
+        if table_name not in self.tables:
+            raise _MemoryBackendError(
+                "ResourceNotFoundException", "Requested resource not found"
+            )
+        return self.tables[table_name]
+
+    # control plane
+
+    def create_table(self, request: dict) -> dict:
+        if request["TableName"] in self.tables:
+            raise _MemoryBackendError(
+                "ResourceInUseException",
+                f"Table already exists: {request['TableName']}",
+            )
+        table = _MemoryTable(request)
+        self.tables[table.name] = table
+        return {"TableDescription": table.describe()}
+
+    def delete_table(self, request: dict) -> dict:
+        description = self.table(request["TableName"]).describe()
+        del self.tables[request["TableName"]]
+        return {"TableDescription": dict(description, TableStatus="DELETING")}
+
+    def describe_table(self, request: dict) -> dict:
+        if request["TableName"] not in self.tables:
+            raise _MemoryBackendError(
+                "ResourceNotFoundException",
+                f"Requested resource not found: Table: {request['TableName']} not found",
+            )
+        return {"Table": self.tables[request["TableName"]].describe()}
+
+    def list_tables(self, request: dict) -> dict:
+        names = sorted(self.tables)
+        if "ExclusiveStartTableName" in request:
+            names = names[bisect_right(names, request["ExclusiveStartTableName"]) :]
+        limit = request.get("Limit", 100)
+        response = {"TableNames": names[:limit]}
+        if len(names) > limit:
+            response["LastEvaluatedTableName"] = names[limit - 1]
+        return response
+
+    # single item operations
+
+    def get_item(self, request: dict) -> dict:
+        table = self.table(request["TableName"])
+        trees, names, _ = _parse_expressions(request, "ProjectionExpression")
+        item = table.get(table.key(_canonical_item(request["Key"])))
+        response = dict()
+        if item is not None:
+            response["Item"] = self.__projected(item, trees, names)
+        if capacity := _consumed_capacity(
+            request,
+            table.name,
+            lambda: _read_units(
+                _item_size(item or {}), request.get("ConsistentRead", False)
+            ),
+        ):
+            response["ConsumedCapacity"] = capacity
+        return response
+
+    @staticmethod
+    def __projected(item: dict, trees: dict, names: dict) -> dict:
+        if "ProjectionExpression" not in trees:
+            return item
+        paths = [_resolve_path(path, names) for path in trees["ProjectionExpression"]]
+        _check_overlapping_paths(paths, "ProjectionExpression")
+        return _project(item, paths)
+
+    @staticmethod
+    def __condition_passes(trees: dict, names: dict, values: dict, old_item) -> bool:
+        return "ConditionExpression" not in trees or _evaluate(
+            trees["ConditionExpression"], old_item or dict(), names, values
+        )
+
+    def plan_put(self, request: dict) -> (_PlannedWrite, bool):
+        table = self.table(request["TableName"])
+        trees, names, values = _parse_expressions(request, "ConditionExpression")
+        item = _canonical_item(request["Item"])
+        key, size = table.check_item(item)
+        old_item = table.get(key)
+        passed = self.__condition_passes(trees, names, values, old_item)
+        return _PlannedWrite(table, key, old_item, item, size, None), passed
+
+    def plan_delete(self, request: dict) -> (_PlannedWrite, bool):
+        table = self.table(request["TableName"])
+        trees, names, values = _parse_expressions(request, "ConditionExpression")
+        key = table.key(_canonical_item(request["Key"]))
+        old_item = table.get(key)
+        passed = self.__condition_passes(trees, names, values, old_item)
+        return _PlannedWrite(table, key, old_item, None, 0, None), passed
+
+    def plan_condition_check(self, request: dict) -> (_PlannedWrite, bool):
+        table = self.table(request["TableName"])
+        trees, names, values = _parse_expressions(request, "ConditionExpression")
+        key = table.key(_canonical_item(request["Key"]))
+        old_item = table.get(key)
+        passed = self.__condition_passes(trees, names, values, old_item)
+        return _PlannedWrite(table, key, old_item, old_item, None, None), passed
+
+    def plan_update(self, request: dict) -> (_PlannedWrite, bool):
+        table = self.table(request["TableName"])
+        trees, names, values = _parse_expressions(
+            request, "UpdateExpression", "ConditionExpression"
+        )
+        key_item = _canonical_item(request["Key"])
+        key = table.key(key_item)
+        old_item = table.get(key)
+        if not self.__condition_passes(trees, names, values, old_item):
+            return _PlannedWrite(table, key, old_item, None, 0, None), False
+
+        new_item, paths = old_item or key_item, list()
+        if "UpdateExpression" in trees:
+            new_item, paths = _apply_update(
+                trees["UpdateExpression"], new_item, names, values, table.key_names
+            )
+        _, size = table.check_item(new_item)
+        return _PlannedWrite(table, key, old_item, new_item, size, paths), True
+
+    @staticmethod
+    def commit(write: _PlannedWrite):
+        if write.size is not None:
+            write.table.write(write.key, write.old_item, write.new_item, write.size)
+
+    def __single_write(self, plan, request: dict, return_values: tuple) -> tuple:
+        if request.get("ReturnValues", "NONE") not in return_values:
+            raise _validation_error("Return values set to invalid value")
+        write, passed = plan(request)
+        if not passed:
+            raise _condition_failed(write.old_item, request)
+        self.commit(write)
+        response = dict()
+        if capacity := _consumed_capacity(
+            request,
+            write.table.name,
+            lambda: _write_units(max(write.size, _item_size(write.old_item or {}))),
+        ):
+            response["ConsumedCapacity"] = capacity
+        return write, response
+
+    def put_item(self, request: dict) -> dict:
+        write, response = self.__single_write(
+            self.plan_put, request, ("NONE", "ALL_OLD")
+        )
+        if request.get("ReturnValues") == "ALL_OLD" and write.old_item:
+            response["Attributes"] = write.old_item
+        return response
+
+    def delete_item(self, request: dict) -> dict:
+        write, response = self.__single_write(
+            self.plan_delete, request, ("NONE", "ALL_OLD")
+        )
+        if request.get("ReturnValues") == "ALL_OLD" and write.old_item:
+            response["Attributes"] = write.old_item
+        return response
+
+    def update_item(self, request: dict) -> dict:
+        write, response = self.__single_write(
+            self.plan_update,
+            request,
+            ("NONE", "ALL_OLD", "UPDATED_OLD", "ALL_NEW", "UPDATED_NEW"),
+        )
+        return_values = request.get("ReturnValues", "NONE")
+        attributes = None
+        if return_values == "ALL_OLD":
+            attributes = write.old_item
+        elif return_values == "ALL_NEW":
+            attributes = write.new_item
+        elif return_values == "UPDATED_OLD" and write.old_item:
+            attributes = _project(write.old_item, write.paths)
+        elif return_values == "UPDATED_NEW":
+            attributes = _project(write.new_item, write.paths)
+        if attributes:
+            response["Attributes"] = attributes
+        return response
+
+    # reads of many items
+
+    def __page(self, request: dict, table, index, entries, trees, names, values):
+        limit = request.get("Limit")
+        if limit is not None and limit < 1:
+            raise _validation_error("Limit must be greater than or equal to 1")
+        select = request.get("Select")
+        if select is None:
+            # the defaults of DynamoDB, an index projection holds ALL_PROJECTED ones
+            if "ProjectionExpression" in trees:
+                select = "SPECIFIC_ATTRIBUTES"
+            elif index is not None:
+                select = "ALL_PROJECTED_ATTRIBUTES"
+            else:
+                select = "ALL_ATTRIBUTES"
+        if (
+            index is not None
+            and select == "ALL_ATTRIBUTES"
+            and not index.is_local
+            and not index.projects_all
+        ):
+            raise _validation_error(
+                "One or more parameter values were invalid: Select type ALL_ATTRIBUTES "
+                f"is not supported for global secondary index {index.name} because "
+                "its projection type is not ALL"
+            )
+        # local indexes fetch attributes beyond their projection from the table
+        full_items = index is None or (
+            index.is_local and select in ("ALL_ATTRIBUTES", "SPECIFIC_ATTRIBUTES")
+        )
+        filter_tree = trees.get("FilterExpression")
+
+        items, scanned, size, last_item = list(), 0, 0, None
+        for _, _, (item, item_size) in entries:
+            scanned += 1
+            size += item_size
+            visible = item if full_items else index.project(item)
+            if filter_tree is None or _evaluate(filter_tree, visible, names, values):
+                items.append(visible)
+            if scanned == limit or size >= _maximum_page_size:
+                last_item = item
+                break
+
+        response = {"Count": len(items), "ScannedCount": scanned}
+        if select != "COUNT":
+            response["Items"] = [self.__projected(item, trees, names) for item in items]
+        if last_item is not None:
+            response["LastEvaluatedKey"] = table.last_evaluated_key(last_item, index)
+        if capacity := _consumed_capacity(
+            request,
+            table.name,
+            lambda: _read_units(size, request.get("ConsistentRead", False)),
+        ):
+            response["ConsumedCapacity"] = capacity
+        return response
+
+    def query(self, request: dict) -> dict:
+        table = self.table(request["TableName"])
+        index = table.index(request["IndexName"]) if "IndexName" in request else None
+        trees, names, values = _parse_expressions(
+            request,
+            "KeyConditionExpression",
+            "FilterExpression",
+            "ProjectionExpression",
+        )
+        if "KeyConditionExpression" not in trees:
+            raise _validation_error(
+                "Either the KeyConditions or KeyConditionExpression parameter must be "
+                "specified in the request."
+            )
+        hash_key, range_key = (index or table).hash_key, (index or table).range_key
+        hash_condition, range_condition = _key_conditions(
+            trees["KeyConditionExpression"], names, hash_key, range_key
+        )
+        hash_value = self.__key_condition_value(
+            table, hash_condition[3], values, hash_key
+        )
+        partition = (index or table).store.partitions.get(hash_value)
+        entries = list()
+        if partition is not None:
+            keys = partition.keys
+            low, high = self.__sort_key_range(
+                table, keys, range_condition, values, range_key
+            )
+            forward = request.get("ScanIndexForward", True)
+            if "ExclusiveStartKey" in request:
+                _, start = table.start_key(request["ExclusiveStartKey"], index)
+                if forward:
+                    low = max(low, bisect_right(keys, start))
+                else:
+                    high = min(high, bisect_left(keys, start))
+            positions = range(low, high) if forward else range(high - 1, low - 1, -1)
+            entries = (
+                (hash_value, keys[position], partition.entries[keys[position]])
+                for position in positions
+            )
+        return self.__page(request, table, index, entries, trees, names, values)
+
+    @staticmethod
+    def __key_condition_value(table, node: tuple, values: dict, name: str):
+        if node[0] != "value":
+            raise _validation_error(
+                "Invalid KeyConditionExpression: the key must be compared to a value"
+            )
+        value = values[node[1]]
+        ((data_type, _),) = value.items()
+        if data_type != table.attribute_types[name]:
+            raise _validation_error(
+                "One or more parameter values were invalid: Condition parameter type "
+                "does not match schema type"
+            )
+        return _key_value(value)
+
+    def __sort_key_range(self, table, keys: list, condition, values, name) -> tuple:
+        if condition is None:
+            return 0, len(keys)
+        kind = condition[0]
+        if kind == "between":
+            low = self.__key_condition_value(table, condition[2], values, name)
+            high = self.__key_condition_value(table, condition[3], values, name)
+            if low > high:
+                raise _validation_error(
+                    "Invalid KeyConditionExpression: The BETWEEN operator requires "
+                    "upper bound to be greater than or equal to lower bound"
+                )
+            return bisect_left(keys, (low,)), bisect_right(keys, (high, _top))
+        if kind == "begins_with":
+            prefix = self.__key_condition_value(table, condition[2], values, name)
+            if isinstance(prefix, Decimal):
+                raise _validation_error(
+                    "Invalid KeyConditionExpression: Incorrect operand type for "
+                    "operator or function; operator or function: begins_with, "
+                    "operand type: N"
+                )
+            low = high = bisect_left(keys, (prefix,))
+            while high < len(keys) and keys[high][0].startswith(prefix):
+                high += 1
+            return low, high
+        value = self.__key_condition_value(table, condition[3], values, name)
+        comparator = condition[1]
+        if comparator == "=":
+            return bisect_left(keys, (value,)), bisect_right(keys, (value, _top))
+        if comparator == "<":
+            return 0, bisect_left(keys, (value,))
+        if comparator == "<=":
+            return 0, bisect_right(keys, (value, _top))
+        if comparator == ">":
+            return bisect_right(keys, (value, _top)), len(keys)
+        return bisect_left(keys, (value,)), len(keys)
+
+    def scan(self, request: dict) -> dict:
+        table = self.table(request["TableName"])
+        index = table.index(request["IndexName"]) if "IndexName" in request else None
+        trees, names, values = _parse_expressions(
+            request, "FilterExpression", "ProjectionExpression"
+        )
+        segment = request.get("Segment")
+        total_segments = request.get("TotalSegments")
+        if (segment is None) != (total_segments is None):
+            raise _validation_error(
+                "The TotalSegments parameter is required but was not present in the "
+                "request when Segment parameter is present"
+                if total_segments is None
+                else "The Segment parameter is required but was not present in the "
+                "request when parameter TotalSegments is present"
+            )
+        if total_segments is None:
+            segment, total_segments = 0, 1
+        elif not 0 <= segment < total_segments <= 1000000:
+            raise _validation_error(
+                f"The Segment parameter is zero-based and must be less than parameter "
+                f"TotalSegments: Segment: {segment} is not less than TotalSegments: "
+                f"{total_segments}"
+            )
+        start = None
+        if "ExclusiveStartKey" in request:
+            start = table.start_key(request["ExclusiveStartKey"], index)
+        entries = (index or table).store.scan(segment, total_segments, start)
+        return self.__page(request, table, index, entries, trees, names, values)
+
+    def batch_get_item(self, request: dict) -> dict:
+        request_items = request["RequestItems"]
+        if sum(len(r["Keys"]) for r in request_items.values()) > _batch_get_limit:
+            raise _validation_error(
+                "Too many items requested for the BatchGetItem call"
+            )
+        responses, capacities = dict(), list()
+        for table_name, table_request in request_items.items():
+            table = self.table(table_name)
+            trees, names, _ = _parse_expressions(table_request, "ProjectionExpression")
+            keys = [table.key(_canonical_item(key)) for key in table_request["Keys"]]
+            if len(set(keys)) != len(keys):
+                raise _validation_error(
+                    "Provided list of item keys contains duplicates"
+                )
+            items = [item for item in map(table.get, keys) if item is not None]
+            responses[table_name] = [
+                self.__projected(item, trees, names) for item in items
+            ]
+            if capacity := _consumed_capacity(
+                request,
+                table_name,
+                lambda: sum(
+                    _read_units(
+                        _item_size(item), table_request.get("ConsistentRead", False)
+                    )
+                    for item in items
+                ),
+            ):
+                capacities.append(capacity)
+        response = {"Responses": responses, "UnprocessedKeys": dict()}
+        if capacities:
+            response["ConsumedCapacity"] = capacities
+        return response
+
+    def batch_write_item(self, request: dict) -> dict:
+        request_items = request["RequestItems"]
+        if sum(map(len, request_items.values())) > _batch_write_limit:
+            raise _validation_error(
+                "Too many items requested for the BatchWriteItem call"
+            )
+        writes, capacities = list(), list()
+        for table_name, write_requests in request_items.items():
+            table = self.table(table_name)
+            keys = set()
+            for write_request in write_requests:
+                if "PutRequest" in write_request:
+                    item = _canonical_item(write_request["PutRequest"]["Item"])
+                    key, size = table.check_item(item)
+                else:
+                    item, size = None, 0
+                    key = table.key(
+                        _canonical_item(write_request["DeleteRequest"]["Key"])
+                    )
+                if key in keys:
+                    raise _validation_error(
+                        "Provided list of item keys contains duplicates"
+                    )
+                keys.add(key)
+                writes.append(_PlannedWrite(table, key, None, item, size, None))
+            if capacity := _consumed_capacity(
+                request,
+                table_name,
+                lambda: sum(_write_units(w.size) for w in writes if w.table is table),
+            ):
+                capacities.append(capacity)
+        for write in writes:
+            self.commit(write._replace(old_item=write.table.get(write.key)))
+        response = {"UnprocessedItems": dict()}
+        if capacities:
+            response["ConsumedCapacity"] = capacities
+        return response
+
+    def transact_get_items(self, request: dict) -> dict:
+        if len(request["TransactItems"]) > _transact_limit:
+            raise _validation_error(
+                f"Member must have length less than or equal to {_transact_limit}"
+            )
+        responses = list()
+        for transact_item in request["TransactItems"]:
+            response = self.get_item(transact_item["Get"])
+            responses.append({"Item": response["Item"]} if "Item" in response else {})
+        return {"Responses": responses}
+
+    def transact_write_items(self, request: dict) -> dict:
+        if len(request["TransactItems"]) > _transact_limit:
+            raise _validation_error(
+                f"Member must have length less than or equal to {_transact_limit}"
+            )
+        plans = {
+            "ConditionCheck": self.plan_condition_check,
+            "Put": self.plan_put,
+            "Delete": self.plan_delete,
+            "Update": self.plan_update,
+        }
+        writes, reasons, items = list(), list(), set()
+        for transact_item in request["TransactItems"]:
+            ((kind, action),) = transact_item.items()
+            try:
+                write, passed = plans[kind](action)
+            except _MemoryBackendError as e:
+                if e.code != "ValidationException" or "Key" not in action:
+                    raise e
+                writes.append(None)
+                reasons.append({"Code": "ValidationError", "Message": e.message})
+                continue
+            if (write.table.name, write.key) in items:
+                raise _validation_error(
+                    "Transaction request cannot include multiple operations on one item"
+                )
+            items.add((write.table.name, write.key))
+            writes.append(write)
+            if passed:
+                reasons.append({"Code": "None"})
+            else:
+                reason = {
+                    "Code": "ConditionalCheckFailed",
+                    "Message": "The conditional request failed",
+                }
+                failure = _condition_failed(write.old_item, action)
+                reason.update(failure.details)
+                reasons.append(reason)
+
+        if any(reason["Code"] != "None" for reason in reasons):
+            codes = ", ".join(reason["Code"] for reason in reasons)
+            raise _MemoryBackendError(
+                "TransactionCanceledException",
+                "Transaction cancelled, please refer cancellation reasons for specific "
+                f"reasons [{codes}]",
+                CancellationReasons=reasons,
+            )
+        for write in writes:
+            self.commit(write)
+        return dict()
+
+
+def _key_conditions(tree: tuple, names: dict, hash_key: str, range_key: str):
+    conditions, nodes = list(), [tree]
+    while nodes:
+        node = nodes.pop()
+        if node[0] == "and":
+            nodes.extend((node[2], node[1]))
+        else:
+            conditions.append(node)
+
+    hash_condition = range_condition = None
+    for node in conditions:
+        path = node[2] if node[0] == "compare" else node[1]
+        name = None
+        if path[0] == "path" and len(path[1]) == 1:
+            (name,) = _resolve_path(path[1], names)
+        if (
+            name == hash_key
+            and hash_condition is None
+            and node[0] == "compare"
+            and node[1] == "="
+        ):
+            hash_condition = node
+        elif (
+            name == range_key
+            and range_condition is None
+            and (
+                node[0] in ("between", "begins_with")
+                or (node[0] == "compare" and node[1] != "<>")
+            )
+        ):
+            range_condition = node
+        else:
+            raise _validation_error(
+                "Query key condition not supported"
+                if name in (hash_key, range_key)
+                else f"Query condition missed key schema element: {hash_key}"
+            )
+    if hash_condition is None:
+        raise _validation_error(
+            f"Query condition missed key schema element: {hash_key}"
+        )
+    return hash_condition, range_condition
+
+
+# connection to botocore
+
+_engine = _MemoryEngine()
+
+
+class _RawResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+def _send_to_memory_engine(request, **kwargs) -> AWSResponse:
+    target = request.headers["X-Amz-Target"]
+    if isinstance(target, bytes):
+        target = target.decode()
+    operation = target.rsplit(".", 1)[-1]
+    try:
+        status, payload = 200, _engine.handle(
+            operation, json.loads(request.body or "{}")
+        )
+    except _MemoryBackendError as e:
+        status = 400
+        payload = {"__type": _error_type_prefix + e.code, "message": e.message}
+        payload.update(e.details)
+    return AWSResponse(
+        request.url,
+        status,
+        {"Content-Type": "application/x-amz-json-1.0"},
+        _RawResponse(json.dumps(payload, separators=(",", ":")).encode()),
+    )
+
+
+def attach_memory_backend(ddb_client):
+    """
+    answer the requests of a boto3 DynamoDB client from the in-memory engine
+
+    All attached clients of a process share the tables of one engine; no network
+    connections, containers or credentials are involved. Tables get created as usual,
+    e.g. with create_dynamo_db_table_from_schema.
+
+    Parameters
+    ----------
+    ddb_client
+        low-level boto3 DynamoDB client, for a resource use `resource.meta.client`
+
+    """
+    events = ddb_client.meta.events
+    # registered first to answer before any other before-send handler (e.g. moto)
+    events.register_first(
+        "before-send.dynamodb",
+        _send_to_memory_engine,
+        unique_id="dynamo_db_resource.memory_backend.send",
+    )
+    events.register(
+        "choose-signer.dynamodb",
+        disable_signing,
+        unique_id="dynamo_db_resource.memory_backend.signer",
+    )
+    return ddb_client
+
+
+def reset_memory_backend():
+    """
+    delete all tables of the in-memory engine
+    """
+    with _engine.lock:
+        _engine.tables.clear()
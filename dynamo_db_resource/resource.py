@@ -1,13 +1,42 @@
-from .dynamo_db_table import Table
+from ._number_types_in_objects import object_with_decimal_to_float
+from .dynamo_db_table import (
+    Table,
+    _batch_get_limit,
+    _batch_get_with_retries,
+    _chunk,
+    _schema_location,
+)
+from ._schema import load_schema_validator
+from .item_cache import ItemCache
+from typing import Iterable
 
 
 __all__ = ["database_resource", "DatabaseResourceController"]
 
+_transact_get_limit = 100
+
 
 class DatabaseResourceController:
-    def __init__(self, config: dict = None):
+    def __init__(
+        self,
+        config: dict = None,
+        resource_config: dict = None,
+        item_cache_config: dict = None,
+        coalesce_gets: bool = False,
+        get_batch_window: float = None,
+        upsert_mode: bool = False,
+        fast_deserialization: bool = False,
+        interceptors: list = None,
+    ):
         self.__tables = dict()
         self._config = config if config else {}
+        self._resource_config = resource_config if resource_config else False
+        self._item_cache_config = item_cache_config
+        self._coalesce_gets = coalesce_gets
+        self._get_batch_window = get_batch_window
+        self._upsert_mode = upsert_mode
+        self._fast_deserialization = fast_deserialization
+        self._interceptors = interceptors
 
     def __getitem__(self, table_name: str) -> Table:
         if table_name not in self.__tables:
@@ -15,8 +44,160 @@ class DatabaseResourceController:
 
         return self.__tables[table_name]
 
+    def warm_up(self, table_names: Iterable[str]):
+        """
+        load and compile the schemas of the given tables before their first use
+
+        Parameters
+        ----------
+        table_names: Iterable[str]
+            names of the tables as used for DatabaseResourceController[table_name]
+
+        """
+        for table_name in table_names:
+            load_schema_validator(*_schema_location(table_name, self._config))
+
+    def transaction(self, allow_chunking: bool = False):
+        """
+        collect writes on several tables for committing them in one transaction
+
+        Parameters
+        ----------
+        allow_chunking: bool
+            split more than 100 actions into several transactions
+
+        Returns
+        -------
+        Transaction
+            actions of a table are added with `transaction[table_name]`
+
+        """
+        from .transaction import Transaction
+
+        return Transaction(
+            allow_chunking=allow_chunking, table_resolver=self.__getitem__
+        )
+
+    def __keys_per_table(self, keys_per_table: dict) -> list:
+        return [
+            (table_name, key)
+            for table_name, keys in keys_per_table.items()
+            for key in self[table_name]._cast_primary_keys(keys, batch=True)
+        ]
+
+    def __items_per_table(self, items_per_table: dict) -> dict:
+        items_per_table = object_with_decimal_to_float(items_per_table)
+        for table_name, items in items_per_table.items():
+            t = self[table_name]
+            items_per_table[
+                table_name
+            ] = t._return_dict_of_pk_items_from_multiple_item_response(items, True)
+        return items_per_table
+
+    def batch_get(self, keys_per_table: dict) -> dict:
+        """
+        get the items of several tables with BatchGetItem requests of up to 100 keys
+
+        Parameters
+        ----------
+        keys_per_table: dict
+            primary keys to retrieve per table name, in any form Table.batch_get accepts
+
+        Returns
+        -------
+        dict
+            per table name a dict of the found items with their primary key as key
+
+        """
+        keys = self.__keys_per_table(keys_per_table)
+        items_per_table = {table_name: list() for table_name in keys_per_table}
+        for chunk in _chunk(keys, _batch_get_limit):
+            table_names = dict()
+            request_items = dict()
+            for table_name, key in chunk:
+                cast_name = self[table_name].name
+                table_names[cast_name] = table_name
+                request_items.setdefault(cast_name, {"Keys": list()})
+                request_items[cast_name]["Keys"].append(key)
+
+            first_table = self[chunk[0][0]]
+            responses, unprocessed = _batch_get_with_retries(
+                first_table._intercepted(
+                    "batch_get_item",
+                    first_table._resource.batch_get_item,
+                    ",".join(request_items),
+                ),
+                request_items,
+            )
+            if unprocessed:
+                cast_name = next(iter(unprocessed))
+                self[table_names[cast_name]].custom_exception.unprocessed_items(
+                    unprocessed[cast_name]["Keys"]
+                )
+            for cast_name, items in responses.items():
+                items_per_table[table_names[cast_name]].extend(items)
+
+        return self.__items_per_table(items_per_table)
+
+    def transact_get(self, keys_per_table: dict, allow_chunking: bool = False) -> dict:
+        """
+        get the items of several tables consistently with one TransactGetItems request
+
+        Parameters
+        ----------
+        keys_per_table: dict
+            primary keys to retrieve per table name, in any form Table.batch_get accepts
+        allow_chunking: bool
+            split more than 100 keys into several requests, each of them consistent only
+            on its own; else more than 100 keys raise a ValueError
+
+        Returns
+        -------
+        dict
+            per table name a dict of the found items with their primary key as key
+
+        """
+        keys = self.__keys_per_table(keys_per_table)
+        if len(keys) > _transact_get_limit and not allow_chunking:
+            raise ValueError(
+                f"a transaction is limited to {_transact_get_limit} items, "
+                f"got {len(keys)}; set allow_chunking for splitting them"
+            )
+
+        items_per_table = {table_name: list() for table_name in keys_per_table}
+        for chunk in _chunk(keys, _transact_get_limit):
+            first_table = self[chunk[0][0]]
+            cast_names = dict.fromkeys(self[table_name].name for table_name, _ in chunk)
+            response = first_table._intercepted(
+                "transact_get_items",
+                first_table._resource.meta.client.transact_get_items,
+                ",".join(cast_names),
+            )(
+                TransactItems=[
+                    {"Get": {"TableName": self[table_name].name, "Key": key}}
+                    for table_name, key in chunk
+                ]
+            )
+            for (table_name, _), item_response in zip(chunk, response["Responses"]):
+                if "Item" in item_response:
+                    items_per_table[table_name].append(item_response["Item"])
+
+        return self.__items_per_table(items_per_table)
+
     def __create_table_connection(self, table_name: str):
-        self.__tables[table_name] = Table(table_name, config=self._config)
+        self.__tables[table_name] = Table(
+            table_name,
+            special_resource_config=self._resource_config,
+            config=self._config,
+            item_cache=ItemCache(**self._item_cache_config)
+            if self._item_cache_config is not None
+            else None,
+            coalesce_gets=self._coalesce_gets,
+            get_batch_window=self._get_batch_window,
+            upsert_mode=self._upsert_mode,
+            fast_deserialization=self._fast_deserialization,
+            interceptors=self._interceptors,
+        )
 
 
 database_resource = DatabaseResourceController()
@@ -2,8 +2,48 @@ __all__ = ["create_resource_config"]
 
 
 def create_resource_config(
-    region: str = "eu-central-1", unittest: bool = False, aws_sam: bool = False
+    region: str = "eu-central-1",
+    unittest: bool = False,
+    aws_sam: bool = False,
+    max_pool_connections: int = None,
+    retry_mode: str = None,
+    max_attempts: int = None,
+    connect_timeout: float = None,
+    read_timeout: float = None,
+    tcp_keepalive: bool = None,
 ) -> dict:
+    """
+    create the keyword arguments for the boto3 DynamoDB resource of a Table
+
+    Tables given an equal config share one resource and thereby its connection pool.
+
+    Parameters
+    ----------
+    region: str
+        AWS region, "local" for a local docker instance or "memory" for the in-memory
+        backend of dynamo_db_resource.memory_backend (no network or containers)
+    unittest: bool
+        if the local instance is used for unittests
+    aws_sam: bool
+        if the local instance is used from within AWS SAM
+    max_pool_connections: int, optional
+        maximum number of connections kept in the pool (botocore default: 10)
+    retry_mode: str, optional
+        botocore retry mode: legacy, standard or adaptive
+    max_attempts: int, optional
+        maximum number of attempts per request including the first one
+    connect_timeout: float, optional
+        seconds until establishing a connection times out
+    read_timeout: float, optional
+        seconds until reading from a connection times out
+    tcp_keepalive: bool, optional
+        if TCP keep-alive shall be enabled for the connections
+
+    Returns
+    -------
+    dict
+
+    """
     if region == "local" and not unittest and not aws_sam:
         raise TypeError("if local=True either unittest or aws_sam must be true")
     if unittest and aws_sam:
@@ -22,6 +62,33 @@ def create_resource_config(
             "aws_access_key_id": "dummy",
             "aws_secret_access_key": "dummy",
         },
+        "memory": {"region_name": "memory"},
         "cloud": {"region_name": region},
     }
-    return __switch_db_resource_config["cloud" if region != "local" else region]
+    resource_config = __switch_db_resource_config[
+        region if region in ("local", "memory") else "cloud"
+    ]
+
+    client_config = {
+        key: value
+        for key, value in {
+            "max_pool_connections": max_pool_connections,
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+            "tcp_keepalive": tcp_keepalive,
+        }.items()
+        if value is not None
+    }
+    retries = {
+        key: value
+        for key, value in {"mode": retry_mode, "max_attempts": max_attempts}.items()
+        if value is not None
+    }
+    if retries:
+        client_config["retries"] = retries
+    if client_config:
+        from botocore.config import Config
+
+        resource_config["config"] = Config(**client_config)
+
+    return resource_config
@@ -1,6 +1,5 @@
-import boto3
 from os import environ as os_environ
-from .dynamo_db_table import _cast_table_name
+from .dynamo_db_table import _cast_table_name, _create_client, _create_resource
 from ._schema import _json_schema_2_dynamo_db_type_switch
 
 __all__ = [
@@ -16,7 +15,7 @@ def create_dynamo_db_table_from_schema(json_schema, config=None, **resource_conf
     if not resource_config:
         resource_config = {"region_name": os_environ["AWS_REGION"]}
 
-    ddb = boto3.resource("dynamodb", **resource_config)
+    ddb = _create_resource(resource_config)
     infrastructure = convert_schema_to_infrastructure_code(json_schema)
     infrastructure["TableName"] = _cast_table_name(infrastructure["TableName"], config)
     try:
@@ -41,7 +40,7 @@ def delete_dynamo_db_table(
 
     table_name = _cast_table_name(table_name)
 
-    ddb = boto3.client("dynamodb", **resource_config)
+    ddb = _create_client(resource_config)
     ddb.delete_table(TableName=table_name)
 
 
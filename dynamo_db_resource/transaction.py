@@ -0,0 +1,390 @@
+from .dynamo_db_table import (
+    Table,
+    UpdateReturns,
+    _ValidationModes,
+    _chunk,
+    _expand_condition_expression,
+)
+from .exceptions import ConditionalCheckFailedException
+from botocore.exceptions import ClientError
+from re import search
+from typing import List
+
+__all__ = ["Transaction"]
+
+_transact_write_limit = 100
+
+
+def _cancellation_reasons(client_error: ClientError) -> (list, bool):
+    """
+    the cancellation reasons of a cancelled transaction and if they are complete
+
+    Some DynamoDB implementations only list the reason codes in the message.
+    """
+    if "CancellationReasons" in client_error.response:
+        return client_error.response["CancellationReasons"], True
+    found = search(r"\[(.*)]", client_error.response["Error"]["Message"])
+    codes = found.group(1).split(", ") if found else list()
+    return [{"Code": code.strip()} for code in codes], False
+
+
+class Transaction:
+    """
+    collect writes and condition checks on one or many tables and commit them at once
+
+    Use `transaction[table]` for adding actions of a Table (or of a table name if
+    created by DatabaseResourceController.transaction) and commit afterwards, or use it
+    as context manager committing on exit without exception.
+
+    Parameters
+    ----------
+    resource: optional
+        boto3 DynamoDB resource sending the request, default: the one of the first table
+    allow_chunking: bool
+        split more than 100 actions into several transactions, each of them atomic only
+        on its own; else more than 100 actions raise a ValueError
+    table_resolver: callable, optional
+        returns the Table for a table name given to `transaction[table_name]`
+
+    """
+
+    def __init__(self, resource=None, allow_chunking=False, table_resolver=None):
+        self.__resource = resource
+        self.allow_chunking = allow_chunking
+        self.__table_resolver = table_resolver
+        self.__actions = list()
+
+    def __getitem__(self, table) -> "TransactionTable":
+        if isinstance(table, str):
+            if self.__table_resolver is None:
+                raise TypeError("table names require a table_resolver, provide a Table")
+            table = self.__table_resolver(table)
+        return TransactionTable(self, table)
+
+    def __len__(self):
+        return len(self.__actions)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+
+    def _add(
+        self,
+        table: Table,
+        kind: str,
+        request: dict,
+        primary_dict: dict,
+        on_condition_check_failed,
+    ):
+        request = _expand_condition_expression(request)
+        request["TableName"] = table.name
+        if "ConditionExpression" in request:
+            request["ReturnValuesOnConditionCheckFailure"] = UpdateReturns.ALL_OLD
+        self.__actions.append(
+            {
+                "table": table,
+                "request": {kind: request},
+                "primary_dict": primary_dict,
+                "on_condition_check_failed": on_condition_check_failed,
+            }
+        )
+
+    def commit(self, client_request_token: str = None):
+        """
+        write all collected actions with TransactWriteItems
+
+        Parameters
+        ----------
+        client_request_token: str, optional
+            idempotency token, only allowed if all actions fit into one transaction
+
+        """
+        if not self.__actions:
+            return
+        if len(self.__actions) > _transact_write_limit and not self.allow_chunking:
+            raise ValueError(
+                f"a transaction is limited to {_transact_write_limit} actions, "
+                f"got {len(self.__actions)}; set allow_chunking for splitting them"
+            )
+        if len(self.__actions) > _transact_write_limit and client_request_token:
+            raise ValueError("client_request_token requires a single transaction")
+
+        actions, self.__actions = self.__actions, list()
+        resource = self.__resource or actions[0]["table"]._resource
+        transact_write_items = actions[0]["table"]._intercepted(
+            "transact_write_items",
+            resource.meta.client.transact_write_items,
+            ",".join(dict.fromkeys(action["table"].name for action in actions)),
+        )
+        try:
+            for chunk in _chunk(actions, _transact_write_limit):
+                request = {"TransactItems": [action["request"] for action in chunk]}
+                if client_request_token:
+                    request["ClientRequestToken"] = client_request_token
+                try:
+                    transact_write_items(**request)
+                except ClientError as CE:
+                    if CE.response["Error"]["Code"] == "TransactionCanceledException":
+                        self.__raise_cancellation_reason(CE, chunk)
+                    raise CE
+        finally:
+            for action in actions:
+                action["table"]._invalidate_cached_item(action["primary_dict"])
+
+    @staticmethod
+    def __raise_cancellation_reason(client_error: ClientError, actions: list):
+        reasons, complete = _cancellation_reasons(client_error)
+        for action, reason in zip(actions, reasons):
+            if reason.get("Code") == "ConditionalCheckFailed":
+                if complete:
+                    item_exists = "Item" in reason
+                else:
+                    try:
+                        action["table"].get(**action["primary_dict"])
+                        item_exists = True
+                    except FileNotFoundError:
+                        item_exists = False
+                action["on_condition_check_failed"](item_exists)
+
+
+class TransactionTable:
+    """
+    the actions of a Transaction on one Table, mirroring the write methods of Table
+
+    create_item_if_non_existent of the update methods raises a ValueError, as the
+    item cannot be created after the update failed within the same transaction.
+    """
+
+    def __init__(self, transaction: Transaction, table: Table):
+        self.transaction = transaction
+        self.table = table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+
+    def commit(self, client_request_token: str = None):
+        self.transaction.commit(client_request_token)
+
+    def put(self, item, overwrite=False):
+        def on_condition_check_failed(item_exists):
+            self.table.custom_exception.item_already_existing(item)
+
+        self.transaction._add(
+            self.table,
+            "Put",
+            self.table._create_put_request(item, overwrite),
+            {key: item[key] for key in self.table.pk},
+            on_condition_check_failed,
+        )
+        return self
+
+    def __update(
+        self,
+        *,
+        require_attributes_already_present=False,
+        create_item_if_non_existent,
+        direct_condition=None,
+        primary_dict,
+        **update_request,
+    ):
+        if create_item_if_non_existent:
+            # creating the item is a fallback after the failed update, which cannot
+            # be part of the transaction
+            raise ValueError(
+                "create_item_if_non_existent is not supported within a transaction, "
+                "add a put of the item instead"
+            )
+
+        def on_condition_check_failed(item_exists):
+            if direct_condition:
+                raise ConditionalCheckFailedException
+            if not item_exists:
+                self.table.custom_exception.not_found_message(primary_dict)
+            self.table._raise_failed_attribute_condition(
+                require_attributes_already_present
+            )
+
+        request = self.table._create_update_request(
+            require_attributes_already_present=require_attributes_already_present,
+            create_item_if_non_existent=create_item_if_non_existent,
+            direct_condition=direct_condition,
+            primary_dict=primary_dict,
+            **update_request,
+        )
+        request.pop("ReturnValues", None)
+        self.transaction._add(
+            self.table, "Update", request, primary_dict, on_condition_check_failed
+        )
+        return self
+
+    def add_new_attribute(
+        self,
+        new_data: dict,
+        update_if_existent=False,
+        create_item_if_non_existent=False,
+        condition=None,
+        **primary_dict,
+    ):
+        return self.__update(
+            new_data=new_data,
+            require_attributes_to_be_missing=True if not update_if_existent else False,
+            create_item_if_non_existent=create_item_if_non_existent,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def update_attribute(
+        self,
+        new_data,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        condition=None,
+        **primary_dict,
+    ):
+        return self.__update(
+            new_data=new_data,
+            require_attributes_already_present=not set_new_attribute_if_not_existent,
+            create_item_if_non_existent=create_item_if_non_existent,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def update_append_list(
+        self,
+        new_data,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        condition=None,
+        **primary_dict,
+    ):
+        return self.__update(
+            new_data=new_data,
+            require_attributes_already_present=not set_new_attribute_if_not_existent,
+            create_item_if_non_existent=create_item_if_non_existent,
+            list_operation=True,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def update_add_set(
+        self,
+        new_data: dict,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        condition=None,
+        **primary_dict,
+    ):
+        return self.__update(
+            new_data=new_data,
+            require_attributes_already_present=not set_new_attribute_if_not_existent,
+            create_item_if_non_existent=create_item_if_non_existent,
+            set_operation=True,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def update_number_drift(
+        self,
+        drift_values_in_dict: dict,
+        set_new_attribute_if_not_existent=False,
+        create_item_if_non_existent=False,
+        condition=None,
+        **primary_dict,
+    ):
+        return self.__update(
+            new_data=drift_values_in_dict,
+            require_attributes_already_present=not set_new_attribute_if_not_existent,
+            create_item_if_non_existent=create_item_if_non_existent,
+            value_operation=True,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def remove_attribute(self, path_of_attribute: list, condition=None, **primary_dict):
+        if not isinstance(path_of_attribute[0], list):
+            path_of_attribute = [path_of_attribute]
+        self.table._validate_input(path_of_attribute, _ValidationModes.REMOVAL)
+        return self.__update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_of_attribute.copy(),
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def remove_entry_in_list(
+        self,
+        path_to_list: list,
+        position_to_delete: int,
+        condition=None,
+        **primary_dict,
+    ):
+        if not isinstance(path_to_list[0], list):
+            path_to_list = [path_to_list]
+        return self.__update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_to_list.copy(),
+            remove_list_item=position_to_delete,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def remove_from_set(
+        self,
+        path_to_set: list,
+        items_to_delete: (List[set], set),
+        condition=None,
+        **primary_dict,
+    ):
+        if not isinstance(path_to_set[0], list):
+            path_to_set = [path_to_set]
+        if not isinstance(items_to_delete, list):
+            items_to_delete = [items_to_delete]
+        items_to_delete = [set(items) for items in items_to_delete]
+        return self.__update(
+            require_attributes_already_present=True,
+            create_item_if_non_existent=False,
+            remove_data=path_to_set.copy(),
+            remove_set_item=items_to_delete,
+            direct_condition=condition,
+            primary_dict=primary_dict,
+        )
+
+    def delete(self, condition=None, **primary_dict):
+        def on_condition_check_failed(item_exists):
+            raise ConditionalCheckFailedException
+
+        self.transaction._add(
+            self.table,
+            "Delete",
+            self.table._create_delete_request(condition, primary_dict),
+            primary_dict,
+            on_condition_check_failed,
+        )
+        return self
+
+    def condition_check(self, condition, **primary_dict):
+        """
+        let the transaction fail unless the item with primary_dict fulfills condition
+        """
+
+        def on_condition_check_failed(item_exists):
+            raise ConditionalCheckFailedException
+
+        self.table._primary_key_checker(primary_dict)
+        self.transaction._add(
+            self.table,
+            "ConditionCheck",
+            {"Key": primary_dict, "ConditionExpression": condition},
+            primary_dict,
+            on_condition_check_failed,
+        )
+        return self
@@ -41,5 +41,11 @@ setup(
     ],
     # https://pypi.org/pypi?%3Aaction=list_classifiers
     install_requires=requirements,
-    extra_require={"testing": test_requirements},
+    extras_require={
+        "testing": test_requirements,
+        "async": ["aiobotocore"],
+        "parquet": ["pyarrow"],
+        "opentelemetry": ["opentelemetry-api"],
+        "prometheus": ["prometheus_client"],
+    },
 )
@@ -0,0 +1,227 @@
+from asyncio import gather, run, sleep
+from copy import deepcopy
+from pytest import mark
+from unittest import mock
+import boto3
+from .test_dynamodb import TestDynamoDBBase, test_item, test_item_primary
+
+
+class _StubAsyncClient:
+    # awaitable wrapper around a synchronous (moto mocked) client replacing aiobotocore
+    def __init__(self):
+        self.client = boto3.client("dynamodb", region_name="eu-central-1")
+        self.calls = list()
+
+    def __getattr__(self, operation):
+        async def call(**kwargs):
+            self.calls.append(operation)
+            await sleep(0)
+            return getattr(self.client, operation)(**kwargs)
+
+        return call
+
+
+class TestAsyncDynamoDB(TestDynamoDBBase):
+    def setUp(self) -> None:
+        super().setUp()
+        from dynamo_db_resource.async_dynamo_db_table import AsyncTable
+
+        self.client = _StubAsyncClient()
+        self.table = AsyncTable(self.table_name, client=self.client)
+
+    def test_put_get_and_delete(self):
+        async def scenario():
+            await self.table.put(test_item)
+            loaded = await self.table.get(**test_item_primary)
+            deleted = await self.table.get_and_delete(**test_item_primary)
+            with self.assertRaises(FileNotFoundError):
+                await self.table.get(**test_item_primary)
+            return loaded, deleted
+
+        loaded, deleted = run(scenario())
+        self.assertEqual(test_item, loaded)
+        self.assertEqual(test_item, deleted)
+
+    def test_put_existing_item(self):
+        async def scenario():
+            await self.table.put(test_item)
+            await self.table.put(test_item)
+
+        with self.assertRaises(FileExistsError):
+            run(scenario())
+
+    def test_put_validates_item(self):
+        item = deepcopy(test_item)
+        item["some_string"] = False
+
+        with self.assertRaises(TypeError):
+            run(self.table.put(item))
+        self.assertEqual([], self.client.calls)
+
+    def test_concurrent_first_use_creates_one_client(self):
+        from dynamo_db_resource.async_dynamo_db_table import AsyncTable
+
+        created = list()
+
+        async def create_client(resource_config, exit_stack):
+            await sleep(0.01)
+            created.append(resource_config)
+            return self.client
+
+        async def scenario(table):
+            return await gather(*[table._client() for _ in range(5)])
+
+        table = AsyncTable(self.table_name)
+        with mock.patch(
+            "dynamo_db_resource.async_dynamo_db_table._create_client", create_client
+        ):
+            clients = run(scenario(table))
+
+        self.assertEqual(1, len(created))
+        self.assertEqual([self.client] * 5, clients)
+
+    def test_update_family(self):
+        async def scenario():
+            await self.table.put(test_item)
+            await self.table.update_attribute(
+                {"some_string": "ghijkl"}, **test_item_primary
+            )
+            await self.table.update_number_drift({"some_int": 2}, **test_item_primary)
+            await self.table.add_new_attribute(
+                {"some_nested_dict": {"KEY1": {"subKEY3": ["a"]}}},
+                update_if_existent=True,
+                **test_item_primary,
+            )
+            await self.table.remove_attribute(
+                ["some_nested_dict", "KEY1", "subKEY1"], **test_item_primary
+            )
+            return await self.table.get(**test_item_primary)
+
+        expected = deepcopy(test_item)
+        expected["some_string"] = "ghijkl"
+        expected["some_int"] += 2
+        expected["some_nested_dict"]["KEY1"]["subKEY3"] = ["a"]
+        del expected["some_nested_dict"]["KEY1"]["subKEY1"]
+
+        self.assertEqual(expected, run(scenario()))
+
+    def test_update_non_existing_attribute(self):
+        from dynamo_db_resource.exceptions import AttributeNotExistsException
+
+        async def scenario():
+            await self.table.put(test_item)
+            await self.table.update_attribute(
+                {
+                    "some_nested_dict": {
+                        "KEY1": {"subKEY4": {"sub4": [{"sub_sub_key": "abc"}]}}
+                    }
+                },
+                **test_item_primary,
+            )
+
+        with self.assertRaises(AttributeNotExistsException):
+            run(scenario())
+
+    def test_scan_iter_and_batch_get(self):
+        items = list()
+        for no in range(150):
+            item = deepcopy(test_item)
+            item["primary_partition_key"] = f"item_{no}"
+            items.append(item)
+
+        async def scenario():
+            for item in items:
+                await self.table.put(item)
+            scanned = [item async for item in self.table.scan_iter(page_size=40)]
+            batch = await self.table.batch_get(
+                [item["primary_partition_key"] for item in items]
+            )
+            return scanned, batch
+
+        scanned, batch = run(scenario())
+        key = lambda item: item["primary_partition_key"]
+        self.assertEqual(sorted(items, key=key), sorted(scanned, key=key))
+        self.assertEqual(sorted(items, key=key), sorted(batch, key=key))
+        self.assertEqual(2, self.client.calls.count("batch_get_item"))
+
+    def test_get_many(self):
+        async def scenario():
+            await self.table.put(test_item)
+            return await self.table.get_many(
+                [test_item_primary, test_item_primary], max_concurrency=1
+            )
+
+        self.assertEqual([test_item, test_item], run(scenario()))
+
+
+class TestAsyncDynamoDBRange(TestDynamoDBBase):
+    table_name = "TableWithRange"
+
+    def test_query(self):
+        from dynamo_db_resource.async_dynamo_db_table import (
+            AsyncDatabaseResourceController,
+        )
+        from dynamo_db_resource.conditions import GreaterThan
+
+        async def scenario():
+            async with AsyncDatabaseResourceController(
+                client=_StubAsyncClient()
+            ) as database_resource:
+                table = database_resource[self.table_name]
+                for no in range(1, 6):
+                    await table.put(
+                        {
+                            "primary_partition_key": "a",
+                            "range_key": f"2020-01-01 12:0{no}",
+                            "some_int": no,
+                        }
+                    )
+                first_page = await table.query(
+                    max_results=2, primary_partition_key="a"
+                )
+                remaining = await table.query(
+                    offset_last_key=first_page["LastEvaluatedKey"],
+                    primary_partition_key="a",
+                )
+                iterated = [
+                    item["some_int"]
+                    async for item in table.query_iter(
+                        page_size=2,
+                        range_condition=GreaterThan("2020-01-01 12:02"),
+                        primary_partition_key="a",
+                    )
+                ]
+                return first_page, remaining, iterated
+
+        first_page, remaining, iterated = run(scenario())
+        self.assertEqual("2020-01-01 12:02", first_page["LastEvaluatedKey"])
+        self.assertEqual([3, 4, 5], [i["some_int"] for i in remaining["Items"]])
+        self.assertEqual([3, 4, 5], iterated)
+
+    def test_controller_requires_async_with(self):
+        from dynamo_db_resource.async_dynamo_db_table import (
+            AsyncDatabaseResourceController,
+        )
+
+        with self.assertRaises(RuntimeError):
+            AsyncDatabaseResourceController()[self.table_name]
+
+
+@mark.parametrize("max_concurrency", [1, 3])
+def test_gather_bounded(max_concurrency):
+    from dynamo_db_resource.async_dynamo_db_table import gather_bounded
+
+    running = list()
+    peak = list()
+
+    async def job(no):
+        running.append(no)
+        peak.append(len(running))
+        await sleep(0.01)
+        running.remove(no)
+        return no
+
+    result = run(gather_bounded([job(no) for no in range(10)], max_concurrency))
+
+    assert list(range(10)) == result
+    assert max_concurrency == max(peak)
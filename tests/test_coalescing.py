@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+from pytest import raises
+
+
+def test_single_flight_shares_in_flight_call():
+    from dynamo_db_resource._coalescing import SingleFlight
+
+    single_flight = SingleFlight()
+    started, release = Event(), Event()
+    calls = list()
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": [1]}
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(single_flight.do, "key", load)
+        started.wait(5)
+        followers = [executor.submit(single_flight.do, "key", load) for _ in range(3)]
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert 1 == len(calls)
+    assert all({"value": [1]} == result for result in results)
+    assert results[0] is not results[1]
+
+    assert {"value": [1]} == single_flight.do("key", lambda: {"value": [1]})
+
+
+def test_single_flight_propagates_error():
+    from dynamo_db_resource._coalescing import SingleFlight
+
+    def fail():
+        raise FileNotFoundError("not found")
+
+    with raises(FileNotFoundError):
+        SingleFlight().do("key", fail)
+
+
+def test_micro_batcher_collects_concurrent_keys():
+    from dynamo_db_resource._coalescing import MicroBatcher
+
+    batches = list()
+
+    def load_batch(keys):
+        batches.append(sorted(keys))
+        return {key: {"key": key} for key in keys if key != "missing"}
+
+    batcher = MicroBatcher(load_batch, window=0.5)
+    barrier = Barrier(5)
+
+    def load(key):
+        barrier.wait()
+        return batcher.load(key)
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(load, ["a", "b", "b", "c", "missing"]))
+
+    assert [["a", "b", "c", "missing"]] == batches
+    assert [{"key": "a"}, {"key": "b"}, {"key": "b"}, {"key": "c"}, None] == results
+
+
+def test_micro_batcher_dispatches_full_batch_before_window():
+    from dynamo_db_resource._coalescing import MicroBatcher
+    from time import perf_counter
+
+    batcher = MicroBatcher(
+        lambda keys: {key: key for key in keys}, window=5, max_batch_size=2
+    )
+
+    start = perf_counter()
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(batcher.load, ["a", "b"]))
+
+    assert ["a", "b"] == results
+    assert perf_counter() - start < 5
@@ -84,6 +84,80 @@ class TestSimpleDynamoDBResource(TestDynamoDBResource):
             type(Table(self.table_name)), type(database_resource[self.table_name])
         )
 
+    def test_resource_config_shared_by_tables(self):
+        from dynamo_db_resource.resource import (
+            DatabaseResourceController,
+        )
+        from dynamo_db_resource.resource_config import create_resource_config
+        from dynamo_db_resource import Table
+
+        database_resource = DatabaseResourceController(
+            resource_config=create_resource_config(
+                os_environ["AWS_REGION"], max_pool_connections=50
+            )
+        )
+        table = database_resource[self.table_name]
+
+        self.assertEqual(self.test_item, table.get(**self.test_item_primary))
+        self.assertEqual(
+            50, table._resource.meta.client.meta.config.max_pool_connections
+        )
+        self.assertIs(
+            table._resource,
+            Table(
+                self.table_name,
+                special_resource_config=create_resource_config(
+                    os_environ["AWS_REGION"], max_pool_connections=50
+                ),
+            )._resource,
+        )
+
+    def test_item_cache_per_table(self):
+        from dynamo_db_resource.resource import (
+            DatabaseResourceController,
+        )
+
+        database_resource = DatabaseResourceController(
+            item_cache_config={"max_entries": 5, "ttl": 60}
+        )
+        table = database_resource[self.table_name]
+
+        self.assertEqual(self.test_item, table.get(**self.test_item_primary))
+        self.assertEqual(self.test_item, table.get(**self.test_item_primary))
+        self.assertEqual(1, table.item_cache.stats["hits"])
+        self.assertEqual(5, table.item_cache.max_entries)
+
+    def test_transaction_by_table_name(self):
+        from dynamo_db_resource.resource import (
+            DatabaseResourceController,
+        )
+
+        database_resource = DatabaseResourceController()
+        with database_resource.transaction() as transaction:
+            transaction[self.table_name].update_attribute(
+                {"some_int": 7}, **self.test_item_primary
+            )
+
+        self.assertEqual(
+            7, database_resource[self.table_name].get(**self.test_item_primary)["some_int"]
+        )
+
+    def test_warm_up_shares_schema_validator(self):
+        from dynamo_db_resource.resource import (
+            DatabaseResourceController,
+        )
+        from dynamo_db_resource._schema import load_schema_validator
+
+        database_resource = DatabaseResourceController()
+        database_resource.warm_up([self.table_name])
+
+        validator = load_schema_validator(
+            "file", f"test_data/tables/{self.table_name}"
+        )
+        self.assertIs(
+            validator, database_resource[self.table_name]._Table__schema_validator
+        )
+
 
 class TestReusedDynamoDBResource(TestDynamoDBResource):
     # ToDo check re-usage of connection -> only one entry if accessing table twice
@@ -151,3 +225,102 @@ class TestConfigurableDynamoDBResource(TestDynamoDBResource):
         assert database_resource["TableForTests"].scan()
 
         os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"] = "test_data/tables/"
+
+
+class TestMultiTableDynamoDBResource(TestDynamoDBResource):
+    table_name = "TableForTests"
+    range_table_name = "TableWithRange"
+    with open(Path(Path(__file__).parent, "test_data/items/test_item.json")) as f:
+        test_item = json.load(f)
+    test_item_primary = {"primary_partition_key": "some_identification_string"}
+
+    def setUp(self) -> None:
+        super().setUp()
+        from dynamo_db_resource.table_existence import (
+            create_dynamo_db_table_from_schema,
+        )
+        from dynamo_db_resource.resource import DatabaseResourceController
+
+        with open(
+            Path(
+                Path(__file__).parent, f"test_data/tables/{self.range_table_name}.json"
+            )
+        ) as f:
+            create_dynamo_db_table_from_schema(json.load(f))
+
+        self.database_resource = DatabaseResourceController()
+        self.range_items = list()
+        for no in range(1, 4):
+            with open(
+                Path(
+                    Path(__file__).parent,
+                    f"test_data/items/test_range_item-1_{no}.json",
+                )
+            ) as f:
+                item = json.load(f)
+            self.database_resource[self.range_table_name].put(item)
+            self.range_items.append(item)
+
+    def tearDown(self) -> None:
+        from dynamo_db_resource.table_existence import delete_dynamo_db_table
+
+        delete_dynamo_db_table(self.range_table_name, require_confirmation=False)
+        super().tearDown()
+
+    def _keys(self):
+        return {
+            self.table_name: [
+                self.test_item_primary["primary_partition_key"],
+                "not_existing",
+            ],
+            self.range_table_name: [
+                (item["primary_partition_key"], item["range_key"])
+                for item in self.range_items
+            ],
+        }
+
+    def _expected(self):
+        return {
+            self.table_name: {
+                self.test_item_primary["primary_partition_key"]: self.test_item
+            },
+            self.range_table_name: {
+                (item["primary_partition_key"], item["range_key"]): item
+                for item in self.range_items
+            },
+        }
+
+    def test_batch_get_across_tables(self):
+        from unittest import mock
+
+        resource = self.database_resource[self.table_name]._resource
+        with mock.patch.object(
+            resource, "batch_get_item", wraps=resource.batch_get_item
+        ) as batch_get:
+            self.assertEqual(
+                self._expected(), self.database_resource.batch_get(self._keys())
+            )
+        self.assertEqual(1, batch_get.call_count)
+
+    def test_batch_get_chunks_keys(self):
+        from unittest import mock
+
+        keys = {self.table_name: [f"key_{no}" for no in range(150)]}
+        resource = self.database_resource[self.table_name]._resource
+        with mock.patch.object(
+            resource, "batch_get_item", wraps=resource.batch_get_item
+        ) as batch_get:
+            self.assertEqual(
+                {self.table_name: dict()}, self.database_resource.batch_get(keys)
+            )
+        self.assertEqual(2, batch_get.call_count)
+
+    def test_transact_get_across_tables(self):
+        self.assertEqual(
+            self._expected(), self.database_resource.transact_get(self._keys())
+        )
+
+        with raises(ValueError):
+            self.database_resource.transact_get(
+                {self.table_name: [f"key_{no}" for no in range(101)]}
+            )
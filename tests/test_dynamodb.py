@@ -323,6 +323,38 @@ class TestDynamoDBQueryWithUpdateDictionaries(TestDynamoDBQuery):
         self.assertEqual(expected_update_values, calculated_values)
         self.assertEqual(expected_expression_name_mapping, calculated_name_mapping)
 
+    def test_update_query_reused_for_same_shape(self):
+        from decimal import Decimal
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.dynamo_db_table import expression_cache_info
+
+        t = Table(self.table_name)
+        hits = expression_cache_info()["update"].hits
+
+        _, first_values, first_name_mapping, _ = t._create_update_expression(
+            {"parent1": {"child1": "first_value"}, "attribute1": 1.5}
+        )
+        first_name_mapping["#AC"] = "primary_partition_key"
+        (
+            calculated_expression,
+            calculated_values,
+            calculated_name_mapping,
+            _,
+        ) = t._create_update_expression(
+            {"parent1": {"child1": "second_value"}, "attribute1": 2.5}
+        )
+
+        self.assertEqual(hits + 1, expression_cache_info()["update"].hits)
+        self.assertEqual(expression_cache_info(), t.expression_cache_info)
+        self.assertEqual("set #AA.#AB = :aa, #AC = :ab", calculated_expression)
+        self.assertEqual(
+            {":aa": "second_value", ":ab": Decimal("2.5")}, calculated_values
+        )
+        self.assertEqual(
+            {"#AA": "parent1", "#AB": "child1", "#AC": "attribute1"},
+            calculated_name_mapping,
+        )
+
 
 class TestDynamoDBQueryDirectProvisionOfPath(TestDynamoDBQuery):
     def test_update_query_direct_provision_of_paths_and_values(self):
@@ -752,6 +784,197 @@ class TestDynamoDB(TestDynamoDBBase):
         self.assertEqual(1, response["some_string"]),
         self.assertNotIn("some_dict", response)
 
+    def test_get_read_through_cache(self):
+        from dynamo_db_resource import Table, ItemCache
+
+        t = Table(self.table_name, item_cache=ItemCache(max_entries=10))
+        t.put(test_item)
+
+        with mock.patch.object(t.table, "get_item", wraps=t.table.get_item) as get:
+            self.assertEqual(test_item, t.get(**test_item_primary))
+            self.assertEqual(test_item, t.get(**test_item_primary))
+            self.assertEqual(
+                {**test_item_primary, "some_int": test_item["some_int"]},
+                t.get(attributes_to_get=["some_int"], **test_item_primary),
+            )
+            self.assertEqual(2, get.call_count)
+
+            t.update_attribute({"some_string": "ghijkl"}, **test_item_primary)
+            self.assertEqual("ghijkl", t.get(**test_item_primary)["some_string"])
+            self.assertEqual(3, get.call_count)
+
+            t.delete(**test_item_primary)
+            with self.assertRaises(FileNotFoundError):
+                t.get(**test_item_primary)
+
+        self.assertEqual(1, t.item_cache.stats["hits"])
+        self.assertEqual(4, t.item_cache.stats["misses"])
+
+    def test_delete_missing_primary_key_with_cache(self):
+        from dynamo_db_resource import Table, ItemCache
+
+        t = Table(self.table_name, item_cache=ItemCache())
+        for delete in [t.delete, t.get_and_delete]:
+            with self.assertRaises(LookupError) as LE:
+                delete()
+            self.assertIs(LookupError, type(LE.exception))
+            self.assertIn("missing", LE.exception.args[0]["body"])
+
+    def test_batch_put_invalidates_cache(self):
+        from dynamo_db_resource import Table, ItemCache
+
+        t = Table(self.table_name, item_cache=ItemCache())
+        t.put(test_item)
+        t.get(**test_item_primary)
+
+        new_item = deepcopy(test_item)
+        new_item["some_int"] = 7
+        t.batch_put([new_item])
+
+        self.assertEqual(7, t.get(**test_item_primary)["some_int"])
+
+    def test_get_micro_batching(self):
+        from dynamo_db_resource import Table
+        from concurrent.futures import ThreadPoolExecutor
+
+        t = Table(self.table_name, get_batch_window=0.5)
+        items = list()
+        for no in range(3):
+            item = deepcopy(test_item)
+            item["primary_partition_key"] = f"item_{no}"
+            t.put(item)
+            items.append(item)
+
+        keys = [item["primary_partition_key"] for item in items] + ["item_0", "none"]
+
+        def get(key):
+            try:
+                return t.get(primary_partition_key=key)
+            except FileNotFoundError:
+                return None
+
+        with mock.patch.object(
+            t._resource, "batch_get_item", wraps=t._resource.batch_get_item
+        ) as batch_get, mock.patch.object(t.table, "get_item") as get_item:
+            with ThreadPoolExecutor(len(keys)) as executor:
+                results = list(executor.map(get, keys))
+
+        self.assertEqual(items + [items[0], None], results)
+        self.assertEqual(1, batch_get.call_count)
+        get_item.assert_not_called()
+
+    def test_get_single_flight(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name, coalesce_gets=True)
+        t.put(test_item)
+
+        self.assertEqual(test_item, t.get(**test_item_primary))
+        with self.assertRaises(FileNotFoundError):
+            t.get(primary_partition_key="none")
+
+    def test_transaction(self):
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.conditions import Attr
+
+        t = Table(self.table_name)
+        t.put(test_item)
+        new_item = deepcopy(test_item)
+        new_item["primary_partition_key"] = "new_item"
+
+        with t.transaction() as transaction:
+            transaction.put(new_item)
+            transaction.update_attribute({"some_int": 7}, **test_item_primary)
+            transaction.update_append_list(
+                {"some_array": ["appended"]}, primary_partition_key="new_item"
+            )
+            self.assertEqual(3, len(transaction.transaction))
+
+        self.assertEqual(7, t.get(**test_item_primary)["some_int"])
+        self.assertEqual(
+            new_item["some_array"] + ["appended"],
+            t.get(primary_partition_key="new_item")["some_array"],
+        )
+
+        with t.transaction() as transaction:
+            transaction.condition_check(Attr("some_int").eq(7), **test_item_primary)
+            transaction.delete(primary_partition_key="new_item")
+
+        with self.assertRaises(FileNotFoundError):
+            t.get(primary_partition_key="new_item")
+
+    def test_transaction_cancellation_reasons(self):
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.conditions import Attr
+        from dynamo_db_resource.exceptions import ConditionalCheckFailedException
+
+        t = Table(self.table_name)
+        t.put(test_item)
+        new_item = deepcopy(test_item)
+        new_item["primary_partition_key"] = "new_item"
+
+        with self.assertRaises(FileExistsError):
+            t.transaction().put(new_item).put(test_item).commit()
+        with self.assertRaises(FileNotFoundError):
+            t.transaction().put(new_item).update_attribute(
+                {"some_int": 7}, primary_partition_key="missing"
+            ).commit()
+        with self.assertRaises(ConditionalCheckFailedException):
+            t.transaction().put(new_item).condition_check(
+                Attr("some_int").eq(7), **test_item_primary
+            ).commit()
+
+        with self.assertRaises(FileNotFoundError):
+            t.get(primary_partition_key="new_item")
+
+    def test_transaction_rejects_create_item_if_non_existent(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        transaction = t.transaction()
+        with self.assertRaises(ValueError):
+            transaction.update_attribute(
+                {"some_int": 7},
+                create_item_if_non_existent=True,
+                primary_partition_key="missing",
+            )
+        with self.assertRaises(ValueError):
+            transaction.update_number_drift(
+                {"some_int": 1},
+                create_item_if_non_existent=True,
+                primary_partition_key="missing",
+            )
+        self.assertEqual(0, len(transaction.transaction))
+
+    def test_transaction_limit(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = list()
+        for no in range(101):
+            item = deepcopy(test_item)
+            item["primary_partition_key"] = f"item_{no}"
+            items.append(item)
+
+        transaction = t.transaction()
+        for item in items:
+            transaction.put(item)
+        with self.assertRaises(ValueError):
+            transaction.commit()
+
+        transaction = t.transaction(allow_chunking=True)
+        for item in items:
+            transaction.put(item)
+        with mock.patch.object(
+            t._resource.meta.client,
+            "transact_write_items",
+            wraps=t._resource.meta.client.transact_write_items,
+        ) as transact:
+            transaction.commit()
+
+        self.assertEqual(2, transact.call_count)
+        self.assertEqual(101, len(t.scan()["Items"]))
+
     def test_put_item_missing_keys(self):
         item = test_item_primary.copy()
         from dynamo_db_resource import Table
@@ -1075,6 +1298,98 @@ class TestDynamoDB(TestDynamoDBBase):
 
         t.delete(**test_item_primary)
 
+    def _mock_update_item_returning_old_item(self, t):
+        # moto ignores ReturnValuesOnConditionCheckFailure, DynamoDB returns the item
+        import boto3
+        from boto3.dynamodb.types import TypeSerializer
+        from botocore.exceptions import ClientError
+
+        client = boto3.client("dynamodb", region_name=os_environ["AWS_REGION"])
+        update_item = t.table.update_item
+
+        def update_item_returning_old_item(**kwargs):
+            try:
+                return update_item(**kwargs)
+            except ClientError as CE:
+                if CE.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    key = {
+                        k: TypeSerializer().serialize(v)
+                        for k, v in kwargs["Key"].items()
+                    }
+                    response = client.get_item(TableName=t.name, Key=key)
+                    if "Item" in response:
+                        CE.response["Item"] = response["Item"]
+                raise CE
+
+        return mock.patch.object(
+            t.table, "update_item", side_effect=update_item_returning_old_item
+        )
+
+    def test_upsert_nested_attribute_without_get(self):
+        updated_attribute = {
+            "some_nested_dict": {
+                "KEY1": {"subKEY4": {"sub4": [{"sub_sub_key": "abc"}]}}
+            }
+        }
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name, upsert_mode=True)
+        t.put(test_item)
+
+        with self._mock_update_item_returning_old_item(
+            t
+        ) as update_item, mock.patch.object(t.table, "get_item") as get_item:
+            t.update_attribute(
+                updated_attribute,
+                set_new_attribute_if_not_existent=True,
+                **test_item_primary,
+            )
+            self.assertEqual(2, update_item.call_count)
+            get_item.assert_not_called()
+
+        expected_item = deepcopy(test_item)
+        expected_item["some_nested_dict"]["KEY1"]["subKEY4"] = {
+            "sub4": [{"sub_sub_key": "abc"}]
+        }
+        self.assertEqual(expected_item, t.get(**test_item_primary))
+
+    def test_upsert_condition_failures(self):
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.exceptions import AttributeNotExistsException
+
+        t = Table(self.table_name, upsert_mode=True)
+        t.put(test_item)
+
+        with self._mock_update_item_returning_old_item(t), mock.patch.object(
+            t.table, "get_item"
+        ) as get_item:
+            with self.assertRaises(AttributeNotExistsException):
+                t.update_attribute(
+                    {
+                        "some_nested_dict": {
+                            "KEY1": {"subKEY4": {"sub4": [{"sub_sub_key": "abc"}]}}
+                        }
+                    },
+                    **test_item_primary,
+                )
+            get_item.assert_not_called()
+
+        with self.assertRaises(FileNotFoundError):
+            t.update_attribute(
+                {"some_nested_dict": {"KEY1": {"subKEY1": "value"}}},
+                set_new_attribute_if_not_existent=True,
+                primary_partition_key="not_existing",
+            )
+
+        t.update_attribute(
+            {"some_nested_dict": {"KEY1": {"subKEY1": "value"}}},
+            set_new_attribute_if_not_existent=True,
+            **test_item_primary,
+        )
+        self.assertEqual(
+            "value", t.get(**test_item_primary)["some_nested_dict"]["KEY1"]["subKEY1"]
+        )
+
     def test_update_with_attribute_return_old_values(self):
         updated_attribute = {"some_float": 249235.93}
         from dynamo_db_resource import Table, UpdateReturns
@@ -1609,6 +1924,24 @@ class TestDynamoDB(TestDynamoDBBase):
         response = t.scan()
         self.assertEqual(list(), response["Items"])
 
+    def test_truncate_reports_deleted_items(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        test_user_copy = deepcopy(test_item)
+        for n in range(30):
+            test_user_copy.update(
+                {"primary_partition_key": f"some_identification_string_{n}"}
+            )
+            t.put(test_user_copy)
+
+        with mock.patch.object(t.table, "scan", wraps=t.table.scan) as scan:
+            self.assertEqual(30, t.truncate(total_segments=1))
+        self.assertEqual(
+            "#AA", scan.call_args_list[0].kwargs["ProjectionExpression"]
+        )
+        self.assertEqual(0, t.scan()["Count"])
+
     def test_scan_with_attributes_to_get(self):
         from dynamo_db_resource import Table
 
@@ -1637,6 +1970,287 @@ class TestDynamoDB(TestDynamoDBBase):
         for item in response["Items"]:
             self.assertEqual(1, len(item))
 
+    def test_scan_iter(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        test_user_copy = deepcopy(test_item)
+        for n in range(5):
+            test_user_copy.update(
+                {"primary_partition_key": f"some_identification_string_{n}"}
+            )
+            t.put(test_user_copy)
+
+        items = list(t.scan_iter(page_size=2))
+        self.assertEqual(5, len(items))
+        self.assertEqual(
+            {f"some_identification_string_{n}" for n in range(5)},
+            {item["primary_partition_key"] for item in items},
+        )
+        self.assertEqual(13.42, items[0]["some_float"])
+
+        for item in t.scan_iter(get_only_primaries=True, page_size=2):
+            self.assertEqual(["primary_partition_key"], list(item))
+
+    def test_parallel_scan(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        test_user_copy = deepcopy(test_item)
+        for n in range(5):
+            test_user_copy.update(
+                {"primary_partition_key": f"some_identification_string_{n}"}
+            )
+            t.put(test_user_copy)
+
+        items = list(t.parallel_scan(total_segments=1, page_size=2))
+        self.assertEqual(5, len(items))
+        self.assertEqual(13.42, items[0]["some_float"])
+
+    def test_parallel_scan_merges_segments(self):
+        from dynamo_db_resource import Table
+        from decimal import Decimal
+
+        t = Table(self.table_name)
+
+        def segment_scan(Segment, TotalSegments, ExclusiveStartKey=None, **_):
+            self.assertEqual(3, TotalSegments)
+            if ExclusiveStartKey is None:
+                return {
+                    "Items": [{"primary_partition_key": f"{Segment}_0"}],
+                    "LastEvaluatedKey": {"primary_partition_key": f"{Segment}_0"},
+                }
+            return {
+                "Items": [
+                    {"primary_partition_key": f"{Segment}_1", "value": Decimal("1.5")}
+                ]
+            }
+
+        with mock.patch.object(t.table, "scan", side_effect=segment_scan):
+            items = list(t.parallel_scan(total_segments=3, max_workers=2))
+
+        self.assertEqual(
+            {f"{s}_{p}" for s in range(3) for p in range(2)},
+            {item["primary_partition_key"] for item in items},
+        )
+        self.assertIn({"primary_partition_key": "0_1", "value": 1.5}, items)
+
+    def _put_numbered_items(self, t, number_of_items: int) -> list:
+        items = list()
+        for no in range(number_of_items):
+            item = deepcopy(test_item)
+            item["primary_partition_key"] = f"item_{no:03}"
+            item["some_string_set"] = {"a", "b"}
+            items.append(item)
+        t.batch_put(items)
+        return items
+
+    @staticmethod
+    def _read_exported_lines(file_path) -> list:
+        import gzip
+
+        with gzip.open(file_path, "rt") as f:
+            return f.read().splitlines()
+
+    def test_export_ndjson_and_csv(self):
+        import csv
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = self._put_numbered_items(t, 7)
+
+        with TemporaryDirectory() as directory:
+            self.assertEqual(7, t.export(directory, total_segments=1, page_size=3))
+            lines = self._read_exported_lines(
+                Path(directory, f"{t.name}-segment-0000.ndjson.gz")
+            )
+            exported = sorted(
+                (json.loads(line) for line in lines),
+                key=lambda item: item["primary_partition_key"],
+            )
+            for item in items:
+                item["some_string_set"] = sorted(item["some_string_set"])
+            for item in exported:
+                item["some_string_set"] = sorted(item["some_string_set"])
+            self.assertEqual(items, exported)
+            checkpoint = json.loads(
+                Path(
+                    directory, f"{t.name}-segment-0000.ndjson.checkpoint.json"
+                ).read_text()
+            )
+            self.assertTrue(checkpoint["done"])
+
+            self.assertEqual(
+                7,
+                t.export(
+                    directory,
+                    export_format="csv",
+                    total_segments=1,
+                    attributes_to_get=["primary_partition_key", "some_int", "some_dict"],
+                ),
+            )
+            rows = list(
+                csv.DictReader(
+                    self._read_exported_lines(
+                        Path(directory, f"{t.name}-segment-0000.csv.gz")
+                    )
+                )
+            )
+            self.assertEqual(7, len(rows))
+            self.assertEqual(
+                {"primary_partition_key", "some_int", "some_dict"}, set(rows[0])
+            )
+            self.assertEqual("42", rows[0]["some_int"])
+            self.assertEqual(test_item["some_dict"], json.loads(rows[0]["some_dict"]))
+
+            with self.assertRaises(ValueError):
+                t.export(directory, export_format="csv", total_segments=2)
+
+    def test_export_resumes_from_checkpoint(self):
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = self._put_numbered_items(t, 10)
+        scan_responses = t._scan_responses
+        requested_scans = list()
+
+        def interrupted_scan_responses(scan_data):
+            requested_scans.append(scan_data)
+            for page_no, response in enumerate(scan_responses(scan_data)):
+                if page_no == 2:
+                    raise ConnectionError
+                yield response
+
+        with TemporaryDirectory() as directory:
+            with mock.patch.object(
+                t, "_scan_responses", side_effect=interrupted_scan_responses
+            ):
+                with self.assertRaises(ConnectionError):
+                    t.export(directory, total_segments=1, page_size=3)
+                self.assertEqual(10, t.export(directory, total_segments=1, page_size=3))
+
+            self.assertNotIn("ExclusiveStartKey", requested_scans[0])
+            self.assertIn("ExclusiveStartKey", requested_scans[1])
+            lines = self._read_exported_lines(
+                Path(directory, f"{t.name}-segment-0000.ndjson.gz")
+            )
+            self.assertEqual(
+                sorted(item["primary_partition_key"] for item in items),
+                sorted(json.loads(line)["primary_partition_key"] for line in lines),
+            )
+
+    def test_export_without_resume_resets_checkpoint(self):
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        self._put_numbered_items(t, 10)
+        scan_responses = t._scan_responses
+
+        def failing_scan_responses(scan_data):
+            raise ConnectionError
+            yield
+
+        with TemporaryDirectory() as directory:
+            self.assertEqual(10, t.export(directory, total_segments=1, page_size=3))
+            with mock.patch.object(
+                t, "_scan_responses", side_effect=failing_scan_responses
+            ):
+                with self.assertRaises(ConnectionError):
+                    t.export(directory, total_segments=1, resume=False)
+
+            with mock.patch.object(
+                t, "_scan_responses", side_effect=scan_responses
+            ) as resumed_scan:
+                self.assertEqual(10, t.export(directory, total_segments=1))
+            self.assertEqual(1, resumed_scan.call_count)
+            self.assertNotIn("ExclusiveStartKey", resumed_scan.call_args[0][0])
+            self.assertEqual(
+                10,
+                len(
+                    self._read_exported_lines(
+                        Path(directory, f"{t.name}-segment-0000.ndjson.gz")
+                    )
+                ),
+            )
+
+    def test_export_parquet(self):
+        from pytest import importorskip
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        parquet = importorskip("pyarrow.parquet")
+        t = Table(self.table_name)
+        self._put_numbered_items(t, 5)
+
+        with TemporaryDirectory() as directory:
+            self.assertEqual(
+                5,
+                t.export(
+                    directory, export_format="parquet", total_segments=1, page_size=2
+                ),
+            )
+            rows = parquet.read_table(
+                str(Path(directory, f"{t.name}-segment-0000-part-00000.parquet"))
+            ).to_pylist()
+            self.assertEqual(5, len(rows))
+            self.assertEqual(42, rows[0]["some_int"])
+            self.assertEqual(test_item["some_dict"], json.loads(rows[0]["some_dict"]))
+
+    def test_bulk_import_exported_items(self):
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = self._put_numbered_items(t, 30)
+
+        with TemporaryDirectory() as directory:
+            t.export(directory, total_segments=1)
+            t.truncate(total_segments=1)
+            statistics = t.bulk_import(directory, processes=2, max_workers=2)
+
+        self.assertEqual(30, statistics["items"])
+        self.assertEqual(0, statistics["rejected"])
+        self.assertIsNone(statistics["rejects_path"])
+        self.assertGreater(statistics["items_per_second"], 0)
+        key = lambda item: item["primary_partition_key"]
+        self.assertEqual(sorted(items, key=key), sorted(t.scan()["Items"], key=key))
+
+    def test_bulk_import_dynamodb_json_and_rejects(self):
+        import gzip
+        from boto3.dynamodb.types import TypeSerializer
+        from decimal import Decimal
+        from tempfile import TemporaryDirectory
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        serializer = TypeSerializer()
+        dynamodb_json_item = {
+            key: serializer.serialize(value)
+            for key, value in json.loads(
+                json.dumps(test_item), parse_float=Decimal
+            ).items()
+        }
+        invalid_item = deepcopy(test_item)
+        invalid_item["some_int"] = "not an integer"
+
+        with TemporaryDirectory() as directory:
+            file_path = Path(directory, "items.ndjson.gz")
+            with gzip.open(file_path, "wt") as f:
+                f.write(json.dumps({"Item": dynamodb_json_item}) + "\n")
+                f.write("{not json\n")
+                f.write(json.dumps(invalid_item) + "\n")
+            statistics = t.bulk_import(file_path, processes=1)
+
+            self.assertEqual(1, statistics["items"])
+            self.assertEqual(2, statistics["rejected"])
+            with open(statistics["rejects_path"]) as f:
+                rejects = [json.loads(line) for line in f]
+        self.assertEqual([2, 3], [reject["line"] for reject in rejects])
+        self.assertEqual(json.dumps(invalid_item), rejects[1]["data"])
+        self.assertEqual(test_item, t.get(**test_item_primary))
 
     def test_batch_get_single_primary(self):
         from dynamo_db_resource import Table
@@ -1663,6 +2277,164 @@ class TestDynamoDB(TestDynamoDBBase):
         )
         self.assertEqual(list(response.values()), list_response)
 
+    def test_batch_get_more_than_100_keys(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        test_user_copy = deepcopy(test_item)
+        for n in range(130):
+            test_user_copy.update({"primary_partition_key": f"key_{n}"})
+            t.put(test_user_copy, overwrite=True)
+
+        response = t.batch_get(
+            [f"key_{n}" for n in range(130)], return_as_dict_of_primary_keys=True
+        )
+        self.assertEqual({f"key_{n}" for n in range(130)}, set(response))
+        self.assertEqual(13.42, response["key_42"]["some_float"])
+
+    def test_batch_put_and_batch_delete(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = list()
+        for n in range(60):
+            item = deepcopy(test_item)
+            item["primary_partition_key"] = f"key_{n}"
+            items.append(item)
+
+        t.batch_put(items, max_workers=3)
+        self.assertEqual(60, t.scan()["Count"])
+        self.assertEqual(items[42], t.get(primary_partition_key="key_42"))
+        self.assertEqual(13.42, items[42]["some_float"])
+
+        t.batch_delete([f"key_{n}" for n in range(50)])
+        self.assertEqual(
+            {f"key_{n}" for n in range(50, 60)},
+            {item["primary_partition_key"] for item in t.scan()["Items"]},
+        )
+
+    def test_batch_put_and_batch_delete_repeated_keys(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        items = list()
+        for some_int in range(3):
+            item = deepcopy(test_item)
+            item["some_int"] = some_int
+            items.append(item)
+
+        with mock.patch.object(
+            t._resource, "batch_write_item", wraps=t._resource.batch_write_item
+        ) as batch_write_item:
+            t.batch_put(items)
+            t.batch_delete([test_item_primary, test_item_primary])
+
+        self.assertEqual(
+            [1, 1],
+            [
+                len(call.kwargs["RequestItems"][t.name])
+                for call in batch_write_item.call_args_list
+            ],
+        )
+        self.assertEqual(
+            2,
+            batch_write_item.call_args_list[0].kwargs["RequestItems"][t.name][0][
+                "PutRequest"
+            ]["Item"]["some_int"],
+        )
+        with self.assertRaises(FileNotFoundError):
+            t.get(**test_item_primary)
+
+    def test_batch_put_validates_items(self):
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.exceptions import ValidationError
+
+        t = Table(self.table_name)
+        invalid_item = deepcopy(test_item)
+        invalid_item["unexpected_property"] = "value"
+
+        with self.assertRaises(ValidationError):
+            t.batch_put([test_item, invalid_item])
+
+    def test_batch_put_retries_unprocessed_items(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        batch_write_item = t._resource.batch_write_item
+
+        def throttled_batch_write_item(RequestItems):
+            if not throttled_batch_write_item.throttled:
+                throttled_batch_write_item.throttled = True
+                return {"UnprocessedItems": RequestItems}
+            return batch_write_item(RequestItems=RequestItems)
+
+        throttled_batch_write_item.throttled = False
+
+        with mock.patch.object(
+            t._resource,
+            "batch_write_item",
+            side_effect=throttled_batch_write_item,
+        ) as patched, mock.patch(
+            "dynamo_db_resource.dynamo_db_table._sleep_before_retry"
+        ):
+            t.batch_put([test_item])
+            self.assertEqual(2, patched.call_count)
+        self.assertEqual(test_item, t.get(**test_item_primary))
+
+    def test_batch_get_retries_unprocessed_keys(self):
+        from dynamo_db_resource import Table
+        from dynamo_db_resource.exceptions import UnprocessedItemsException
+
+        t = Table(self.table_name)
+        t.put(test_item)
+        table_name = t.name
+        unprocessed = {
+            "Responses": {table_name: []},
+            "UnprocessedKeys": {table_name: {"Keys": [test_item_primary]}},
+        }
+        batch_get_item = t._resource.batch_get_item
+        throttled_responses = iter([unprocessed, unprocessed])
+
+        def throttled_batch_get_item(**kwargs):
+            return next(throttled_responses, None) or batch_get_item(**kwargs)
+
+        with mock.patch.object(
+            t._resource,
+            "batch_get_item",
+            side_effect=throttled_batch_get_item,
+        ) as patched, mock.patch(
+            "dynamo_db_resource.dynamo_db_table._sleep_before_retry"
+        ):
+            self.assertEqual([test_item], t.batch_get([test_item_primary]))
+            self.assertEqual(3, patched.call_count)
+
+        with mock.patch.object(
+            t._resource, "batch_get_item", return_value=unprocessed
+        ), mock.patch("dynamo_db_resource.dynamo_db_table._sleep_before_retry"):
+            with self.assertRaises(UnprocessedItemsException):
+                t.batch_get([test_item_primary])
+
+    def test_fast_deserialization_reads(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name, fast_deserialization=True)
+        t.put(test_item)
+
+        with mock.patch.object(t.table, "get_item") as resource_get_item:
+            item = t.get(**test_item_primary)
+            resource_get_item.assert_not_called()
+        self.assertEqual(test_item, item)
+        self.assertIsInstance(item["some_int"], int)
+        self.assertIsInstance(item["some_nested_dict"]["KEY1"]["subKEY2"], float)
+
+        self.assertEqual([test_item], t.scan()["Items"])
+        self.assertEqual([test_item], list(t.parallel_scan(total_segments=1)))
+        self.assertEqual([test_item], t.batch_get([test_item_primary]))
+        with self.assertRaises(FileNotFoundError):
+            t.get(primary_partition_key="not_existing")
+
+        self.assertEqual(1, t.truncate(total_segments=1))
+
 
 class TestDynamoDBRangeNIndex(TestDynamoDBBase):
     table_name = "TableWithRange"
@@ -1955,6 +2727,64 @@ class TestDynamoDBRangeNIndex(TestDynamoDBBase):
             response,
         )
 
+    def test_query_iter(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+
+        items = list(t.query_iter(page_size=3, primary_partition_key="first_key"))
+        self.assertEqual(13, len(items))
+        self.assertEqual(
+            t.query(primary_partition_key="first_key")["Items"], items
+        )
+
+        limited_items = list(
+            t.query_iter(
+                max_results=5, page_size=3, primary_partition_key="first_key"
+            )
+        )
+        self.assertEqual(items[:5], limited_items)
+
+        index_items = list(
+            t.query_iter(
+                index="some_string_index", page_size=1, some_string="some_key1"
+            )
+        )
+        self.assertEqual(
+            t.query(index="some_string_index", some_string="some_key1")["Items"],
+            index_items,
+        )
+
+    def test_query_with_fast_deserialization(self):
+        from dynamo_db_resource import Table
+
+        t = Table(self.table_name)
+        fast = Table(self.table_name, fast_deserialization=True)
+
+        first_page = fast.query(max_results=3, primary_partition_key="first_key")
+        self.assertEqual(
+            t.query(max_results=3, primary_partition_key="first_key")["Items"],
+            first_page["Items"],
+        )
+        self.assertEqual(
+            t.query(
+                offset_last_key=first_page["LastEvaluatedKey"],
+                primary_partition_key="first_key",
+            )["Items"],
+            fast.query(
+                offset_last_key=first_page["LastEvaluatedKey"],
+                primary_partition_key="first_key",
+            )["Items"],
+        )
+        self.assertEqual(
+            list(t.query_iter(page_size=3, primary_partition_key="first_key")),
+            list(fast.query_iter(page_size=3, primary_partition_key="first_key")),
+        )
+        self.assertEqual(
+            t.index_get("some_string_index", some_string="some_key1"),
+            fast.index_get("some_string_index", some_string="some_key1"),
+        )
+
     def test_query_on_index_with_single_offset_key(self):
         from dynamo_db_resource import Table
 
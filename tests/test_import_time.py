@@ -0,0 +1,47 @@
+from pathlib import Path
+from pytest import mark
+from subprocess import run
+import sys
+
+
+def _import_times(statement: str) -> (dict, str):
+    completed = run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        env={"AWS_REGION": "eu-central-1"},
+    )
+    times = dict()
+    for line in completed.stderr.splitlines():
+        try:
+            self_time, cumulative_time, module = line.split(":", 1)[1].split("|")
+            times[module.strip()] = (int(self_time), int(cumulative_time))
+        except ValueError:
+            continue
+    return times, completed.stdout.strip()
+
+
+@mark.parametrize(
+    "statement",
+    (
+        "import dynamo_db_resource.dynamo_db_table as t; print(t._ddb_resource)",
+        "from dynamo_db_resource.table_existence import convert_schema_to_infrastructure_code;"
+        "import dynamo_db_resource.dynamo_db_table as t; print(t._ddb_resource)",
+    ),
+)
+def test_import_does_not_create_resource(statement):
+    times, printed = _import_times(statement)
+
+    assert "dynamo_db_resource.dynamo_db_table" in times
+    assert printed == "None"
+    assert "boto3.dynamodb.transform" not in times
+
+
+def test_resource_created_on_first_use():
+    _, printed = _import_times(
+        "import dynamo_db_resource.dynamo_db_table as t;"
+        "print(t._default_resource() is t._default_resource())"
+    )
+    assert printed == "True"
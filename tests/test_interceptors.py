@@ -0,0 +1,204 @@
+from unittest import TestCase
+from os import environ as os_environ
+from pathlib import Path
+from os import chdir, getcwd
+import json
+import sys
+
+
+class TestInterceptors(TestCase):
+    table_name = "TableWithRange"
+    actual_cwd = str()
+
+    def setUp(self) -> None:
+        for key in list(sys.modules.keys()):
+            if any(key.startswith(i) for i in ["dynamo_db_resource", "test"]):
+                del sys.modules[key]
+        os_environ["STAGE"] = "TEST"
+        os_environ["DYNAMO_DB_RESOURCE_SCHEMA_ORIGIN"] = "file"
+        os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"] = "test_data/tables/"
+
+        self.actual_cwd = getcwd()
+        chdir(Path(__file__).parent)
+
+        from dynamo_db_resource.interceptors import Interceptor
+        from dynamo_db_resource.resource_config import create_resource_config
+        from dynamo_db_resource.table_existence import (
+            create_dynamo_db_table_from_schema,
+        )
+
+        self.resource_config = create_resource_config("memory")
+        with open(
+            Path(Path(__file__).parent, f"test_data/tables/{self.table_name}.json")
+        ) as f:
+            create_dynamo_db_table_from_schema(json.load(f), **self.resource_config)
+
+        class RecordingInterceptor(Interceptor):
+            def __init__(self, name, calls):
+                self.name = name
+                self.calls = calls
+
+            def before(self, context):
+                self.calls.append((self.name, "before", context.operation))
+
+            def after(self, context):
+                self.calls.append((self.name, "after", context.operation))
+                self.calls.append(
+                    {
+                        "table_name": context.table_name,
+                        "key": context.key,
+                        "expression_sizes": context.expression_sizes,
+                        "retry_count": context.retry_count,
+                        "consumed_capacity": context.consumed_capacity,
+                        "duration": context.duration,
+                        "exception": context.exception,
+                    }
+                )
+
+        self.calls = list()
+        self.interceptors = [
+            RecordingInterceptor("outer", self.calls),
+            RecordingInterceptor("inner", self.calls),
+        ]
+
+    def tearDown(self) -> None:
+        from dynamo_db_resource.memory_backend import reset_memory_backend
+
+        reset_memory_backend()
+        chdir(self.actual_cwd)
+
+    def _table(self, **kwargs):
+        from dynamo_db_resource import Table
+
+        return Table(
+            self.table_name,
+            special_resource_config=self.resource_config,
+            interceptors=self.interceptors,
+            **kwargs,
+        )
+
+    def test_interceptors_wrap_operation(self):
+        t = self._table()
+        primary = {"primary_partition_key": "a", "range_key": "b"}
+        t.put({**primary, "some_int": 1})
+
+        self.assertEqual(
+            [
+                ("outer", "before", "put_item"),
+                ("inner", "before", "put_item"),
+                ("inner", "after", "put_item"),
+            ],
+            self.calls[:3],
+        )
+        context = self.calls[3]
+        self.assertEqual(t.name, context["table_name"])
+        self.assertEqual(primary, context["key"])
+        self.assertEqual(
+            {"ConditionExpression": len(t._item_not_exists_condition)},
+            context["expression_sizes"],
+        )
+        self.assertEqual(0, context["retry_count"])
+        self.assertEqual(t.name, context["consumed_capacity"]["TableName"])
+        self.assertGreater(context["duration"], 0)
+        self.assertIsNone(context["exception"])
+        self.assertEqual(("outer", "after", "put_item"), self.calls[4])
+
+    def test_response_does_not_contain_requested_capacity(self):
+        t = self._table()
+        t.put({"primary_partition_key": "a", "range_key": "b", "some_int": 1})
+
+        response = t.query(primary_partition_key="a")
+        self.assertNotIn("ConsumedCapacity", response)
+        self.assertIn("KeyConditionExpression", self.calls[-1]["expression_sizes"])
+        self.assertIsNone(self.calls[-1]["key"])
+
+    def test_failed_operation_calls_after(self):
+        t = self._table()
+        item = {"primary_partition_key": "a", "range_key": "b", "some_int": 1}
+        t.put(item)
+        self.calls.clear()
+
+        with self.assertRaises(FileExistsError):
+            t.put(item)
+        self.assertEqual(
+            "ConditionalCheckFailedException",
+            self.calls[3]["exception"].response["Error"]["Code"],
+        )
+        self.assertEqual(("outer", "after", "put_item"), self.calls[4])
+
+    def test_controller_and_transaction(self):
+        from dynamo_db_resource.resource import DatabaseResourceController
+
+        controller = DatabaseResourceController(
+            resource_config=self.resource_config, interceptors=self.interceptors
+        )
+        with controller.transaction() as transaction:
+            transaction[self.table_name].put(
+                {"primary_partition_key": "a", "range_key": "b", "some_int": 1}
+            )
+        controller.batch_get(
+            {self.table_name: [{"primary_partition_key": "a", "range_key": "b"}]}
+        )
+
+        self.assertEqual(
+            ["transact_write_items", "batch_get_item"],
+            [
+                call[2]
+                for call in self.calls
+                if isinstance(call, tuple) and call[:2] == ("outer", "before")
+            ],
+        )
+
+    def test_failed_before_calls_after_of_entered_interceptors(self):
+        from dynamo_db_resource.interceptors import Interceptor
+
+        class FailingInterceptor(Interceptor):
+            def before(self, context):
+                raise RuntimeError("before failed")
+
+            def after(self, context):
+                raise AssertionError("after of a failed before")
+
+        self.interceptors.insert(1, FailingInterceptor())
+        t = self._table()
+
+        with self.assertRaises(RuntimeError):
+            t.put({"primary_partition_key": "a", "range_key": "b", "some_int": 1})
+        self.assertEqual(
+            [("outer", "before", "put_item"), ("outer", "after", "put_item")],
+            [call for call in self.calls if isinstance(call, tuple)],
+        )
+        self.assertIsInstance(self.calls[-1]["exception"], RuntimeError)
+        self.assertIsNone(self.calls[-1]["consumed_capacity"])
+
+    def test_prometheus_interceptors_share_histogram(self):
+        from pytest import importorskip
+
+        prometheus_client = importorskip("prometheus_client")
+        from dynamo_db_resource.interceptors import PrometheusInterceptor
+
+        registry = prometheus_client.CollectorRegistry()
+        first = PrometheusInterceptor(registry=registry)
+        second = PrometheusInterceptor(registry=registry)
+        self.assertIs(first.histogram, second.histogram)
+        self.assertIs(
+            PrometheusInterceptor().histogram, PrometheusInterceptor().histogram
+        )
+        with self.assertRaises(ValueError):
+            PrometheusInterceptor(registry=registry, buckets=[0.1, 1])
+
+        self.interceptors = [first]
+        self._table().put(
+            {"primary_partition_key": "a", "range_key": "b", "some_int": 1}
+        )
+        self.assertEqual(
+            1,
+            registry.get_sample_value(
+                "dynamo_db_resource_operation_duration_seconds_count",
+                {
+                    "operation": "put_item",
+                    "table": "TableWithRange",
+                    "outcome": "success",
+                },
+            ),
+        )
@@ -0,0 +1,87 @@
+from pytest import fixture
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@fixture
+def clock():
+    return _Clock()
+
+
+def test_lru_eviction():
+    from dynamo_db_resource.item_cache import ItemCache
+
+    cache = ItemCache(max_entries=2)
+    cache.set(cache.key(("a",)), {"pk": "a"})
+    cache.set(cache.key(("b",)), {"pk": "b"})
+    assert {"pk": "a"} == cache.get(cache.key(("a",)))
+    cache.set(cache.key(("c",)), {"pk": "c"})
+
+    assert cache.get(cache.key(("b",))) is None
+    assert {"pk": "a"} == cache.get(cache.key(("a",)))
+    assert {"hits": 2, "misses": 1, "evictions": 1, "expirations": 0} == {
+        k: v for k, v in cache.stats.items() if k not in ["entries", "bytes"]
+    }
+
+
+def test_ttl(clock):
+    from dynamo_db_resource.item_cache import ItemCache
+
+    cache = ItemCache(ttl=10, clock=clock)
+    cache.set(cache.key(("a",)), {"pk": "a"})
+    clock.now = 9.9
+    assert {"pk": "a"} == cache.get(cache.key(("a",)))
+    clock.now = 10
+    assert cache.get(cache.key(("a",))) is None
+    assert 1 == cache.stats["expirations"]
+    assert 0 == len(cache)
+
+
+def test_max_bytes():
+    from dynamo_db_resource.item_cache import ItemCache, _approximate_size
+
+    item = {"pk": "a", "data": "x" * 100}
+    cache = ItemCache(max_bytes=2 * _approximate_size(item))
+    for pk in "abc":
+        cache.set(cache.key((pk,)), {**item, "pk": pk})
+
+    assert 2 == len(cache)
+    assert cache.stats["bytes"] <= cache.max_bytes
+
+    cache.set(cache.key(("d",)), {"pk": "d", "data": "x" * 1000})
+    assert cache.get(cache.key(("d",))) is None
+
+
+def test_invalidate_all_projections():
+    from dynamo_db_resource.item_cache import ItemCache
+
+    cache = ItemCache()
+    cache.set(cache.key(("a", 1)), {"pk": "a", "rk": 1, "x": 1})
+    cache.set(cache.key(("a", 1), ["x", ["nested", 0]]), {"pk": "a", "rk": 1})
+    cache.set(cache.key(("b", 1)), {"pk": "b", "rk": 1})
+
+    cache.invalidate(("a", 1))
+
+    assert cache.get(cache.key(("a", 1))) is None
+    assert cache.get(cache.key(("a", 1), ["x", ["nested", 0]])) is None
+    assert {"pk": "b", "rk": 1} == cache.get(cache.key(("b", 1)))
+
+
+def test_returns_copies_and_skips_stale_loads():
+    from dynamo_db_resource.item_cache import ItemCache
+
+    cache = ItemCache()
+    generation = cache.generation
+    cache.invalidate(("a",))
+    cache.set(cache.key(("a",)), {"pk": "a"}, generation)
+    assert cache.get(cache.key(("a",))) is None
+
+    cache.set(cache.key(("a",)), {"pk": "a", "list": [1]}, cache.generation)
+    cache.get(cache.key(("a",)))["list"].append(2)
+    assert {"pk": "a", "list": [1]} == cache.get(cache.key(("a",)))
@@ -1,6 +1,7 @@
 from moto import mock_dynamodb2
 from pytest import fixture
 from pathlib import Path
+import json
 
 
 @fixture
@@ -20,3 +21,45 @@ def test_main(os_env):
     tables = ["TableForTest"]
 
     create_table_for_schema_in_directory(directory, tables)
+
+
+@mock_dynamodb2
+def test_export_tables(os_env, tmp_path):
+    from dynamo_db_resource.__main__ import (
+        create_table_for_schema_in_directory,
+        export_tables_for_schema_in_directory,
+    )
+    from dynamo_db_resource import Table
+
+    directory = Path(Path(__file__).parent, "test_data/tables")
+    tables = ["TableForTests"]
+
+    create_table_for_schema_in_directory(directory, tables)
+    with open(Path(Path(__file__).parent, "test_data/items/test_item.json")) as f:
+        Table(
+            "TableForTests", config={"origin": "file", "directory": f"{directory}/"}
+        ).put(json.load(f))
+
+    assert {"TableForTests": 1} == export_tables_for_schema_in_directory(
+        directory, tmp_path, tables, total_segments=1
+    )
+    assert Path(tmp_path, "TableForTests-segment-0000.ndjson.gz").exists()
+
+
+@mock_dynamodb2
+def test_import_table(os_env, tmp_path):
+    from dynamo_db_resource.__main__ import (
+        create_table_for_schema_in_directory,
+        import_table_for_schema_in_directory,
+    )
+
+    directory = Path(Path(__file__).parent, "test_data/tables")
+    create_table_for_schema_in_directory(directory, ["TableForTests"])
+    with open(Path(Path(__file__).parent, "test_data/items/test_item.json")) as f:
+        Path(tmp_path, "items.ndjson").write_text(json.dumps(json.load(f)) + "\n")
+
+    statistics = import_table_for_schema_in_directory(
+        directory, "TableForTests", Path(tmp_path, "items.ndjson"), processes=1
+    )
+    assert 1 == statistics["items"]
+    assert 0 == statistics["rejected"]
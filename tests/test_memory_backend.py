@@ -0,0 +1,237 @@
+from unittest import TestCase
+from os import environ as os_environ
+from pathlib import Path
+from os import chdir, getcwd
+import json
+import sys
+
+
+class TestMemoryBackend(TestCase):
+    table_name = "TableWithRange"
+    actual_cwd = str()
+
+    def setUp(self) -> None:
+        for key in list(sys.modules.keys()):
+            if any(key.startswith(i) for i in ["dynamo_db_resource", "test"]):
+                del sys.modules[key]
+        os_environ["STAGE"] = "TEST"
+        os_environ["DYNAMO_DB_RESOURCE_SCHEMA_ORIGIN"] = "file"
+        os_environ["DYNAMO_DB_RESOURCE_SCHEMA_DIRECTORY"] = "test_data/tables/"
+
+        self.actual_cwd = getcwd()
+        chdir(Path(__file__).parent)
+
+        from dynamo_db_resource.resource_config import create_resource_config
+        from dynamo_db_resource.table_existence import (
+            create_dynamo_db_table_from_schema,
+        )
+
+        self.resource_config = create_resource_config("memory")
+        for table_name in [self.table_name, "TableForTests"]:
+            with open(
+                Path(Path(__file__).parent, f"test_data/tables/{table_name}.json")
+            ) as f:
+                create_dynamo_db_table_from_schema(json.load(f), **self.resource_config)
+
+    def tearDown(self) -> None:
+        from dynamo_db_resource.memory_backend import reset_memory_backend
+
+        reset_memory_backend()
+        chdir(self.actual_cwd)
+
+    def _table(self, table_name: str = None, **kwargs):
+        from dynamo_db_resource import Table
+
+        return Table(
+            table_name or self.table_name,
+            special_resource_config=self.resource_config,
+            **kwargs,
+        )
+
+    def _put_range_items(self, t, count: int = 12):
+        t.batch_put(
+            [
+                {
+                    "primary_partition_key": f"partition_{i % 3}",
+                    "range_key": f"range_{i:03}",
+                    "some_int": i,
+                    "some_string": "even" if i % 2 == 0 else "odd",
+                    "some_float": i / 4,
+                }
+                for i in range(count)
+            ]
+        )
+
+    def test_put_get_update_delete(self):
+        with open(Path(Path(__file__).parent, "test_data/items/test_item.json")) as f:
+            test_item = json.load(f)
+        primary = {"primary_partition_key": test_item["primary_partition_key"]}
+        t = self._table("TableForTests")
+
+        t.put(test_item)
+        self.assertEqual(test_item, t.get(**primary))
+        with self.assertRaises(FileExistsError):
+            t.put(test_item)
+
+        t.update_attribute({"some_int": 7}, **primary)
+        t.update_number_drift({"some_int": 3}, **primary)
+        t.update_append_list({"some_array": ["appended"]}, **primary)
+        t.add_new_attribute({"some_dict": {"key3": {"new_key": "value"}}}, **primary)
+        item = t.get(**primary)
+        self.assertEqual(10, item["some_int"])
+        self.assertEqual(test_item["some_array"] + ["appended"], item["some_array"])
+        self.assertEqual({"new_key": "value"}, item["some_dict"]["key3"])
+
+        t.remove_attribute(["some_dict", "key3"], **primary)
+        self.assertNotIn("key3", t.get(**primary)["some_dict"])
+
+        t.delete(**primary)
+        with self.assertRaises(FileNotFoundError):
+            t.get(**primary)
+
+    def test_query_with_key_conditions_and_index(self):
+        from dynamo_db_resource.conditions import GreaterThanEquals
+
+        t = self._table()
+        self._put_range_items(t)
+
+        self.assertEqual(
+            [f"range_{i:03}" for i in [0, 3, 6, 9]],
+            [
+                i["range_key"]
+                for i in t.query(primary_partition_key="partition_0")["Items"]
+            ],
+        )
+        self.assertEqual(
+            [6, 8, 10],
+            [
+                i["some_int"]
+                for i in t.query(
+                    range_condition=GreaterThanEquals(6),
+                    index="string_n_int_index",
+                    some_string="even",
+                )["Items"]
+            ],
+        )
+
+        page = t.query_iter(primary_partition_key="partition_1", page_size=2)
+        self.assertEqual(
+            [f"range_{i:03}" for i in [1, 4, 7, 10]], [i["range_key"] for i in page]
+        )
+
+    def test_scan_segments_cover_table_once(self):
+        t = self._table()
+        self._put_range_items(t, 50)
+
+        keys = [
+            (i["primary_partition_key"], i["range_key"])
+            for i in t.parallel_scan(total_segments=4, page_size=7)
+        ]
+        self.assertEqual(50, len(keys))
+        self.assertEqual(50, len(set(keys)))
+
+    def test_batch_get(self):
+        t = self._table()
+        self._put_range_items(t)
+
+        items = t.batch_get(
+            [
+                {"primary_partition_key": "partition_0", "range_key": "range_000"},
+                {"primary_partition_key": "partition_2", "range_key": "range_011"},
+                {"primary_partition_key": "partition_2", "range_key": "missing"},
+            ]
+        )
+        self.assertEqual(
+            {0, 11}, {item["some_int"] for item in items if item is not None}
+        )
+
+    def test_bulk_import_repeated_keys(self):
+        from tempfile import TemporaryDirectory
+
+        t = self._table()
+        lines = [
+            {"primary_partition_key": "a", "range_key": f"b_{i % 3}", "some_int": i}
+            for i in range(7)
+        ]
+        with TemporaryDirectory() as directory:
+            file_path = Path(directory, "changes.ndjson")
+            file_path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+            statistics = t.bulk_import(file_path, processes=1)
+
+        self.assertEqual(0, statistics["rejected"])
+        self.assertEqual(
+            [("b_0", 6), ("b_1", 4), ("b_2", 5)],
+            [
+                (item["range_key"], item["some_int"])
+                for item in t.query(primary_partition_key="a")["Items"]
+            ],
+        )
+
+    def test_expression_errors_of_dynamodb(self):
+        from botocore.exceptions import ClientError
+        from dynamo_db_resource.dynamo_db_table import _create_client
+
+        ddb = _create_client(self.resource_config)
+        key = {"primary_partition_key": {"S": "a"}, "range_key": {"S": "b"}}
+        ddb.put_item(TableName=self.table_name, Item={**key, "some_int": {"N": "1"}})
+
+        with self.assertRaises(ClientError) as CE:
+            ddb.update_item(
+                TableName=self.table_name,
+                Key=key,
+                UpdateExpression="SET #a.#b = :v",
+                ExpressionAttributeNames={"#a": "missing", "#b": "nested"},
+                ExpressionAttributeValues={":v": {"S": "x"}},
+            )
+        self.assertIn(
+            "document path provided in the update expression is invalid",
+            CE.exception.response["Error"]["Message"],
+        )
+
+        with self.assertRaises(ClientError) as CE:
+            ddb.put_item(
+                TableName=self.table_name,
+                Item={**key, "some_int": {"N": "2"}},
+                ConditionExpression="attribute_not_exists(#k)",
+                ExpressionAttributeNames={"#k": "primary_partition_key"},
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+        self.assertEqual(
+            "ConditionalCheckFailedException", CE.exception.response["Error"]["Code"]
+        )
+        self.assertEqual({"N": "1"}, CE.exception.response["Item"]["some_int"])
+
+        with self.assertRaises(ClientError) as CE:
+            ddb.get_item(
+                TableName=self.table_name,
+                Key=key,
+                ExpressionAttributeNames={"#unused": "some_int"},
+            )
+        self.assertIn("unused", CE.exception.response["Error"]["Message"])
+
+    def test_transaction_cancellation_reasons(self):
+        from dynamo_db_resource.conditions import Attr
+        from dynamo_db_resource.exceptions import ConditionalCheckFailedException
+
+        t = self._table()
+        self._put_range_items(t, 3)
+
+        with self.assertRaises(ConditionalCheckFailedException):
+            with t.transaction() as transaction:
+                transaction.update_attribute(
+                    {"some_int": 100},
+                    primary_partition_key="partition_0",
+                    range_key="range_000",
+                )
+                transaction.condition_check(
+                    Attr("some_int").eq(5),
+                    primary_partition_key="partition_1",
+                    range_key="range_001",
+                )
+
+        self.assertEqual(
+            0,
+            t.get(primary_partition_key="partition_0", range_key="range_000")[
+                "some_int"
+            ],
+        )
@@ -108,3 +108,69 @@ class TestTraverseDict(TestCase):
             ["abc", 1, {"number": Decimal(3.5)}],
             object_with_float_to_decimal(["abc", 1, {"number": 3.5}]),
         )
+
+    def test_copy_float_to_decimal(self):
+        from dynamo_db_resource._number_types_in_objects import (
+            copy_object_with_float_to_decimal,
+        )
+
+        self.assertEqual(decimal_dict, copy_object_with_float_to_decimal(float_dict))
+        self.assertEqual(self._float_dict, float_dict)
+
+    def test_copy_float_to_decimal_shares_unchanged_parts(self):
+        from dynamo_db_resource._number_types_in_objects import (
+            copy_object_with_float_to_decimal,
+        )
+
+        converted = copy_object_with_float_to_decimal(float_dict)
+        self.assertIsNot(float_dict, converted)
+        self.assertIsNot(float_dict["some_nested_dict"], converted["some_nested_dict"])
+        self.assertIs(float_dict["some_dict"], converted["some_dict"])
+
+        without_float = {"some_string": "abc", "some_set": {"a", "b"}}
+        self.assertIs(without_float, copy_object_with_float_to_decimal(without_float))
+
+    def test_copy_float_to_decimal_sets_and_tuples(self):
+        from dynamo_db_resource._number_types_in_objects import (
+            copy_object_with_float_to_decimal,
+        )
+
+        self.assertEqual(
+            {Decimal("1.5"), 2}, copy_object_with_float_to_decimal({1.5, 2})
+        )
+        self.assertEqual(["a", 1], copy_object_with_float_to_decimal(("a", 1)))
+
+    def test_decimal_to_float_nested_containers(self):
+        from dynamo_db_resource._number_types_in_objects import (
+            object_with_decimal_to_float,
+        )
+
+        converted = object_with_decimal_to_float(
+            {
+                "matrix": [[Decimal("1.5"), Decimal("2")], (Decimal("3"),)],
+                "number_set": {Decimal("1"), Decimal("2.5")},
+                "string_set": {"a", "b"},
+            }
+        )
+        self.assertEqual(
+            {
+                "matrix": [[1.5, 2], [3]],
+                "number_set": {1, 2.5},
+                "string_set": {"a", "b"},
+            },
+            converted,
+        )
+        self.assertIsInstance(converted["matrix"][0][1], int)
+
+    def test_decimal_to_float_numbers(self):
+        from dynamo_db_resource._number_types_in_objects import (
+            object_with_decimal_to_float,
+        )
+
+        big = 2 ** 53 + 1
+        self.assertEqual(big, object_with_decimal_to_float(Decimal(big)))
+        self.assertIsInstance(object_with_decimal_to_float(Decimal("7.0")), int)
+        self.assertIsInstance(object_with_decimal_to_float(Decimal("7.25")), float)
+        self.assertEqual(
+            [-3, 0.125], object_with_decimal_to_float([Decimal(-3), Decimal("0.125")])
+        )
@@ -44,3 +44,30 @@ def test_resource_config_cloud(os_env):
     config = create_resource_config(os_environ["AWS_REGION"])
 
     assert config == {"region_name": os_environ["AWS_REGION"]}
+
+
+def test_resource_config_connection_settings(os_env):
+    from dynamo_db_resource.resource_config import create_resource_config
+
+    config = create_resource_config(
+        os_environ["AWS_REGION"],
+        max_pool_connections=50,
+        retry_mode="adaptive",
+        max_attempts=5,
+        connect_timeout=2,
+        read_timeout=3,
+        tcp_keepalive=True,
+    )
+
+    assert config["region_name"] == os_environ["AWS_REGION"]
+    assert config["config"].max_pool_connections == 50
+    assert config["config"].retries == {"mode": "adaptive", "max_attempts": 5}
+    assert config["config"].connect_timeout == 2
+    assert config["config"].read_timeout == 3
+    assert config["config"].tcp_keepalive is True
+
+
+def test_resource_config_memory(os_env):
+    from dynamo_db_resource.resource_config import create_resource_config
+
+    assert create_resource_config("memory") == {"region_name": "memory"}
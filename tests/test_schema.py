@@ -1,4 +1,5 @@
 from pytest import mark, raises
+import json
 from jsonschema import ValidationError
 
 
@@ -60,3 +61,32 @@ def test_ddb_validator(item, raised):
             validator.validate(item)
     else:
         validator.validate(item)
+
+
+def test_schema_validator_loaded_once(tmp_path):
+    from dynamo_db_resource._schema import load_schema_validator
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "primary_partition_key": {"type": "string"},
+            "some_dict": {
+                "type": "object",
+                "properties": {"some_number_set": {"type": "numberSet"}},
+            },
+        },
+    }
+    with open(tmp_path / "SomeTable.json", "w") as f:
+        json.dump(schema, f)
+
+    validator = load_schema_validator("file", str(tmp_path / "SomeTable"))
+    assert validator is load_schema_validator("file", str(tmp_path / "SomeTable"))
+    assert validator.get_sub_schema(["some_dict", "some_number_set"]) == (
+        {"type": "numberSet"},
+        2,
+    )
+
+    validator.validate_sub_part({"some_dict": {"some_number_set": {1, 2}}})
+    with raises(ValidationError) as VE:
+        validator.validate_sub_part({"some_dict": {"some_number_set": {"a"}}})
+    assert list(VE.value.path) == ["some_dict", "some_number_set"]
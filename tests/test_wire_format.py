@@ -0,0 +1,64 @@
+from decimal import Decimal
+from boto3.dynamodb.types import Binary, TypeSerializer
+
+
+def test_deserialize_item_matches_type_serializer_round_trip():
+    from dynamo_db_resource._wire_format import deserialize_item
+
+    item = {
+        "string": "abc",
+        "integer": 42,
+        "float": 13.42,
+        "integral_float": Decimal("7.0"),
+        "large_integer": 2 ** 60 + 1,
+        "boolean": False,
+        "null": None,
+        "binary": b"\x00\x01",
+        "map": {"nested": [1, "two", {"three": Decimal("3.5")}]},
+        "string_set": {"a", "b"},
+        "number_set": {1, Decimal("2.5")},
+        "binary_set": {b"a", b"b"},
+    }
+    serializer = TypeSerializer()
+    wire_item = {
+        key: serializer.serialize(Decimal(str(value)) if key == "float" else value)
+        for key, value in item.items()
+    }
+    # the low-level client sends numbers as text
+    wire_item["integral_float"] = {"N": "7.0"}
+
+    deserialized = deserialize_item(wire_item)
+
+    assert {
+        "string": "abc",
+        "integer": 42,
+        "float": 13.42,
+        "integral_float": 7,
+        "large_integer": 2 ** 60 + 1,
+        "boolean": False,
+        "null": None,
+        "binary": Binary(b"\x00\x01"),
+        "map": {"nested": [1, "two", {"three": 3.5}]},
+        "string_set": {"a", "b"},
+        "number_set": {1, 2.5},
+        "binary_set": {Binary(b"a"), Binary(b"b")},
+    } == deserialized
+    assert isinstance(deserialized["integer"], int)
+    assert isinstance(deserialized["integral_float"], int)
+    assert isinstance(deserialized["float"], float)
+
+
+def test_serialize_request():
+    from dynamo_db_resource._wire_format import serialize_request
+
+    request = {
+        "Key": {"primary_partition_key": "abc"},
+        "ExpressionAttributeValues": {":aa": 1.5},
+        "ProjectionExpression": "#AA",
+    }
+    assert {
+        "Key": {"primary_partition_key": {"S": "abc"}},
+        "ExpressionAttributeValues": {":aa": {"N": "1.5"}},
+        "ProjectionExpression": "#AA",
+    } == serialize_request(request)
+    assert {":aa": 1.5} == request["ExpressionAttributeValues"]